@@ -6,11 +6,18 @@ O AFD é um autômato que reconhece linguagens regulares.
 Para cada estado e símbolo, há exatamente uma transição.
 """
 
-from typing import Dict, Tuple, Set, List
-from automato_base import AutomatoBase
+import hashlib
+import json
+import threading
+from collections import deque
+from types import MappingProxyType
+from typing import Dict, Tuple, Set, FrozenSet, List, Mapping, Optional, Callable
+from automato_base import AutomatoBase, AvaliacaoLote
+from perfilador import Perfilador
+from tabela_transicoes import TabelaTransicoes
 
 
-class AFD(AutomatoBase):
+class AFD(AutomatoBase, AvaliacaoLote):
     """
     Autômato Finito Determinístico
 
@@ -42,6 +49,17 @@ S
         super().__init__(estados, alfabeto, estado_inicial, estados_finais)
         self.transicoes = transicoes
         self._validar()
+        self.compilar()
+
+    def compilar(self):
+        """
+        Calcula os estados vivos (coalcançáveis), usados na rejeição antecipada
+
+        A simulação para assim que entra em um estado a partir do qual
+        nenhum estado final é alcançável. Chamado na construção; chame de
+        novo se `transicoes` ou `estados_finais` forem modificados.
+        """
+        self._vivos: Optional[Set[str]] = self.estados_coalcancaveis()
 
     def _validar(self):
         """Valida a configuração do AFD"""
@@ -60,7 +78,8 @@ S
             if destino not in self.estados:
                 raise ValueError(f"Estado destino '{destino}' não existe")
 
-    def simular(self, cadeia: str) -> Tuple[bool, List[str]]:
+    def simular(self, cadeia: str,
+                perfilador: Optional[Perfilador] = None) -> Tuple[bool, List[str]]:
         """
         Simula a execução do AFD com a cadeia fornecida
 
@@ -69,6 +88,7 @@ S
 
         Args:
             cadeia (str): Cadeia a ser reconhecida
+            perfilador (Perfilador): Coletor opcional de contadores de execução
 
         Returns:
             Tuple[bool, List[str]]: (cadeia_aceita, historico)
@@ -79,42 +99,306 @@ S
             >>> if aceita:
             ...     print("Cadeia aceita!")
         """
-        self.reset_historico()
+        historico = []
         estado_atual = self.estado_inicial
+        vivos = self._vivos
 
         # Registrar estado inicial
-        self.historico.append(f"Estado inicial: {estado_atual}")
+        historico.append(f"Estado inicial: {estado_atual}")
+        if perfilador is not None:
+            perfilador.iniciar_execucao()
+            perfilador.registrar_estado(estado_atual)
+        if vivos is not None and estado_atual not in vivos:
+            historico.append(f" Cadeia REJEITADA - Nenhum estado final é alcançável a partir de {estado_atual}")
+            return False, historico
 
         # Processar cada símbolo da cadeia
-        for i, simbolo in enumerate(cadeia):
+        for i, simbolo in enumerate(self._simbolos(cadeia)):
             # Validar se o símbolo está no alfabeto
             if simbolo not in self.alfabeto:
-                self.historico.append(f"\n Erro: Símbolo '{simbolo}' não está no alfabeto")
-                self.historico.append(f"Alfabeto válido: {self.alfabeto}")
-                return False, self.historico
+                historico.append(f"\n Erro: Símbolo '{simbolo}' não está no alfabeto")
+                historico.append(f"Alfabeto válido: {self.alfabeto}")
+                return False, historico
 
             # Procurar a transição
-            chave = (estado_atual, simbolo)
-            if chave not in self.transicoes:
-                self.historico.append(f"\nPasso {i + 1}: δ({estado_atual}, '{simbolo}') = indefinida")
-                self.historico.append(f" Cadeia REJEITADA - Transição não definida para '{simbolo}'")
-                return False, self.historico
+            proximo_estado = self._proximo(estado_atual, simbolo)
+            if proximo_estado is None:
+                historico.append(f"\nPasso {i + 1}: δ({estado_atual}, '{simbolo}') = indefinida")
+                historico.append(f" Cadeia REJEITADA - Transição não definida para '{simbolo}'")
+                return False, historico
 
             # Executar transição
-            proximo_estado = self.transicoes[chave]
-            self.historico.append(f"Passo {i + 1}: δ({estado_atual}, '{simbolo}') = {proximo_estado}")
+            historico.append(f"Passo {i + 1}: δ({estado_atual}, '{simbolo}') = {proximo_estado}")
+            if perfilador is not None:
+                perfilador.registrar_transicao((estado_atual, simbolo))
+                perfilador.registrar_estado(proximo_estado)
             estado_atual = proximo_estado
 
+            # Rejeição antecipada: o resto da cadeia não precisa ser lido
+            if vivos is not None and estado_atual not in vivos:
+                historico.append(f" Cadeia REJEITADA - Nenhum estado final é alcançável a partir de {estado_atual}")
+                return False, historico
+
         # Verificar se terminou em estado final
-        self.historico.append(f"\nEstado final alcançado: {estado_atual}")
-        aceita = estado_atual in self.estados_finais
+        historico.append(f"\nEstado final alcançado: {estado_atual}")
+        aceita = self._configuracao_aceita(estado_atual)
 
         if aceita:
-            self.historico.append("Resultado: CADEIA ACEITA")
+            historico.append("Resultado: CADEIA ACEITA")
         else:
-            self.historico.append("Resultado: CADEIA REJEITADA")
+            historico.append("Resultado: CADEIA REJEITADA")
+
+        return aceita, historico
+
+    def _proximo(self, estado: str, simbolo: str) -> Optional[str]:
+        """Retorna δ(estado, símbolo), ou None se a transição não estiver definida"""
+        return self.transicoes.get((estado, simbolo))
+
+    def _configuracao_inicial(self) -> str:
+        """Configuração do AFD: apenas o estado atual"""
+        return self.estado_inicial
+
+    def _avancar(self, estado: str, simbolo: str) -> Optional[str]:
+        """Executa uma transição; None se indefinida, símbolo fora do alfabeto ou destino morto"""
+        if simbolo not in self.alfabeto:
+            return None
+        destino = self._proximo(estado, simbolo)
+        if destino is not None and self._vivos is not None and destino not in self._vivos:
+            return None
+        return destino
+
+    def _arestas(self):
+        return ((estado, destino) for (estado, _), destino in self.transicoes.items())
+
+    def podar(self) -> 'AFD':
+        """
+        Retorna um AFD equivalente sem estados inalcançáveis ou mortos
+
+        O estado inicial é sempre mantido (se ele for morto, o resultado
+        não tem transições e reconhece a linguagem vazia).
+
+        Returns:
+            AFD: Autômato com apenas os estados úteis
+        """
+        uteis = self.estados_uteis() | {self.estado_inicial}
+        transicoes = {chave: destino for chave, destino in self.transicoes.items()
+                      if chave[0] in uteis and destino in uteis}
+        return AFD(uteis, set(self.alfabeto), transicoes, self.estado_inicial,
+                   self.estados_finais & uteis)
+
+    def _configuracao_aceita(self, estado: str) -> bool:
+        """Indica se o estado é final"""
+        return estado in self.estados_finais
+
+    def _assinatura(self) -> str:
+        """Hash SHA-256 da definição formal do AFD"""
+        definicao = [sorted(self.estados), sorted(self.alfabeto), self.estado_inicial,
+                     sorted(self.estados_finais),
+                     sorted([list(chave), destino] for chave, destino in self.transicoes.items())]
+        texto = json.dumps(definicao, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+    def compilar_tabela(self, limiar_densidade: float = 0.25) -> TabelaTransicoes:
+        """
+        Gera a tabela de transições compacta do AFD
+
+        Os estados recebem índices na ordem alfabética dos nomes e os
+        símbolos são agrupados em classes de equivalência (ver
+        tabela_transicoes.py). Transições para estados mortos são omitidas,
+        de modo que a tabela rejeita assim que a cadeia entra em um deles.
+        A tabela é independente do AFD: alterações posteriores em
+        `transicoes` não são refletidas nela.
+
+        Args:
+            limiar_densidade: Densidade mínima para usar a tabela densa
+
+        Returns:
+            TabelaTransicoes: Tabela com estados e valores inteiros
+        """
+        nomes = sorted(self.estados)
+        indice = {estado: i for i, estado in enumerate(nomes)}
+        linhas: List[Dict[str, int]] = [{} for _ in nomes]
+        for (estado, simbolo), destino in self.transicoes.items():
+            if destino in self._vivos:
+                linhas[indice[estado]][simbolo] = indice[destino]
+        return TabelaTransicoes(linhas, self.alfabeto, nomes, indice[self.estado_inicial],
+                                {indice[estado] for estado in self.estados_finais},
+                                limiar_densidade=limiar_densidade)
+
+    def intersecao(self, *outros: 'AFD') -> 'ProdutoAFD':
+        """
+        Autômato produto que aceita L(self) ∩ L(outro1) ∩ ...
+
+        O produto é construído sob demanda (ver ProdutoAFD).
+        """
+        return ProdutoAFD([self, *outros], all, "∩")
+
+    def uniao(self, *outros: 'AFD') -> 'ProdutoAFD':
+        """Autômato produto (sob demanda) que aceita L(self) ∪ L(outro1) ∪ ..."""
+        return ProdutoAFD([self, *outros], any, "∪")
+
+    def diferenca(self, outro: 'AFD') -> 'ProdutoAFD':
+        """Autômato produto (sob demanda) que aceita L(self) − L(outro)"""
+        return ProdutoAFD([self, outro], lambda aceitas: aceitas[0] and not aceitas[1], "−")
+
+    def complemento(self) -> 'ProdutoAFD':
+        """
+        Autômato (sob demanda) que aceita Σ* − L(self)
+
+        Transições indefinidas passam a levar a um estado morto implícito,
+        que é de aceitação no complemento.
+        """
+        return ProdutoAFD([self], lambda aceitas: not aceitas[0], "¬")
+
+    def equivalente(self, outro: 'AFD') -> Tuple[bool, Optional[str]]:
+        """
+        Verifica se os dois AFDs reconhecem a mesma linguagem
+
+        Usa o algoritmo de Hopcroft-Karp: pares de estados são unidos em uma
+        estrutura union-find e só pares ainda não unidos são explorados, o
+        que dá tempo quase linear no número de estados. Se as linguagens
+        diferem, uma busca em largura no produto fornece o menor contraexemplo.
+
+        Args:
+            outro: AFD a comparar
+
+        Returns:
+            Tuple[bool, Optional[str]]: (equivalentes, contraexemplo). O
+            contraexemplo é uma cadeia de tamanho mínimo aceita por apenas um
+            dos autômatos, ou None se forem equivalentes.
+        """
+        simbolos = sorted(self.alfabeto | outro.alfabeto)
+        pai: Dict[Tuple[int, Optional[str]], Tuple[int, Optional[str]]] = {}
+
+        def raiz(no):
+            caminho = []
+            while pai.get(no, no) != no:
+                caminho.append(no)
+                no = pai[no]
+            for visitado in caminho:
+                pai[visitado] = no
+            return no
+
+        inicial = (self.estado_inicial, outro.estado_inicial)
+        pai[(0, inicial[0])] = (1, inicial[1])
+        fila = deque([inicial])
+        while fila:
+            p, q = fila.popleft()
+            if _aceita(self, p) != _aceita(outro, q):
+                return False, self._menor_distincao(outro, simbolos)
+            for simbolo in simbolos:
+                proximo = (_passo(self, p, simbolo), _passo(outro, q, simbolo))
+                r1, r2 = raiz((0, proximo[0])), raiz((1, proximo[1]))
+                if r1 != r2:
+                    pai[r1] = r2
+                    fila.append(proximo)
+
+        return True, None
+
+    def _menor_distincao(self, outro: 'AFD', simbolos: List[str]) -> Optional[str]:
+        """Busca em largura no produto pela menor cadeia que distingue os AFDs"""
+        inicial = (self.estado_inicial, outro.estado_inicial)
+        anteriores = {inicial: None}
+        fila = deque([inicial])
+        while fila:
+            par = fila.popleft()
+            if _aceita(self, par[0]) != _aceita(outro, par[1]):
+                simbolos_caminho = []
+                while anteriores[par] is not None:
+                    par, simbolo = anteriores[par]
+                    simbolos_caminho.append(simbolo)
+                return "".join(reversed(simbolos_caminho))
+            for simbolo in simbolos:
+                proximo = (_passo(self, par[0], simbolo), _passo(outro, par[1], simbolo))
+                if proximo not in anteriores:
+                    anteriores[proximo] = (par, simbolo)
+                    fila.append(proximo)
+        return None
+
+    def minimizar(self) -> 'AFD':
+        """
+        Retorna o AFD mínimo equivalente (algoritmo de Hopcroft)
+
+        Considera apenas os estados alcançáveis. Transições indefinidas são
+        tratadas como indo para um estado morto implícito, que é removido
+        do resultado junto com os demais estados mortos. Os estados do AFD
+        mínimo são renomeados q0, q1, ... em ordem de busca em largura.
+
+        Returns:
+            AFD: Autômato mínimo equivalente
+        """
+        simbolos = sorted(self.alfabeto)
+
+        # Estados alcançáveis, com None representando o estado morto implícito
+        alcancaveis = {self.estado_inicial}
+        fila = [self.estado_inicial]
+        while fila:
+            estado = fila.pop()
+            for simbolo in simbolos:
+                destino = self.transicoes.get((estado, simbolo))
+                if destino is not None and destino not in alcancaveis:
+                    alcancaveis.add(destino)
+                    fila.append(destino)
+
+        def delta(estado, simbolo):
+            return None if estado is None else self.transicoes.get((estado, simbolo))
+
+        todos = alcancaveis | {None}
+        inversa: Dict[Tuple[str, Optional[str]], Set[Optional[str]]] = {}
+        for estado in todos:
+            for simbolo in simbolos:
+                inversa.setdefault((simbolo, delta(estado, simbolo)), set()).add(estado)
 
-        return aceita, self.historico
+        finais = frozenset(alcancaveis & self.estados_finais)
+        nao_finais = frozenset(todos - finais)
+        particao = [bloco for bloco in (finais, nao_finais) if bloco]
+        pendentes = [min(particao, key=len)]
+
+        while pendentes:
+            divisor = pendentes.pop()
+            for simbolo in simbolos:
+                anteriores = set()
+                for estado in divisor:
+                    anteriores |= inversa.get((simbolo, estado), set())
+                if not anteriores:
+                    continue
+
+                nova_particao = []
+                for bloco in particao:
+                    dentro = bloco & anteriores
+                    fora = bloco - anteriores
+                    if dentro and fora:
+                        nova_particao += [dentro, fora]
+                        if bloco in pendentes:
+                            pendentes.remove(bloco)
+                            pendentes += [dentro, fora]
+                        else:
+                            pendentes.append(min(dentro, fora, key=len))
+                    else:
+                        nova_particao.append(bloco)
+                particao = nova_particao
+
+        bloco_de = {estado: bloco for bloco in particao for estado in bloco}
+        morto = bloco_de[None]
+
+        # Renomear em ordem de busca em largura a partir do bloco inicial
+        inicial = bloco_de[self.estado_inicial]
+        nomes = {inicial: "q0"}
+        ordem = [inicial]
+        transicoes: Dict[Tuple[str, str], str] = {}
+        for bloco in ordem:
+            representante = next(iter(bloco))
+            for simbolo in simbolos:
+                destino = bloco_de[delta(representante, simbolo)]
+                if destino is morto:
+                    continue
+                if destino not in nomes:
+                    nomes[destino] = f"q{len(nomes)}"
+                    ordem.append(destino)
+                transicoes[(nomes[bloco], simbolo)] = nomes[destino]
+
+        estados_finais = {nomes[b] for b in ordem if b & finais}
+        return AFD(set(nomes.values()), set(self.alfabeto), transicoes, "q0", estados_finais)
 
     def __str__(self) -> str:
         """Representação em string do AFD"""
@@ -123,4 +407,213 @@ S
                 f"Alfabeto: {self.alfabeto}\n"
                 f"Estado inicial: {self.estado_inicial}\n"
                 f"Estados finais: {self.estados_finais}\n"
-                f"Número de transições: {len(self.transicoes)}")
\ No newline at end of file
+                f"Número de transições: {len(self.transicoes)}")
+
+
+def _aceita(afd: AFD, estado: Optional[str]) -> bool:
+    """Aceitação de um estado, com None representando o estado morto implícito"""
+    return estado is not None and afd._configuracao_aceita(estado)
+
+
+def _escapar(nome: str) -> str:
+    """Nome de um estado componente dentro do nome de um estado do produto"""
+    if nome == "∅":
+        return "\\∅"
+    return nome.replace("\\", "\\\\").replace(",", "\\,")
+
+
+def _passo(afd: AFD, estado: Optional[str], simbolo: str) -> Optional[str]:
+    """δ(estado, símbolo) tratando transições indefinidas como o estado morto (None)"""
+    if estado is None or simbolo not in afd.alfabeto:
+        return None
+    return afd._proximo(estado, simbolo)
+
+
+class ProdutoAFD(AFD):
+    """
+    Autômato produto construído sob demanda (avaliação preguiçosa)
+
+    Cada estado do produto é uma tupla com um estado de cada componente
+    (None representa o estado morto implícito de um componente parcial).
+    Um estado do produto é de aceitação quando `aceitacao` aplicada à tupla
+    de aceitações dos componentes retorna True. Só os estados e transições
+    efetivamente percorridos são materializados, e a verificação de uma
+    cadeia contra k autômatos é feita em uma única passada.
+
+    A materialização altera as estruturas internas sob uma trava, de modo
+    que o produto pode ser simulado por várias threads. `estados`,
+    `transicoes` e `estados_finais` são cópias imutáveis do que já foi
+    materializado, refeitas apenas quando algo novo é materializado, e
+    podem ser percorridas sem a trava.
+
+    Atributos:
+        componentes (List[AFD]): Autômatos combinados
+        operacao (str): Símbolo da operação, usado na representação textual
+    """
+
+    def __init__(self, componentes: List[AFD],
+                 aceitacao: Callable[[Tuple[bool, ...]], bool], operacao: str):
+        """
+        Inicializa o produto materializando apenas o estado inicial
+
+        Args:
+            componentes: AFDs combinados (podem ser outros produtos)
+            aceitacao: Função que decide a aceitação a partir das aceitações dos componentes
+            operacao: Símbolo da operação (∩, ∪, −, ¬)
+        """
+        alfabeto = set()
+        for componente in componentes:
+            alfabeto |= componente.alfabeto
+
+        self.componentes = componentes
+        self.operacao = operacao
+        self._aceitacao = aceitacao
+        self._tuplas: Dict[str, Tuple[Optional[str], ...]] = {}
+        self._nomes: Dict[Tuple[Optional[str], ...], str] = {}
+        # Protege a materialização quando o produto é simulado por várias threads
+        self._trava = threading.RLock()
+        # Cópias imutáveis expostas em estados, transicoes e estados_finais
+        self._copias: Dict[str, object] = {}
+        # Os estados vivos só seriam conhecidos materializando o produto
+        self._vivos = None
+
+        inicial = tuple(c.estado_inicial for c in componentes)
+        AutomatoBase.__init__(self, set(), alfabeto, self._nome(inicial), set())
+        self.transicoes = {}
+        self._registrar(inicial)
+
+    def _copia(self, nome: str, copiar: Callable):
+        """Cópia imutável de uma estrutura interna, refeita após cada mudança"""
+        with self._trava:
+            copia = self._copias.get(nome)
+            if copia is None:
+                copia = self._copias[nome] = copiar(getattr(self, "_" + nome))
+            return copia
+
+    def _substituir(self, nome: str, valor):
+        with self._trava:
+            setattr(self, "_" + nome, valor)
+            self._copias.pop(nome, None)
+
+    @property
+    def estados(self) -> FrozenSet[str]:
+        """Estados materializados até agora"""
+        return self._copia("estados", frozenset)
+
+    @estados.setter
+    def estados(self, estados: Set[str]):
+        self._substituir("estados", set(estados))
+
+    @property
+    def estados_finais(self) -> FrozenSet[str]:
+        """Estados de aceitação materializados até agora"""
+        return self._copia("estados_finais", frozenset)
+
+    @estados_finais.setter
+    def estados_finais(self, estados_finais: Set[str]):
+        self._substituir("estados_finais", set(estados_finais))
+
+    @property
+    def transicoes(self) -> Mapping[Tuple[str, str], str]:
+        """Transições materializadas até agora"""
+        return self._copia("transicoes", lambda transicoes: MappingProxyType(dict(transicoes)))
+
+    @transicoes.setter
+    def transicoes(self, transicoes: Dict[Tuple[str, str], str]):
+        self._substituir("transicoes", dict(transicoes))
+
+    @staticmethod
+    def _nome(tupla: Tuple[Optional[str], ...]) -> str:
+        """
+        Nome do estado do produto: "(q1,q2,...)", com ∅ para None
+
+        Vírgulas e barras invertidas nos nomes dos componentes (por exemplo,
+        em produtos aninhados) são escapadas com "\\", assim como um estado
+        chamado "∅", para que tuplas diferentes nunca tenham o mesmo nome.
+        """
+        return "(" + ",".join("∅" if q is None else _escapar(q) for q in tupla) + ")"
+
+    def _registrar(self, tupla: Tuple[Optional[str], ...]) -> str:
+        """Materializa um estado do produto e retorna seu nome (chamado sob a trava)"""
+        nome = self._nomes.get(tupla)
+        if nome is None:
+            nome = self._nome(tupla)
+            self._nomes[tupla] = nome
+            self._tuplas[nome] = tupla
+            self._estados.add(nome)
+            self._copias.pop("estados", None)
+            aceitas = tuple(_aceita(c, q) for q, c in zip(tupla, self.componentes))
+            if self._aceitacao(aceitas):
+                self._estados_finais.add(nome)
+                self._copias.pop("estados_finais", None)
+        return nome
+
+    def _proximo(self, estado: str, simbolo: str) -> Optional[str]:
+        """Retorna δ(estado, símbolo), materializando a transição se necessário"""
+        destino = self._transicoes.get((estado, simbolo))
+        if destino is None and simbolo in self.alfabeto:
+            with self._trava:
+                destino = self._transicoes.get((estado, simbolo))
+                if destino is None:
+                    tupla = tuple(
+                        None if q is None or simbolo not in c.alfabeto else c._proximo(q, simbolo)
+                        for q, c in zip(self._tuplas[estado], self.componentes)
+                    )
+                    destino = self._registrar(tupla)
+                    self._transicoes[(estado, simbolo)] = destino
+                    self._copias.pop("transicoes", None)
+        return destino
+
+    def _configuracao_aceita(self, estado: str) -> bool:
+        """Indica se o estado é final (sem copiar estados_finais)"""
+        return estado in self._estados_finais
+
+    def _assinatura(self) -> str:
+        """Assinatura do produto materializado (as transições são preguiçosas)"""
+        return self.materializar()._assinatura()
+
+    def compilar_tabela(self, limiar_densidade: float = 0.25) -> TabelaTransicoes:
+        """Tabela compacta do produto materializado (ver AFD.compilar_tabela)"""
+        return self.materializar().compilar_tabela(limiar_densidade)
+
+    def _arestas(self):
+        return self.materializar()._arestas()
+
+    def podar(self) -> AFD:
+        """Produto materializado sem estados mortos (ver AFD.podar)"""
+        return self.materializar().podar()
+
+    def materializar(self, minimizar: bool = False) -> AFD:
+        """
+        Constrói explicitamente todos os estados alcançáveis do produto
+
+        Args:
+            minimizar: Se True, retorna o AFD mínimo equivalente
+
+        Returns:
+            AFD: Autômato comum (não preguiçoso) equivalente ao produto
+        """
+        with self._trava:
+            simbolos = sorted(self.alfabeto)
+            fila = [self.estado_inicial]
+            visitados = {self.estado_inicial}
+            while fila:
+                estado = fila.pop()
+                for simbolo in simbolos:
+                    destino = self._proximo(estado, simbolo)
+                    if destino not in visitados:
+                        visitados.add(destino)
+                        fila.append(destino)
+
+            afd = AFD(set(visitados), set(self.alfabeto),
+                      {chave: destino for chave, destino in self._transicoes.items() if chave[0] in visitados},
+                      self.estado_inicial, self._estados_finais & visitados)
+        return afd.minimizar() if minimizar else afd
+
+    def __str__(self) -> str:
+        """Representação em string do produto"""
+        return (f"AFD Produto ({self.operacao}) de {len(self.componentes)} autômato(s)\n"
+                f"Alfabeto: {self.alfabeto}\n"
+                f"Estado inicial: {self.estado_inicial}\n"
+                f"Estados materializados: {len(self._estados)}\n"
+                f"Transições materializadas: {len(self._transicoes)}")
@@ -0,0 +1,185 @@
+"""
+Módulo de compilação de AFD para código Python
+
+Gera o código-fonte de uma função especializada para um AFD, com a tabela
+de transições embutida no próprio código (um ramo por estado, com
+comparações diretas dos símbolos), e o compila uma única vez com
+compile()/exec. A função gerada não consulta atributos do autômato nem o
+dicionário genérico de transições a cada passo.
+
+As funções compiladas ficam em cache, indexadas pelo hash da definição do
+AFD: dois AFDs com a mesma definição compartilham a mesma função. O cache
+é protegido por uma trava e pode ser usado por várias threads.
+"""
+
+import threading
+from collections import deque
+from typing import Callable, Dict, List, Tuple
+
+from afd import AFD, ProdutoAFD
+
+# Acima deste número de estados a cadeia de ifs fica longa demais e o
+# código gerado passa a usar uma lista de dicionários (ainda sem self)
+LIMITE_RAMOS = 32
+# Grupos com mais símbolos que isto são testados com um frozenset
+LIMITE_COMPARACOES = 3
+TAMANHO_CACHE = 256
+
+_cache: Dict[str, Callable[[str], bool]] = {}
+_trava = threading.Lock()
+
+
+def gerar_codigo(afd: AFD) -> str:
+    """
+    Gera o código-fonte da função de reconhecimento do AFD
+
+    Args:
+        afd: Autômato finito determinístico
+
+    Returns:
+        str: Código que define `aceita(cadeia) -> bool`; as constantes
+        usadas pelo código são criadas por _constantes()
+    """
+    if isinstance(afd, ProdutoAFD):
+        afd = afd.materializar()
+    return _codigo(afd, _numerar(afd))
+
+
+def _codigo(afd: AFD, numeracao: Tuple) -> str:
+    """Código de gerar_codigo a partir da numeração já calculada por _numerar"""
+    ordem, indice, saidas = numeracao
+    finais = sorted(indice[estado] for estado in afd.estados_finais if estado in indice)
+
+    linhas = ["def aceita(cadeia):"]
+    if afd._tokenizador is not None:
+        linhas.append("    cadeia = _tokenizar(cadeia)")
+    linhas.append("    estado = 0")
+    linhas.append("    for c in cadeia:")
+
+    if len(ordem) > LIMITE_RAMOS:
+        linhas.append("        estado = _TABELA[estado].get(c)")
+        linhas.append("        if estado is None:")
+        linhas.append("            return False")
+    else:
+        primeiro = True
+        for numero in range(len(ordem)):
+            if not saidas[numero]:
+                continue
+            linhas.append(f"        {'if' if primeiro else 'elif'} estado == {numero}:")
+            primeiro = False
+            grupos = sorted(saidas[numero].items(), key=lambda item: -len(item[1]))
+            for posicao, (destino, simbolos) in enumerate(grupos):
+                palavra = 'if' if posicao == 0 else 'elif'
+                if len(simbolos) > LIMITE_COMPARACOES:
+                    teste = f"c in _GRUPO_{numero}_{destino}"
+                else:
+                    teste = " or ".join(f"c == {simbolo!r}" for simbolo in sorted(simbolos))
+                linhas.append(f"            {palavra} {teste}:")
+                if destino != numero:
+                    linhas.append(f"                estado = {destino}")
+                else:
+                    linhas.append("                pass")
+            linhas.append("            else:")
+            linhas.append("                return False")
+        if primeiro:
+            linhas.append("        return False")
+        else:
+            linhas.append("        else:")
+            linhas.append("            return False")
+
+    if len(finais) <= LIMITE_COMPARACOES:
+        teste = " or ".join(f"estado == {f}" for f in finais) or "False"
+        linhas.append(f"    return {teste}")
+    else:
+        linhas.append("    return estado in _FINAIS")
+    return "\n".join(linhas) + "\n"
+
+
+def compilar_afd(afd: AFD) -> Callable[[str], bool]:
+    """
+    Retorna a função especializada que reconhece L(afd), com cache
+
+    Args:
+        afd: Autômato finito determinístico
+
+    Returns:
+        Callable[[str], bool]: aceita(cadeia) -> True se a cadeia é aceita
+
+    Exemplo:
+        >>> aceita = compilar_afd(afd)
+        >>> aceita("0101")
+        True
+    """
+    if isinstance(afd, ProdutoAFD):
+        afd = afd.materializar()
+    chave = afd._assinatura()
+    with _trava:
+        funcao = _cache.get(chave)
+    if funcao is not None:
+        return funcao
+
+    # Compilado fora da trava; se outra thread compilar o mesmo AFD ao mesmo
+    # tempo, fica a primeira função guardada
+    numeracao = _numerar(afd)
+    ambiente = _constantes(afd, numeracao)
+    exec(compile(_codigo(afd, numeracao), f"<afd {chave[:12]}>", "exec"), ambiente)
+    with _trava:
+        funcao = _cache.get(chave)
+        if funcao is None:
+            funcao = ambiente["aceita"]
+            if len(_cache) >= TAMANHO_CACHE:
+                del _cache[next(iter(_cache))]
+            _cache[chave] = funcao
+    return funcao
+
+
+def _numerar(afd: AFD) -> Tuple[List[str], Dict[str, int], List[Dict[int, List[str]]]]:
+    """
+    Numera os estados alcançáveis em largura a partir do inicial (inicial = 0)
+
+    Transições para estados mortos são descartadas: o código gerado rejeita
+    assim que a cadeia entra em um deles.
+    """
+    por_estado: Dict[str, List] = {}
+    for (estado, simbolo), destino in afd.transicoes.items():
+        if destino in afd._vivos:
+            por_estado.setdefault(estado, []).append((simbolo, destino))
+
+    indice = {afd.estado_inicial: 0}
+    ordem = [afd.estado_inicial]
+    fila = deque(ordem)
+    while fila:
+        estado = fila.popleft()
+        for _, destino in sorted(por_estado.get(estado, ())):
+            if destino not in indice:
+                indice[destino] = len(ordem)
+                ordem.append(destino)
+                fila.append(destino)
+
+    # saidas[n][destino] = símbolos que levam do estado n ao destino
+    saidas: List[Dict[int, List[str]]] = [{} for _ in ordem]
+    for estado in ordem:
+        for simbolo, destino in por_estado.get(estado, ()):
+            saidas[indice[estado]].setdefault(indice[destino], []).append(simbolo)
+    return ordem, indice, saidas
+
+
+def _constantes(afd: AFD, numeracao: Tuple) -> Dict[str, object]:
+    """Constantes referenciadas pelo código gerado (numeração de _numerar)"""
+    ordem, indice, saidas = numeracao
+    ambiente: Dict[str, object] = {
+        "_FINAIS": frozenset(indice[e] for e in afd.estados_finais if e in indice),
+    }
+    if afd._tokenizador is not None:
+        ambiente["_tokenizar"] = afd._tokenizador.tokenizar
+    if len(ordem) > LIMITE_RAMOS:
+        ambiente["_TABELA"] = [
+            {simbolo: destino for destino, simbolos in saidas[n].items() for simbolo in simbolos}
+            for n in range(len(ordem))
+        ]
+    else:
+        for numero, grupos in enumerate(saidas):
+            for destino, simbolos in grupos.items():
+                if len(simbolos) > LIMITE_COMPARACOES:
+                    ambiente[f"_GRUPO_{numero}_{destino}"] = frozenset(simbolos)
+    return ambiente
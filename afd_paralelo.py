@@ -0,0 +1,190 @@
+"""
+Módulo de avaliação paralela de AFD
+
+Divide uma cadeia muito longa em trechos e processa os trechos em paralelo
+(processos separados). Como o estado no início de cada trecho só é
+conhecido depois de processar os anteriores, cada processo calcula a
+função de transição do trecho inteiro: para cada estado de partida, o
+estado em que o AFD termina ao ler o trecho. Compor essas funções na ordem
+dos trechos dá o estado final da cadeia completa.
+
+Em vez de executar o trecho |Q| vezes, as execuções são feitas em conjunto
+e fundidas assim que duas partidas chegam ao mesmo estado; na prática os
+caminhos convergem após poucos símbolos e o restante do trecho é lido uma
+única vez.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from typing import Dict, List, Optional
+
+from afd import AFD, ProdutoAFD
+
+# Tabela do AFD no processo trabalhador (definida pelo inicializador do pool)
+_TABELA: List[Dict[str, int]] = []
+
+
+def _inicializar(tabela: List[Dict[str, int]]):
+    """Recebe a tabela de transições uma única vez por processo"""
+    global _TABELA
+    _TABELA = tabela
+
+
+def _mapear_trecho(trecho: str) -> List[int]:
+    """
+    Calcula a função de transição estendida de um trecho
+
+    Returns:
+        List[int]: mapa[q] = estado após ler o trecho a partir de q (-1 = rejeição)
+    """
+    tabela = _TABELA
+    # estado atual -> estados de partida que chegaram até ele
+    grupos: Dict[int, List[int]] = {q: [q] for q in range(len(tabela))}
+    lidos = 0
+    for simbolo in trecho:
+        if len(grupos) <= 1:
+            break
+        novos: Dict[int, List[int]] = {}
+        for atual, origens in grupos.items():
+            destino = tabela[atual].get(simbolo)
+            if destino is None:
+                continue
+            if destino in novos:
+                novos[destino].extend(origens)
+            else:
+                novos[destino] = origens
+        grupos = novos
+        lidos += 1
+
+    if len(grupos) == 1 and lidos < len(trecho):
+        # Todas as partidas vivas convergiram: um único caminho até o fim
+        (atual, origens), = grupos.items()
+        for simbolo in islice(trecho, lidos, None):
+            atual = tabela[atual].get(simbolo)
+            if atual is None:
+                break
+        grupos = {atual: origens} if atual is not None else {}
+
+    mapa = [-1] * len(tabela)
+    for atual, origens in grupos.items():
+        for origem in origens:
+            mapa[origem] = atual
+    return mapa
+
+
+class AvaliadorParaleloAFD:
+    """
+    Avaliador de cadeias longas em paralelo para um AFD fixo
+
+    O pool de processos e a tabela enviada a cada processo são reaproveitados
+    entre chamadas. Use como gerenciador de contexto ou chame fechar().
+
+    Atributos:
+        afd (AFD): Autômato avaliado
+        processos (int): Número de processos trabalhadores
+        tamanho_minimo (int): Cadeias menores são avaliadas sequencialmente
+    """
+
+    def __init__(self, afd: AFD, processos: Optional[int] = None,
+                 tamanho_minimo: int = 1 << 20):
+        """
+        Args:
+            afd: Autômato a avaliar (um ProdutoAFD é materializado)
+            processos: Número de processos (padrão: número de CPUs)
+            tamanho_minimo: Abaixo deste tamanho não compensa paralelizar
+
+        Raises:
+            ValueError: Se o alfabeto tiver símbolos de vários caracteres (os
+                trechos são cortados e lidos caractere a caractere)
+        """
+        if isinstance(afd, ProdutoAFD):
+            afd = afd.materializar()
+        if afd._tokenizador is not None:
+            raise ValueError("A avaliação paralela exige símbolos de um único caractere")
+        self.afd = afd
+        self.processos = processos or os.cpu_count() or 1
+        self.tamanho_minimo = tamanho_minimo
+
+        self._nomes = sorted(afd.estados)
+        indice = {estado: i for i, estado in enumerate(self._nomes)}
+        self._tabela: List[Dict[str, int]] = [{} for _ in self._nomes]
+        for (estado, simbolo), destino in afd.transicoes.items():
+            self._tabela[indice[estado]][simbolo] = indice[destino]
+        self._inicial = indice[afd.estado_inicial]
+        self._finais = {indice[estado] for estado in afd.estados_finais}
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def aceita(self, cadeia: str) -> bool:
+        """
+        Verifica se o AFD aceita a cadeia
+
+        Args:
+            cadeia: Cadeia de entrada
+
+        Returns:
+            bool: True se a cadeia é aceita
+        """
+        estado = self.estado_final(cadeia)
+        return estado is not None and estado in self.afd.estados_finais
+
+    def estado_final(self, cadeia: str) -> Optional[str]:
+        """
+        Estado alcançado após ler a cadeia inteira
+
+        Returns:
+            Optional[str]: Nome do estado, ou None se alguma transição for indefinida
+        """
+        estado = self._inicial
+        if self.processos == 1 or len(cadeia) < self.tamanho_minimo:
+            for simbolo in cadeia:
+                estado = self._tabela[estado].get(simbolo)
+                if estado is None:
+                    return None
+            return self._nomes[estado]
+
+        # Alguns trechos por processo equilibram a carga entre eles
+        tamanho = -(-len(cadeia) // (self.processos * 4))
+        trechos = (cadeia[i:i + tamanho] for i in range(0, len(cadeia), tamanho))
+        for mapa in self._executor().map(_mapear_trecho, trechos):
+            estado = mapa[estado]
+            if estado < 0:
+                return None
+        return self._nomes[estado]
+
+    def _executor(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(self.processos, initializer=_inicializar,
+                                             initargs=(self._tabela,))
+        return self._pool
+
+    def fechar(self):
+        """Encerra os processos trabalhadores"""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def __enter__(self) -> 'AvaliadorParaleloAFD':
+        return self
+
+    def __exit__(self, *_):
+        self.fechar()
+
+
+def simular_paralelo(afd: AFD, cadeia: str, processos: Optional[int] = None) -> bool:
+    """
+    Verifica a aceitação de uma cadeia longa usando vários processos
+
+    Para várias cadeias com o mesmo AFD, prefira AvaliadorParaleloAFD, que
+    mantém o pool de processos entre chamadas.
+
+    Args:
+        afd: Autômato finito determinístico
+        cadeia: Cadeia de entrada
+        processos: Número de processos (padrão: número de CPUs)
+
+    Returns:
+        bool: True se a cadeia é aceita
+    """
+    with AvaliadorParaleloAFD(afd, processos) as avaliador:
+        return avaliador.aceita(cadeia)
@@ -7,11 +7,17 @@ Para um mesmo (estado, símbolo), pode haver múltiplas transições.
 Também suporta ε-transições (transições vazias).
 """
 
-from typing import Dict, Tuple, Set, Optional, List
-from automato_base import AutomatoBase
+import hashlib
+import json
+from collections import deque
+from typing import Dict, Tuple, Set, Optional, List, FrozenSet
+from automato_base import AutomatoBase, AvaliacaoLote
+from afd import AFD
+from perfilador import Perfilador
+from tabela_transicoes import TabelaTransicoes
 
 
-class AFN(AutomatoBase):
+class AFN(AutomatoBase, AvaliacaoLote):
     """
     Autômato Finito Não-Determinístico
 
@@ -40,10 +46,120 @@ class AFN(AutomatoBase):
         """
         super().__init__(estados, alfabeto, estado_inicial, estados_finais)
         self.transicoes = transicoes
+        self.compilar()
+
+    def compilar(self):
+        """
+        Constrói os índices usados na simulação
+
+        Calcula uma única vez o ε-fecho de todos os estados e dois índices
+        de sucessores estado -> {símbolo: destinos}, com os destinos já
+        fechados por ε. Os fechos e `_sucessores_completos` têm todos os
+        estados e são usados pelo simular, cujo histórico mostra os
+        conjuntos reais; em `_sucessores`, usado pelos caminhos rápidos,
+        estados mortos (a partir dos quais nenhum estado final é alcançável)
+        são retirados, o que reduz os conjuntos e faz a cadeia ser rejeitada
+        assim que restarem apenas estados mortos. Chamado na construção;
+        chame de novo se `transicoes` ou `estados_finais` forem modificados.
+        """
+        self._vivos = self.estados_coalcancaveis()
+        self._fechos = self._calcular_fechos()
+        self._sucessores_completos: Dict[str, Dict[str, FrozenSet[str]]] = {}
+        self._sucessores: Dict[str, Dict[str, FrozenSet[str]]] = {}
+
+        for (estado, simbolo), destinos in self.transicoes.items():
+            if simbolo is None:
+                continue
+            fechados = set()
+            for destino in destinos:
+                fechados |= self._fechos[destino]
+            self._sucessores_completos.setdefault(estado, {})[simbolo] = frozenset(fechados)
+            if estado in self._vivos:
+                fechados &= self._vivos
+                if fechados:
+                    self._sucessores.setdefault(estado, {})[simbolo] = frozenset(fechados)
+
+    def _calcular_fechos(self) -> Dict[str, FrozenSet[str]]:
+        """
+        Calcula o ε-fecho de todos os estados via componentes fortemente conexas
+
+        Usa o algoritmo de Tarjan (versão iterativa) sobre o grafo das
+        ε-transições. Todos os estados de uma mesma componente compartilham
+        o mesmo frozenset, e como as componentes saem em ordem topológica
+        reversa, o fecho de cada uma é a união dos fechos já calculados das
+        componentes sucessoras.
+
+        Returns:
+            Dict[str, FrozenSet[str]]: estado -> ε-fecho
+        """
+        vertices = set(self.estados)
+        epsilon: Dict[str, Set[str]] = {}
+        for (estado, simbolo), destinos in self.transicoes.items():
+            vertices.add(estado)
+            vertices |= destinos
+            if simbolo is None:
+                epsilon[estado] = destinos
+
+        fechos: Dict[str, FrozenSet[str]] = {}
+        indice: Dict[str, int] = {}
+        menor: Dict[str, int] = {}
+        pilha: List[str] = []
+        na_pilha: Set[str] = set()
+
+        for raiz in vertices:
+            if raiz in indice:
+                continue
+
+            indice[raiz] = menor[raiz] = len(indice)
+            pilha.append(raiz)
+            na_pilha.add(raiz)
+            trabalho = [(raiz, iter(epsilon.get(raiz, ())))]
+
+            while trabalho:
+                estado, vizinhos = trabalho[-1]
+                desceu = False
+                for proximo in vizinhos:
+                    if proximo not in indice:
+                        indice[proximo] = menor[proximo] = len(indice)
+                        pilha.append(proximo)
+                        na_pilha.add(proximo)
+                        trabalho.append((proximo, iter(epsilon.get(proximo, ()))))
+                        desceu = True
+                        break
+                    if proximo in na_pilha:
+                        menor[estado] = min(menor[estado], indice[proximo])
+                if desceu:
+                    continue
+
+                trabalho.pop()
+                if trabalho:
+                    pai = trabalho[-1][0]
+                    menor[pai] = min(menor[pai], menor[estado])
+
+                if menor[estado] == indice[estado]:
+                    componente = []
+                    while True:
+                        membro = pilha.pop()
+                        na_pilha.discard(membro)
+                        componente.append(membro)
+                        if membro == estado:
+                            break
+
+                    alcancaveis = set(componente)
+                    for membro in componente:
+                        for proximo in epsilon.get(membro, ()):
+                            if proximo not in alcancaveis:
+                                alcancaveis |= fechos[proximo]
+
+                    fecho = frozenset(alcancaveis)
+                    for membro in componente:
+                        fechos[membro] = fecho
+
+        return fechos
 
     def _epsilon_fecho(self, estado_atual: str) -> Set[str]:
         """
-        Calcula o ε-fecho de um estado
+        Retorna o ε-fecho de um estado
 
         O ε-fecho de um estado é o conjunto de todos os estados
         alcançáveis a partir dele seguindo apenas ε-transições.
@@ -54,20 +170,7 @@ class AFN(AutomatoBase):
         Returns:
             Set[str]: Conjunto de estados no ε-fecho
         """
-        fecho = {estado_atual}
-        pilha = [estado_atual]
-
-        while pilha:
-            estado = pilha.pop()
-            chave = (estado, None)  # None representa ε
-
-            if chave in self.transicoes:
-                for proximo in self.transicoes[chave]:
-                    if proximo not in fecho:
-                        fecho.add(proximo)
-                        pilha.append(proximo)
-
-        return fecho
+        return set(self._fechos.get(estado_atual, (estado_atual,)))
 
     def _epsilon_fecho_conjunto(self, estados: Set[str]) -> Set[str]:
         """
@@ -81,10 +184,11 @@ class AFN(AutomatoBase):
         """
         fecho = set()
         for estado in estados:
-            fecho |= self._epsilon_fecho(estado)
+            fecho |= self._fechos.get(estado, (estado,))
         return fecho
 
-    def simular(self, cadeia: str) -> Tuple[bool, List[str]]:
+    def simular(self, cadeia: str,
+                perfilador: Optional[Perfilador] = None) -> Tuple[bool, List[str]]:
         """
         Simula a execução do AFN com a cadeia fornecida
 
@@ -94,6 +198,7 @@ class AFN(AutomatoBase):
 
         Args:
             cadeia (str): Cadeia a ser reconhecida
+            perfilador (Perfilador): Coletor opcional de contadores de execução
 
         Returns:
             Tuple[bool, List[str]]: (cadeia_aceita, historico)
@@ -104,49 +209,246 @@ class AFN(AutomatoBase):
             >>> if aceita:
             ...     print("Cadeia aceita por algum caminho!")
         """
-        self.reset_historico()
+        historico = []
 
         # Calcular estados iniciais considerando ε-transições
         estados_atuais = self._epsilon_fecho(self.estado_inicial)
-        self.historico.append(f"Estados iniciais (com ε-fecho): {estados_atuais}")
+        historico.append(f"Estados iniciais (com ε-fecho): {estados_atuais}")
+        if perfilador is not None:
+            perfilador.iniciar_execucao()
+            perfilador.registrar_fecho(len(estados_atuais))
+            for estado in estados_atuais:
+                perfilador.registrar_estado(estado)
+                if (estado, None) in self.transicoes:
+                    perfilador.registrar_epsilon((estado, None))
+        if estados_atuais.isdisjoint(self._vivos):
+            historico.append(f" Cadeia REJEITADA - Nenhum estado final é alcançável a partir de {self.estado_inicial}")
+            return False, historico
 
         # Processar cada símbolo da cadeia
-        for i, simbolo in enumerate(cadeia):
+        for i, simbolo in enumerate(self._simbolos(cadeia)):
             # Validar se o símbolo está no alfabeto
             if simbolo not in self.alfabeto:
-                self.historico.append(f"\n Erro: Símbolo '{simbolo}' não está no alfabeto")
-                return False, self.historico
+                historico.append(f"\n Erro: Símbolo '{simbolo}' não está no alfabeto")
+                return False, historico
 
-            # Encontrar todos os próximos estados possíveis
+            # Encontrar todos os próximos estados possíveis (já com ε-fecho)
             proximos_estados = set()
             for estado in estados_atuais:
-                chave = (estado, simbolo)
-                if chave in self.transicoes:
-                    proximos_estados |= self.transicoes[chave]
+                destinos = self._sucessores_completos.get(estado, {}).get(simbolo)
+                if destinos is not None:
+                    proximos_estados |= destinos
+                    if perfilador is not None:
+                        perfilador.registrar_transicao((estado, simbolo))
 
             # Se não há próximos estados, rejeita
             if not proximos_estados:
-                self.historico.append(
+                historico.append(
                     f"\nPasso {i + 1}: Nenhuma transição para '{simbolo}' a partir de {estados_atuais}")
-                self.historico.append("Cadeia REJEITADA")
-                return False, self.historico
-
-            # Aplicar ε-fecho ao conjunto de próximos estados
-            estados_atuais = self._epsilon_fecho_conjunto(proximos_estados)
-            self.historico.append(f"Passo {i + 1}: '{simbolo}' → {estados_atuais}")
+                historico.append("Cadeia REJEITADA")
+                return False, historico
+
+            estados_atuais = proximos_estados
+            historico.append(f"Passo {i + 1}: '{simbolo}' → {estados_atuais}")
+            if estados_atuais.isdisjoint(self._vivos):
+                historico.append(
+                    f" Cadeia REJEITADA - Nenhum estado final é alcançável a partir de {estados_atuais}")
+                return False, historico
+            if perfilador is not None:
+                perfilador.registrar_fecho(len(estados_atuais))
+                for estado in estados_atuais:
+                    perfilador.registrar_estado(estado)
+                    if (estado, None) in self.transicoes:
+                        perfilador.registrar_epsilon((estado, None))
 
         # Verificar se algum estado atual é final
         estados_finais_alcancados = estados_atuais & self.estados_finais
-        self.historico.append(f"\nEstados finais alcançados: {estados_finais_alcancados}")
+        historico.append(f"\nEstados finais alcançados: {estados_finais_alcancados}")
 
         aceita = bool(estados_finais_alcancados)
 
         if aceita:
-            self.historico.append("Resultado: CADEIA ACEITA")
+            historico.append("Resultado: CADEIA ACEITA")
         else:
-            self.historico.append("Resultado: CADEIA REJEITADA")
+            historico.append("Resultado: CADEIA REJEITADA")
+
+        return aceita, historico
+
+    def _configuracao_inicial(self) -> FrozenSet[str]:
+        """Configuração do AFN: ε-fecho do estado inicial, só com estados vivos"""
+        return frozenset(self._fechos.get(self.estado_inicial, (self.estado_inicial,))) & self._vivos
+
+    def _avancar(self, estados: FrozenSet[str], simbolo: str) -> Optional[FrozenSet[str]]:
+        """Conjunto (já ε-fechado) de estados após ler `simbolo`; None se vazio"""
+        proximos = set()
+        for estado in estados:
+            proximos |= self._sucessores.get(estado, {}).get(simbolo, frozenset())
+        return frozenset(proximos) if proximos else None
+
+    def _configuracao_aceita(self, estados: FrozenSet[str]) -> bool:
+        """Indica se algum dos estados é final"""
+        return not estados.isdisjoint(self.estados_finais)
+
+    def _arestas(self):
+        return ((estado, destino) for (estado, _), destinos in self.transicoes.items()
+                for destino in destinos)
+
+    def podar(self) -> 'AFN':
+        """
+        Retorna um AFN equivalente sem estados inalcançáveis ou mortos
+
+        O estado inicial é sempre mantido. Transições (inclusive ε) que
+        saem de ou chegam a estados inúteis são removidas.
+
+        Returns:
+            AFN: Autômato com apenas os estados úteis
+        """
+        uteis = self.estados_uteis() | {self.estado_inicial}
+        transicoes = {}
+        for (estado, simbolo), destinos in self.transicoes.items():
+            restantes = destinos & uteis
+            if estado in uteis and restantes:
+                transicoes[(estado, simbolo)] = restantes
+        return AFN(uteis, set(self.alfabeto), transicoes, self.estado_inicial,
+                   self.estados_finais & uteis)
+
+    def _assinatura(self) -> str:
+        """Hash SHA-256 da definição formal do AFN"""
+        transicoes = sorted(json.dumps([estado, simbolo, sorted(destinos)], ensure_ascii=False)
+                            for (estado, simbolo), destinos in self.transicoes.items())
+        definicao = [sorted(self.estados), sorted(self.alfabeto), self.estado_inicial,
+                     sorted(self.estados_finais), transicoes]
+        texto = json.dumps(definicao, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+    def compilar_tabela(self, limiar_densidade: float = 0.25) -> TabelaTransicoes:
+        """
+        Gera a tabela de transições compacta do AFN
 
-        return aceita, self.historico
+        Cada célula aponta para um conjunto de destinos já fechado por ε;
+        conjuntos iguais são armazenados uma única vez em `conjuntos`.
+
+        Args:
+            limiar_densidade: Densidade mínima para usar a tabela densa
+
+        Returns:
+            TabelaTransicoes: Tabela com estados e conjuntos inteiros
+        """
+        nomes = sorted(self._fechos)
+        indice = {estado: i for i, estado in enumerate(nomes)}
+        conjuntos: List[FrozenSet[int]] = []
+        ids_conjuntos: Dict[FrozenSet[str], int] = {}
+
+        def registrar(destinos: FrozenSet[str]) -> int:
+            if destinos not in ids_conjuntos:
+                ids_conjuntos[destinos] = len(conjuntos)
+                conjuntos.append(frozenset(indice[estado] for estado in destinos))
+            return ids_conjuntos[destinos]
+
+        inicial = registrar(self._configuracao_inicial())
+        linhas: List[Dict[str, int]] = [{} for _ in nomes]
+        for estado, por_simbolo in self._sucessores.items():
+            for simbolo, destinos in por_simbolo.items():
+                linhas[indice[estado]][simbolo] = registrar(destinos)
+        return TabelaTransicoes(linhas, self.alfabeto, nomes, inicial,
+                                {indice[estado] for estado in self.estados_finais if estado in indice},
+                                conjuntos=conjuntos, limiar_densidade=limiar_densidade)
+
+    def contido_em(self, outro: 'AFN') -> Tuple[bool, Optional[str]]:
+        """
+        Verifica se L(self) ⊆ L(outro) sem determinizar os autômatos
+
+        Explora em largura pares (p, S), onde p é um estado deste AFN e S o
+        conjunto de estados do outro AFN alcançados pela mesma cadeia. Com
+        antichains, um par (p, S) é descartado se já existe (p, S') com
+        S' ⊆ S: qualquer contraexemplo a partir de (p, S) também existe a
+        partir de (p, S'), com o mesmo comprimento.
+
+        Args:
+            outro: AFN que deveria conter a linguagem deste
+
+        Returns:
+            Tuple[bool, Optional[str]]: (contido, contraexemplo). O
+            contraexemplo é uma cadeia de tamanho mínimo aceita por este AFN
+            e rejeitada pelo outro, ou None se houver inclusão.
+        """
+        inicial_outro = outro._configuracao_inicial()
+
+        antichain: Dict[str, List[FrozenSet[str]]] = {}
+        anteriores: Dict[Tuple[str, FrozenSet[str]], Optional[Tuple]] = {}
+        fila = deque()
+
+        def visitar(par, anterior):
+            p, conjunto = par
+            minimos = antichain.setdefault(p, [])
+            if any(menor <= conjunto for menor in minimos):
+                return
+            minimos[:] = [m for m in minimos if not conjunto <= m]
+            minimos.append(conjunto)
+            anteriores[par] = anterior
+            fila.append(par)
+
+        for p in self._configuracao_inicial():
+            visitar((p, inicial_outro), None)
+
+        while fila:
+            par = fila.popleft()
+            p, conjunto = par
+            if p in self.estados_finais and not conjunto & outro.estados_finais:
+                simbolos_caminho = []
+                while anteriores[par] is not None:
+                    par, simbolo = anteriores[par]
+                    simbolos_caminho.append(simbolo)
+                return False, "".join(reversed(simbolos_caminho))
+
+            for simbolo, destinos in self._sucessores.get(p, {}).items():
+                proximo_outro = set()
+                for estado in conjunto:
+                    proximo_outro |= outro._sucessores.get(estado, {}).get(simbolo, frozenset())
+                proximo_outro = frozenset(proximo_outro)
+                for destino in destinos:
+                    visitar((destino, proximo_outro), (par, simbolo))
+
+        return True, None
+
+    def para_afd(self) -> AFD:
+        """
+        Converte o AFN em um AFD equivalente (construção de subconjuntos)
+
+        Cada estado do AFD corresponde a um conjunto ε-fechado de estados do
+        AFN e recebe como nome esse conjunto, por exemplo "{q0,q1}". Apenas
+        os subconjuntos alcançáveis são construídos, e o conjunto vazio é
+        omitido (o AFD resultante pode ser parcial).
+
+        Returns:
+            AFD: Autômato determinístico equivalente
+        """
+        def nome(conjunto: FrozenSet[str]) -> str:
+            return "{" + ",".join(sorted(conjunto)) + "}"
+
+        inicial = self._configuracao_inicial()
+        visitados = {inicial}
+        fila = [inicial]
+        transicoes: Dict[Tuple[str, str], str] = {}
+        simbolos = sorted(self.alfabeto)
+
+        while fila:
+            conjunto = fila.pop()
+            for simbolo in simbolos:
+                destino = set()
+                for estado in conjunto:
+                    destino |= self._sucessores.get(estado, {}).get(simbolo, frozenset())
+                if not destino:
+                    continue
+                destino = frozenset(destino)
+                if destino not in visitados:
+                    visitados.add(destino)
+                    fila.append(destino)
+                transicoes[(nome(conjunto), simbolo)] = nome(destino)
+
+        estados = {nome(c) for c in visitados}
+        finais = {nome(c) for c in visitados if c & self.estados_finais}
+        return AFD(estados, set(self.alfabeto), transicoes, nome(inicial), finais)
 
     def __str__(self) -> str:
         """Representação em string do AFN"""
@@ -6,8 +6,13 @@ O APD reconhece linguagens livres de contexto (LLC).
 Combina máquina de estados finitos com uma pilha infinita.
 """
 
-from typing import Dict, Tuple, Set, Optional, List
-from automato_base import AutomatoBase
+import hashlib
+import json
+from collections import deque
+from typing import Dict, Tuple, Set, Optional, List, Sequence, Callable, Iterable
+from automato_base import AutomatoBase, CONFIGURACOES_POR_FATIA, concluir
+from perfilador import Perfilador
+from rastro_execucao import Rastro
 
 
 class APD(AutomatoBase):
@@ -49,94 +54,452 @@ class APD(AutomatoBase):
         self.alfabeto_pilha = alfabeto_pilha
         self.transicoes = transicoes
         self.simbolo_pilha_inicial = simbolo_pilha_inicial
+        self.compilar()
 
-    def simular(self, cadeia: str) -> Tuple[bool, List[str]]:
+    def compilar(self):
+        """
+        Verifica uma única vez se a tabela de transições é determinística
+
+        O APD é determinístico quando cada chave (estado, símbolo|ε, topo)
+        tem no máximo um movimento e, para cada (estado, topo), uma
+        ε-transição exclui transições que leem símbolos. Nesse caso as
+        tabelas com estados e símbolos codificados como inteiros, usadas
+        pelo caminho rápido, são construídas aqui. Chame de novo se
+        `transicoes` for modificado.
+        """
+        self.deterministico = self._verificar_determinismo()
+        if self.deterministico:
+            self._compilar_deterministico()
+
+    def _assinatura(self) -> str:
+        """Hash SHA-256 da definição formal do APD"""
+        transicoes = sorted(json.dumps([list(chave), sorted([destino, list(empilhar)]
+                                                            for destino, empilhar in movimentos)],
+                                       ensure_ascii=False)
+                            for chave, movimentos in self.transicoes.items())
+        definicao = [sorted(self.estados), sorted(self.alfabeto), sorted(self.alfabeto_pilha),
+                     self.estado_inicial, self.simbolo_pilha_inicial, sorted(self.estados_finais),
+                     transicoes]
+        texto = json.dumps(definicao, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+    def _verificar_determinismo(self) -> bool:
+        """Retorna True se nenhuma configuração tem dois movimentos aplicáveis"""
+        simbolos_por_topo: Dict[Tuple[str, Optional[str]], Set[Optional[str]]] = {}
+        for (estado, simbolo, topo), movimentos in self.transicoes.items():
+            if not movimentos:
+                continue
+            if len(movimentos) > 1:
+                return False
+            simbolos_por_topo.setdefault((estado, topo), set()).add(simbolo)
+
+        return all(None not in simbolos or len(simbolos) == 1
+                   for simbolos in simbolos_por_topo.values())
+
+    def _compilar_deterministico(self):
+        """
+        Constrói as tabelas do caminho rápido determinístico
+
+        Estados, símbolos de entrada e símbolos de pilha recebem IDs inteiros.
+        Cada par (estado, topo) vira um índice estado * largura + (topo + 1),
+        onde topo = -1 representa a pilha vazia.
+        """
+        simbolos_pilha = set(self.alfabeto_pilha) | {self.simbolo_pilha_inicial}
+        estados = set(self.estados) | {self.estado_inicial}
+        for (estado, _, topo), movimentos in self.transicoes.items():
+            estados.add(estado)
+            if topo is not None:
+                simbolos_pilha.add(topo)
+            for proximo_estado, operacoes_pilha in movimentos:
+                estados.add(proximo_estado)
+                simbolos_pilha |= set(operacoes_pilha)
+
+        self._nomes_estados = sorted(estados)
+        self._nomes_pilha = sorted(simbolos_pilha)
+        id_estado = {nome: i for i, nome in enumerate(self._nomes_estados)}
+        id_pilha = {nome: i for i, nome in enumerate(self._nomes_pilha)}
+        self._id_entrada = {simbolo: i for i, simbolo in enumerate(sorted(self.alfabeto))}
+        self._id_pilha_inicial = id_pilha[self.simbolo_pilha_inicial]
+        self._id_estado_inicial = id_estado[self.estado_inicial]
+        self._finais = [nome in self.estados_finais for nome in self._nomes_estados]
+
+        self._largura = len(self._nomes_pilha) + 1
+        tamanho = len(self._nomes_estados) * self._largura
+        # Movimento: (novo_estado, ids empilhados, chave original, operações originais)
+        self._mov_epsilon: List[Optional[tuple]] = [None] * tamanho
+        self._mov_leitura: List[Optional[Dict[int, tuple]]] = [None] * tamanho
+
+        for chave, movimentos in self.transicoes.items():
+            if not movimentos:
+                continue
+            estado, simbolo, topo = chave
+            proximo_estado, operacoes_pilha = movimentos[0]
+            indice = id_estado[estado] * self._largura + (id_pilha[topo] + 1 if topo is not None else 0)
+            movimento = (id_estado[proximo_estado], [id_pilha[s] for s in operacoes_pilha],
+                         chave, operacoes_pilha)
+            if simbolo is None:
+                self._mov_epsilon[indice] = movimento
+            elif simbolo in self._id_entrada:
+                if self._mov_leitura[indice] is None:
+                    self._mov_leitura[indice] = {}
+                self._mov_leitura[indice][self._id_entrada[simbolo]] = movimento
+
+    def simular(self, cadeia: str, perfilador: Optional[Perfilador] = None,
+                max_configuracoes: int = 100000,
+                max_passos_epsilon: int = 100000) -> Tuple[bool, List[str]]:
         """
         Simula a execução do APD com a cadeia fornecida
 
-        A simulação segue um caminho não-determinístico através dos estados.
-        Em cada passo:
+        Se o APD for determinístico (ver compilar), segue um único caminho
+        com pilha em vetor pré-alocado e símbolos codificados como inteiros.
+        Caso contrário, explora em largura todas as configurações
+        (estado, posição na entrada, pilha) alcançáveis. Em cada passo:
         1. Lê um símbolo de entrada (ou ε)
         2. Observa o topo da pilha
         3. Transiciona para novo estado
         4. Modifica a pilha (pop e eventualmente push)
 
+        Configurações repetidas são descartadas. Como ε-transições podem
+        empilhar indefinidamente, a busca é limitada por max_configuracoes;
+        o caminho determinístico não guarda configurações e é limitado por
+        max_passos_epsilon. O histórico tem o mesmo formato nos dois casos.
+
         Args:
             cadeia (str): Cadeia a ser reconhecida
+            perfilador (Perfilador): Coletor opcional de contadores de execução
+            max_configuracoes (int): Máximo de configurações distintas exploradas
+                (APD não-determinístico)
+            max_passos_epsilon (int): Máximo de ε-transições consecutivas no
+                caminho determinístico, que detecta ciclos de ε
 
         Returns:
-            Tuple[bool, List[str]]: (cadeia_aceita, historico)
+            Tuple[bool, List[str]]: (cadeia_aceita, historico). Se aceita, o
+            histórico mostra o caminho de aceitação.
         """
-        self.reset_historico()
-        pilha = [self.simbolo_pilha_inicial]
-        estado_atual = self.estado_inicial
+        return concluir(self._simular_fatias(cadeia, CONFIGURACOES_POR_FATIA, perfilador,
+                                             max_configuracoes, max_passos_epsilon))
+
+    def _simular_fatias(self, cadeia: str, fatia: int, perfilador: Optional[Perfilador] = None,
+                        max_configuracoes: int = 100000, max_passos_epsilon: int = 100000):
+        """
+        simular em fatias de `fatia` configurações da busca (ver concluir)
+
+        O caminho determinístico, linear na cadeia, é uma única fatia.
+        """
+        cadeia = self._simbolos(cadeia)
+        if self.deterministico:
+            return self._simular_deterministico(cadeia, perfilador, max_passos_epsilon)
+        return (yield from self._simular_busca(cadeia, perfilador, max_configuracoes, fatia))
+
+    def rastrear(self, cadeia: str, intervalo: int = 500,
+                 max_configuracoes: int = 100000,
+                 max_passos_epsilon: int = 100000) -> 'RastroAPD':
+        """
+        Executa o APD gravando um rastro navegável passo a passo
+
+        Não gera histórico: guarda apenas a transição de cada passo e um
+        instantâneo da pilha a cada `intervalo` passos (ver rastro_execucao).
+
+        Args:
+            cadeia (str): Cadeia a ser reconhecida
+            intervalo (int): Passos entre dois instantâneos da pilha
+            max_configuracoes (int): Limite da busca, como no simular
+            max_passos_epsilon (int): Limite do caminho determinístico, como no simular
+
+        Returns:
+            RastroAPD: Rastro com o cursor no passo 0
+        """
+        return RastroAPD(self, cadeia, max_configuracoes, intervalo, max_passos_epsilon)
+
+    def _simular_deterministico(self, cadeia: Sequence[str], perfilador: Optional[Perfilador],
+                                max_passos_epsilon: int) -> Tuple[bool, List[str]]:
+        """Caminho rápido para APDs determinísticos, com o histórico da busca em largura"""
+        historico = self._historico_inicial()
+        if perfilador is not None:
+            perfilador.iniciar_execucao()
+
+        passos: List[Tuple] = []
+        aceita, estado, posicao, pilha = self._executar_deterministico(
+            cadeia, perfilador, max_passos_epsilon, lambda *passo: passos.append(passo))
+
+        if aceita:
+            self._registrar_caminho(historico, self._pilhas_caminho(passos))
+            self._registrar_aceitacao(historico, estado, pilha)
+        elif aceita is None:
+            self._registrar_rejeicao(
+                historico, [f"\nLimite de {max_passos_epsilon} ε-transições consecutivas excedido"],
+                posicao)
+        else:
+            self._registrar_rejeicao(
+                historico, ["\nNenhum caminho de computação aceita a cadeia",
+                            f"Configurações exploradas: {len(passos) + 1}"], posicao)
+        return bool(aceita), historico
+
+    def _executar_deterministico(self, cadeia: Sequence[str], perfilador: Optional[Perfilador],
+                                 max_passos_epsilon: int,
+                                 registrar: Callable[[Tuple, List[str], str, int], None]
+                                 ) -> Tuple[Optional[bool], str, int, List[str]]:
+        """
+        Laço do caminho rápido, usado pelo simular e pelo rastro
+
+        Sem conjunto de configurações: um único caminho, com a pilha em um
+        vetor de inteiros pré-alocado (topo = número de elementos). Cada
+        passo é informado a registrar(chave, operações, próximo estado,
+        símbolos consumidos); chave e operações são as da tabela de
+        transições.
+
+        Returns:
+            Tuple: (veredito, estado final, símbolos consumidos, pilha final).
+            O veredito é None se mais de max_passos_epsilon ε-transições
+            consecutivas foram executadas.
+        """
+        nomes_estados = self._nomes_estados
+        largura = self._largura
+        mov_epsilon = self._mov_epsilon
+        mov_leitura = self._mov_leitura
+        finais = self._finais
+
+        entrada = [self._id_entrada.get(simbolo, -1) for simbolo in cadeia]
+        comprimento = len(entrada)
+        pilha = [0] * max(16, 2 * comprimento)
+        pilha[0] = self._id_pilha_inicial
+        topo = 1
+        estado = self._id_estado_inicial
         posicao = 0
+        passos_epsilon = 0
+        aceita: Optional[bool] = False
 
-        # Registrar estado inicial
-        self.historico.append(f"Estado inicial: {estado_atual}")
-        self.historico.append(f"Pilha inicial: {pilha}")
-        self.historico.append(f"Símbolo na pilha: {self.simbolo_pilha_inicial}\n")
-
-        # Processar cadeia
-        while posicao <= len(cadeia):
-            # Símbolo atual (None = fim da cadeia = ε)
-            simbolo_entrada = cadeia[posicao] if posicao < len(cadeia) else None
-
-            # Topo da pilha
-            simbolo_pilha = pilha[-1] if pilha else None
-
-            # Procurar transição
-            chave = (estado_atual, simbolo_entrada, simbolo_pilha)
-
-            if chave not in self.transicoes:
-                self.historico.append(f"\nPasso {posicao}: Sem transição definida")
-                self.historico.append(f"  Estado: {estado_atual}")
-                self.historico.append(f"  Entrada: '{simbolo_entrada if simbolo_entrada else 'ε'}'")
-                self.historico.append(f"  Topo pilha: {simbolo_pilha}")
-                self.historico.append(" Cadeia REJEITADA")
-                return False, self.historico
-
-            # Executar primeira transição possível (não-determinismo)
-            transicoes_possiveis = self.transicoes[chave]
-
-            for proximo_estado, operacoes_pilha in transicoes_possiveis:
-                # Copiar pilha e executar operações
-                pilha_copia = pilha.copy()
-
-                # Pop: remover topo
-                if pilha_copia:
-                    pilha_copia.pop()
-
-                # Push: adicionar novos símbolos
-                pilha_copia.extend(operacoes_pilha)
-
-                # Registrar passo
-                self.historico.append(f"Passo {posicao}:")
-                self.historico.append(f"  Entrada: '{simbolo_entrada if simbolo_entrada else 'ε'}'")
-                self.historico.append(f"  Topo pilha: {simbolo_pilha}")
-                self.historico.append(f"  Próximo estado: {proximo_estado}")
-                self.historico.append(f"  Operação pilha: pop {simbolo_pilha}, push {operacoes_pilha}")
-                self.historico.append(f"  Pilha após: {pilha_copia}")
-
-                # Atualizar estado e pilha
-                estado_atual = proximo_estado
-                pilha = pilha_copia
-                posicao += 1
+        while True:
+            if perfilador is not None:
+                perfilador.registrar_estado(nomes_estados[estado])
+                perfilador.registrar_pilha(topo)
+
+            # Aceitação por estado final ou pilha vazia
+            if posicao == comprimento and (finais[estado] or topo == 0):
+                aceita = True
                 break
 
-        # Verificar aceitação
-        self.historico.append(f"\nEstado final: {estado_atual}")
-        self.historico.append(f"Pilha final: {pilha}")
+            indice = estado * largura + (pilha[topo - 1] + 1 if topo else 0)
+            movimento = mov_epsilon[indice]
+            avanco = 0
+            if movimento is None and posicao < comprimento:
+                leitura = mov_leitura[indice]
+                if leitura is not None:
+                    movimento = leitura.get(entrada[posicao])
+                    avanco = 1
+            if movimento is None:
+                break
 
-        # Aceitação por estado final ou pilha vazia
-        aceita = (estado_atual in self.estados_finais) or (len(pilha) == 0)
+            passos_epsilon = 0 if avanco else passos_epsilon + 1
+            if passos_epsilon > max_passos_epsilon:
+                aceita = None
+                break
 
-        if aceita:
-            self.historico.append("Resultado: CADEIA ACEITA")
+            proximo_estado, empilhar, chave, operacoes_pilha = movimento
+            if topo:
+                topo -= 1
+            novo_topo = topo + len(empilhar)
+            if novo_topo > len(pilha):
+                pilha.extend([0] * max(novo_topo, len(pilha)))
+            pilha[topo:novo_topo] = empilhar
+            topo = novo_topo
+            estado = proximo_estado
+            posicao += avanco
+            registrar(chave, operacoes_pilha, nomes_estados[estado], posicao)
+            if perfilador is not None:
+                perfilador.registrar_transicao(chave)
+
+        nomes_pilha = self._nomes_pilha
+        return aceita, nomes_estados[estado], posicao, [nomes_pilha[s] for s in pilha[:topo]]
+
+    def _pilhas_caminho(self, passos: Iterable[Tuple]) -> Iterable[Tuple]:
+        """
+        Passos (chave, operações, próximo estado, pilha após) a partir dos
+        passos registrados pelo caminho determinístico
+
+        A pilha é uma única lista atualizada a cada passo; deve ser lida antes
+        do próximo.
+        """
+        pilha = [self.simbolo_pilha_inicial]
+        for chave, operacoes_pilha, estado, _ in passos:
+            if chave[2] is not None:
+                pilha.pop()
+            pilha.extend(operacoes_pilha)
+            yield chave, operacoes_pilha, estado, pilha
+
+    def _simular_busca(self, cadeia: Sequence[str], perfilador: Optional[Perfilador],
+                       max_configuracoes: int, fatia: int = CONFIGURACOES_POR_FATIA):
+        """
+        Busca em largura sobre as configurações (caso não-determinístico)
+
+        Gerador em fatias (ver concluir); devolve (cadeia_aceita, historico).
+        """
+        historico = self._historico_inicial()
+        if perfilador is not None:
+            perfilador.iniciar_execucao()
+
+        aceitacao, anteriores, mais_avancada, excedido = yield from self._buscar_fatias(
+            cadeia, perfilador, max_configuracoes, fatia)
+
+        if aceitacao is not None:
+            estado, _, pilha = aceitacao
+            self._registrar_caminho(historico, (
+                (chave, operacoes_pilha, proximo_estado, pilha_apos)
+                for chave, operacoes_pilha, (proximo_estado, _, pilha_apos)
+                in self._caminho(aceitacao, anteriores)))
+            self._registrar_aceitacao(historico, estado, pilha)
+            return True, historico
+
+        if excedido:
+            motivo = [f"\nLimite de {max_configuracoes} configurações excedido"]
         else:
-            self.historico.append("Resultado: CADEIA REJEITADA")
+            motivo = ["\nNenhum caminho de computação aceita a cadeia",
+                      f"Configurações exploradas: {len(anteriores)}"]
+        self._registrar_rejeicao(historico, motivo, mais_avancada[1])
+        return False, historico
+
+    def _historico_inicial(self) -> List[str]:
+        """Linhas iniciais do histórico (estado e pilha iniciais)"""
+        return [f"Estado inicial: {self.estado_inicial}",
+                f"Pilha inicial: {[self.simbolo_pilha_inicial]}",
+                f"Símbolo na pilha: {self.simbolo_pilha_inicial}\n"]
+
+    @staticmethod
+    def _registrar_aceitacao(historico: List[str], estado: str, pilha: Sequence[str]):
+        historico.append(f"\nEstado final: {estado}")
+        historico.append(f"Pilha final: {list(pilha)}")
+        historico.append("Resultado: CADEIA ACEITA")
+
+    @staticmethod
+    def _registrar_rejeicao(historico: List[str], motivo: List[str], consumidos: int):
+        historico.extend(motivo)
+        historico.append(f"Maior prefixo consumido: {consumidos} símbolo(s)")
+        historico.append("Resultado: CADEIA REJEITADA")
 
-        return aceita, self.historico
+    def _buscar(self, cadeia: Sequence[str], perfilador: Optional[Perfilador],
+                max_configuracoes: int) -> Tuple[Optional[Tuple], Dict, Tuple, bool]:
+        """Busca em largura completa (ver _buscar_fatias)"""
+        return concluir(self._buscar_fatias(cadeia, perfilador, max_configuracoes,
+                                            CONFIGURACOES_POR_FATIA))
+
+    def _buscar_fatias(self, cadeia: Sequence[str], perfilador: Optional[Perfilador],
+                       max_configuracoes: int, fatia: int):
+        """
+        Busca em largura sobre as configurações (estado, posição, pilha)
+
+        Gerador que para a cada `fatia` configurações retiradas da fila.
+
+        Returns:
+            Tuple: (configuração de aceitação ou None, anteriores, primeira
+            configuração que consumiu o maior prefixo, limite excedido).
+            `anteriores` mapeia cada configuração descoberta para
+            (configuração anterior, chave da transição, operações), ou None
+            na configuração inicial
+        """
+        inicial = (self.estado_inicial, 0, (self.simbolo_pilha_inicial,))
+        anteriores = {inicial: None}
+        fila = deque([inicial])
+        mais_avancada = inicial
+
+        retiradas = 0
+        while fila:
+            retiradas += 1
+            if retiradas % fatia == 0:
+                yield
+            configuracao = fila.popleft()
+            estado, posicao, pilha = configuracao
+            if posicao > mais_avancada[1]:
+                mais_avancada = configuracao
+            if perfilador is not None:
+                perfilador.registrar_estado(estado)
+                perfilador.registrar_pilha(len(pilha))
+
+            # Aceitação por estado final ou pilha vazia
+            if posicao == len(cadeia) and (estado in self.estados_finais or not pilha):
+                return configuracao, anteriores, mais_avancada, False
+
+            topo = pilha[-1] if pilha else None
+            chaves = [(estado, None, topo)]
+            if posicao < len(cadeia):
+                chaves.append((estado, cadeia[posicao], topo))
+
+            for chave in chaves:
+                avanco = 0 if chave[1] is None else 1
+                for proximo_estado, operacoes_pilha in self.transicoes.get(chave, ()):
+                    # Pop do topo e push dos novos símbolos (último = topo)
+                    nova_pilha = pilha[:-1] + tuple(operacoes_pilha) if pilha \
+                        else tuple(operacoes_pilha)
+                    nova = (proximo_estado, posicao + avanco, nova_pilha)
+                    if nova in anteriores:
+                        continue
+                    if len(anteriores) >= max_configuracoes:
+                        return None, anteriores, mais_avancada, True
+
+                    anteriores[nova] = (configuracao, chave, operacoes_pilha)
+                    fila.append(nova)
+                    if perfilador is not None:
+                        perfilador.registrar_transicao(chave)
+
+        return None, anteriores, mais_avancada, False
+
+    @staticmethod
+    def _caminho(configuracao: Tuple, anteriores: Dict) -> List[Tuple]:
+        """Passos (chave, operações, configuração seguinte) da inicial até `configuracao`"""
+        caminho = []
+        while anteriores[configuracao] is not None:
+            anterior, chave, operacoes_pilha = anteriores[configuracao]
+            caminho.append((chave, operacoes_pilha, configuracao))
+            configuracao = anterior
+        caminho.reverse()
+        return caminho
+
+    @staticmethod
+    def _registrar_caminho(historico: List[str], caminho: Iterable[Tuple]):
+        """Registra no histórico os passos (chave, operações, próximo estado, pilha após)"""
+        for passo, ((_, simbolo_entrada, simbolo_pilha), operacoes_pilha,
+                    proximo_estado, pilha) in enumerate(caminho, 1):
+            historico.append(f"Passo {passo}:")
+            historico.append(f"  Entrada: '{simbolo_entrada if simbolo_entrada else 'ε'}'")
+            historico.append(f"  Topo pilha: {simbolo_pilha}")
+            historico.append(f"  Próximo estado: {proximo_estado}")
+            historico.append(f"  Operação pilha: pop {simbolo_pilha}, push {list(operacoes_pilha)}")
+            historico.append(f"  Pilha após: {list(pilha)}")
+
+    def _arestas(self):
+        return ((estado, destino) for (estado, _, _), movimentos in self.transicoes.items()
+                for destino, _ in movimentos)
+
+    def _estados_aceitacao(self) -> Set[str]:
+        """
+        Estados finais e estados em que a pilha pode ficar vazia
+
+        Como a aceitação também ocorre por pilha vazia, qualquer destino de
+        um movimento que não empilha nada pode terminar aceitando.
+        """
+        aceitacao = set(self.estados_finais)
+        for movimentos in self.transicoes.values():
+            aceitacao.update(destino for destino, empilhar in movimentos if not empilhar)
+        return aceitacao
+
+    def podar(self) -> 'APD':
+        """
+        Retorna um APD equivalente sem estados inalcançáveis ou mortos
+
+        A análise usa apenas o grafo de estados (ignora o conteúdo da pilha),
+        então é conservadora: só remove estados que nenhuma computação de
+        aceitação pode visitar. O estado inicial é sempre mantido.
+
+        Returns:
+            APD: Autômato com apenas os estados úteis
+        """
+        uteis = self.estados_uteis() | {self.estado_inicial}
+        transicoes = {}
+        for (estado, simbolo, topo), movimentos in self.transicoes.items():
+            restantes = [(destino, empilhar) for destino, empilhar in movimentos if destino in uteis]
+            if estado in uteis and restantes:
+                transicoes[(estado, simbolo, topo)] = restantes
+        return APD(uteis, set(self.alfabeto), set(self.alfabeto_pilha), transicoes,
+                   self.estado_inicial, self.estados_finais & uteis, self.simbolo_pilha_inicial)
 
     def __str__(self) -> str:
         """Representação em string do APD"""
@@ -147,4 +510,169 @@ class APD(AutomatoBase):
                 f"Estado inicial: {self.estado_inicial}\n"
                 f"Estados finais: {self.estados_finais}\n"
                 f"Símbolo pilha inicial: {self.simbolo_pilha_inicial}\n"
-                f"Número de transições: {len(self.transicoes)}")
\ No newline at end of file
+                f"Número de transições: {len(self.transicoes)}")
+
+
+class ConfiguracaoAPD:
+    """
+    Configuração de uma execução do APD
+
+    Atributos:
+        estado: estado atual
+        posicao: símbolos da entrada já consumidos
+        pilha: conteúdo da pilha (último = topo)
+        passo: número de passos já executados
+    """
+
+    __slots__ = ("estado", "posicao", "pilha", "passo")
+
+    def __init__(self, estado: str, posicao: int, pilha: List[str], passo: int):
+        self.estado = estado
+        self.posicao = posicao
+        self.pilha = pilha
+        self.passo = passo
+
+
+class RastroAPD(Rastro):
+    """
+    Rastro de um APD
+
+    Um APD determinístico é gravado pelo mesmo laço do caminho rápido do
+    simular. Nos demais, a busca em largura do simular encontra o
+    caminho de aceitação; se a cadeia for rejeitada, grava-se o caminho até
+    a configuração que consumiu o maior prefixo.
+
+    Por passo são guardados o estado e a posição na entrada seguintes e a
+    transição usada: a chave (estado, símbolo, topo) indica o símbolo
+    desempilhado e as operações, os empilhados. Chaves e operações são
+    referências às da tabela de transições, sem cópia.
+    """
+
+    def __init__(self, apd, cadeia: str, max_configuracoes: int = 100000,
+                 intervalo: int = 500, max_passos_epsilon: int = 100000):
+        """
+        Executa o APD gravando o rastro
+
+        Args:
+            apd: APD
+            cadeia: Cadeia de entrada
+            max_configuracoes: Limite da busca em largura, como no simular
+            intervalo: Passos entre dois instantâneos da pilha
+            max_passos_epsilon: Limite de ε-transições consecutivas do
+                caminho determinístico, como no simular
+        """
+        super().__init__(intervalo)
+        self.apd = apd
+        self.cadeia: Sequence[str] = apd._simbolos(cadeia)
+        self._chaves: List[Tuple] = []
+        self._operacoes: List[List[str]] = []
+        if apd.deterministico:
+            self._gravar_deterministico(max_passos_epsilon)
+        else:
+            self._gravar_busca(max_configuracoes)
+        self._cursor = self._de_instantaneo(0)
+
+    def _gravar_deterministico(self, max_passos_epsilon: int):
+        apd, cadeia = self.apd, self.cadeia
+        pilha = [apd.simbolo_pilha_inicial]
+        self._estados.append(apd.estado_inicial)
+        self._posicoes.append(0)
+        self._instantaneos.append(tuple(pilha))
+
+        def registrar(chave: Tuple, operacoes_pilha: List[str], estado: str, posicao: int):
+            if chave[2] is not None:
+                pilha.pop()
+            pilha.extend(operacoes_pilha)
+            self._registrar(chave, operacoes_pilha, estado, posicao)
+            if self._em_instantaneo():
+                self._instantaneos.append(tuple(pilha))
+
+        aceita, estado, posicao, _ = apd._executar_deterministico(
+            cadeia, None, max_passos_epsilon, registrar)
+        if aceita:
+            self.aceita = True
+            self.motivo = self._motivo_aceitacao(estado)
+        elif aceita is None:
+            self.motivo = f"Limite de {max_passos_epsilon} ε-transições consecutivas excedido"
+        else:
+            simbolo = cadeia[posicao] if posicao < len(cadeia) else 'ε'
+            topo = pilha[-1] if pilha else None
+            self.motivo = f"Sem transição para ({estado}, '{simbolo}', {topo})"
+
+    def _gravar_busca(self, max_configuracoes: int):
+        apd = self.apd
+        aceitacao, anteriores, mais_avancada, excedido = apd._buscar(
+            self.cadeia, None, max_configuracoes)
+        if aceitacao is not None:
+            self.aceita = True
+            self.motivo = self._motivo_aceitacao(aceitacao[0])
+        elif excedido:
+            self.motivo = (f"Limite de {max_configuracoes} configurações excedido; "
+                           f"caminho até o maior prefixo consumido")
+        else:
+            self.motivo = ("Nenhum caminho de computação aceita a cadeia; "
+                           "caminho até o maior prefixo consumido")
+
+        caminho = apd._caminho(aceitacao or mais_avancada, anteriores)
+        self._estados.append(apd.estado_inicial)
+        self._posicoes.append(0)
+        self._instantaneos.append((apd.simbolo_pilha_inicial,))
+        for chave, operacoes_pilha, (estado, posicao, pilha) in caminho:
+            self._registrar(chave, operacoes_pilha, estado, posicao)
+            if self._em_instantaneo():
+                self._instantaneos.append(pilha)
+
+    def _motivo_aceitacao(self, estado: str) -> str:
+        """Aceitação por estado final ou, se o estado não é final, por pilha vazia"""
+        if estado in self.apd.estados_finais:
+            return f"Estado final: {estado}"
+        return f"Pilha vazia (estado {estado})"
+
+    def _registrar(self, chave: Tuple, operacoes_pilha: List[str], estado: str, posicao: int):
+        self._chaves.append(chave)
+        self._operacoes.append(operacoes_pilha)
+        self._estados.append(estado)
+        self._posicoes.append(posicao)
+
+    def _de_instantaneo(self, passo: int) -> ConfiguracaoAPD:
+        pilha = list(self._instantaneos[passo // self.intervalo])
+        return ConfiguracaoAPD(self._estados[passo], self._posicoes[passo], pilha, passo)
+
+    def _aplicar(self, configuracao: ConfiguracaoAPD, passo: int):
+        pilha = configuracao.pilha
+        if self._chaves[passo][2] is not None:
+            pilha.pop()
+        pilha.extend(self._operacoes[passo])
+        configuracao.estado = self._estados[passo + 1]
+        configuracao.posicao = self._posicoes[passo + 1]
+        configuracao.passo = passo + 1
+
+    def _desfazer(self, configuracao: ConfiguracaoAPD, passo: int):
+        pilha, topo = configuracao.pilha, self._chaves[passo][2]
+        del pilha[len(pilha) - len(self._operacoes[passo]):]
+        if topo is not None:
+            pilha.append(topo)
+        configuracao.estado = self._estados[passo]
+        configuracao.posicao = self._posicoes[passo]
+        configuracao.passo = passo
+
+    def descrever(self) -> List[str]:
+        """Linhas que descrevem o passo sob o cursor, no formato do histórico"""
+        configuracao = self._cursor
+        passo, pilha = configuracao.passo, configuracao.pilha
+        restante = "".join(self.cadeia[configuracao.posicao:])
+        # Apenas o topo da pilha, para manter o custo de cada passo constante
+        visiveis = (["..."] if len(pilha) > 20 else []) + pilha[-20:]
+        linhas = [f"Passo {passo} de {self.passos}:",
+                  f"  Estado: {configuracao.estado}",
+                  f"  Entrada restante: '{restante}'" if restante else "  Entrada restante: ε",
+                  f"  Pilha: {visiveis}"]
+        if passo < self.passos:
+            estado, simbolo, topo = self._chaves[passo]
+            linhas.append(f"  Transição: δ({estado}, {simbolo if simbolo else 'ε'}, {topo}) = "
+                          f"({self._estados[passo + 1]}, push {list(self._operacoes[passo])})")
+        else:
+            linhas.append("")
+            linhas.append(self.motivo)
+            linhas.append("Resultado: CADEIA ACEITA" if self.aceita else "Resultado: CADEIA REJEITADA")
+        return linhas
@@ -5,7 +5,60 @@ Define a interface comum que todos os autômatos devem implementar
 """
 
 from abc import ABC, abstractmethod
-from typing import Set, List, Tuple
+from typing import Set, List, Tuple, Optional, Iterable, Dict, Hashable, Sequence, Generator, Any
+
+from perfilador import Perfilador
+from tokenizador import Tokenizador, precisa_tokenizar
+
+
+# Configurações exploradas por fatia nas buscas executadas em fatias
+CONFIGURACOES_POR_FATIA = 1000
+
+
+def concluir(fatias: Generator[None, None, Any]) -> Any:
+    """
+    Executa até o fim uma simulação em fatias
+
+    As buscas longas (APD não-determinístico, MT não-determinística) são
+    geradores que param a cada fatia e devolvem o resultado ao terminar;
+    a simulação assíncrona executa uma fatia por vez.
+
+    Args:
+        fatias: Gerador da simulação
+
+    Returns:
+        O valor devolvido pelo gerador
+    """
+    while True:
+        try:
+            next(fatias)
+        except StopIteration as fim:
+            return fim.value
+
+
+def alcancaveis(origens: Iterable[str], arestas: Iterable[Tuple[str, str]]) -> Set[str]:
+    """
+    Estados alcançáveis a partir de `origens` em um grafo de estados
+
+    Args:
+        origens: Estados de partida (incluídos no resultado)
+        arestas: Pares (origem, destino)
+
+    Returns:
+        Set[str]: Estados alcançáveis
+    """
+    vizinhos: Dict[str, List[str]] = {}
+    for origem, destino in arestas:
+        vizinhos.setdefault(origem, []).append(destino)
+
+    visitados = set(origens)
+    pendentes = list(visitados)
+    while pendentes:
+        for destino in vizinhos.get(pendentes.pop(), ()):
+            if destino not in visitados:
+                visitados.add(destino)
+                pendentes.append(destino)
+    return visitados
 
 
 class AutomatoBase(ABC):
@@ -17,7 +70,10 @@ class AutomatoBase(ABC):
         alfabeto (Set[str]): Alfabeto de entrada
         estado_inicial (str): Estado inicial
         estados_finais (Set[str]): Conjunto de estados finais/aceitação
-        historico (List[str]): Histórico de execução da simulação
+
+    A simulação não altera o autômato: o histórico e a configuração de cada
+    execução são locais à chamada, de modo que uma mesma instância pode ser
+    simulada por várias threads ao mesmo tempo.
     """
 
     def __init__(self, estados: Set[str], alfabeto: Set[str],
@@ -35,24 +91,61 @@ class AutomatoBase(ABC):
         self.alfabeto = alfabeto
         self.estado_inicial = estado_inicial
         self.estados_finais = estados_finais
-        self.historico = []
+        # Alfabetos com símbolos de vários caracteres exigem dividir a entrada
+        self._tokenizador = Tokenizador(alfabeto) if precisa_tokenizar(alfabeto) else None
 
     @abstractmethod
-    def simular(self, cadeia: str) -> Tuple[bool, List[str]]:
+    def simular(self, cadeia: str,
+                perfilador: Optional[Perfilador] = None) -> Tuple[bool, List[str]]:
         """
         Simula a execução do autômato com a cadeia fornecida
 
         Args:
             cadeia (str): Cadeia a ser testada
+            perfilador (Perfilador): Coletor opcional de contadores de execução
 
         Returns:
             Tuple[bool, List[str]]: (cadeia_aceita, historico_passos)
         """
         pass
 
-    def reset_historico(self):
-        """Limpa o histórico de execução"""
-        self.historico = []
+    def _simbolos(self, cadeia: str) -> Sequence[str]:
+        """
+        Sequência de símbolos da cadeia
+
+        Se todos os símbolos do alfabeto têm um caractere, é a própria
+        cadeia; caso contrário, a divisão pelo casamento mais longo.
+        """
+        if self._tokenizador is None:
+            return cadeia
+        return self._tokenizador.tokenizar(cadeia)
+
+    @abstractmethod
+    def _arestas(self) -> Iterable[Tuple[str, str]]:
+        """Pares (origem, destino) de todas as transições, ignorando símbolos e pilha"""
+        pass
+
+    def _estados_aceitacao(self) -> Set[str]:
+        """Estados em que uma computação pode terminar aceitando"""
+        return set(self.estados_finais)
+
+    def estados_alcancaveis(self) -> Set[str]:
+        """Estados alcançáveis a partir do estado inicial"""
+        return alcancaveis([self.estado_inicial], self._arestas())
+
+    def estados_coalcancaveis(self) -> Set[str]:
+        """Estados a partir dos quais algum estado de aceitação é alcançável"""
+        return alcancaveis(self._estados_aceitacao(),
+                           ((destino, origem) for origem, destino in self._arestas()))
+
+    def estados_uteis(self) -> Set[str]:
+        """
+        Estados alcançáveis e coalcançáveis
+
+        Os demais estados (inalcançáveis ou mortos) não participam de
+        nenhuma computação de aceitação e podem ser removidos por podar().
+        """
+        return self.estados_alcancaveis() & self.estados_coalcancaveis()
 
     def __str__(self) -> str:
         """Representação em string do autômato"""
@@ -60,4 +153,68 @@ class AutomatoBase(ABC):
                 f"Estados: {self.estados}\n"
                 f"Alfabeto: {self.alfabeto}\n"
                 f"Estado inicial: {self.estado_inicial}\n"
-                f"Estados finais: {self.estados_finais}")
\ No newline at end of file
+                f"Estados finais: {self.estados_finais}")
+
+
+class AvaliacaoLote(ABC):
+    """
+    Avaliação em lote para autômatos cuja configuração não depende de
+    memória auxiliar (estado no AFD, conjunto de estados no AFN)
+
+    Usada junto com AutomatoBase. As subclasses implementam os ganchos de
+    configuração, que também servem à simulação incremental e à geração
+    de entradas.
+    """
+
+    def simular_lote(self, cadeias: Iterable[str]) -> Dict[str, bool]:
+        """
+        Verifica a aceitação de um lote de cadeias de uma só vez
+
+        As cadeias são inseridas em uma trie e o autômato é percorrido uma
+        única vez por aresta da trie, de modo que prefixos compartilhados
+        são processados apenas uma vez. Um ramo em que a configuração é
+        rejeitada não é percorrido: todas as cadeias abaixo dele ficam
+        rejeitadas. Não gera histórico.
+
+        Args:
+            cadeias: Cadeias a serem testadas
+
+        Returns:
+            Dict[str, bool]: cadeia -> aceita
+        """
+        fim = None  # Chave que marca o fim de uma cadeia na trie
+        raiz: dict = {}
+        resultado: Dict[str, bool] = {}
+        for cadeia in cadeias:
+            resultado[cadeia] = False
+            no = raiz
+            for simbolo in self._simbolos(cadeia):
+                no = no.setdefault(simbolo, {})
+            no[fim] = cadeia
+
+        pendentes = [(raiz, self._configuracao_inicial())]
+        while pendentes:
+            no, configuracao = pendentes.pop()
+            for simbolo, filho in no.items():
+                if simbolo is fim:
+                    resultado[filho] = self._configuracao_aceita(configuracao)
+                else:
+                    proxima = self._avancar(configuracao, simbolo)
+                    if proxima is not None:
+                        pendentes.append((filho, proxima))
+        return resultado
+
+    @abstractmethod
+    def _configuracao_inicial(self) -> Hashable:
+        """Configuração antes de ler qualquer símbolo"""
+        pass
+
+    @abstractmethod
+    def _avancar(self, configuracao: Hashable, simbolo: str) -> Optional[Hashable]:
+        """Configuração após ler `simbolo`, ou None se a cadeia já está rejeitada"""
+        pass
+
+    @abstractmethod
+    def _configuracao_aceita(self, configuracao: Hashable) -> bool:
+        """Indica se a configuração, ao fim da cadeia, é de aceitação"""
+        pass
@@ -0,0 +1,175 @@
+"""
+Módulo de autômatos sobre bytes (UTF-8)
+
+Compila um AFD ou AFN em um autômato determinístico cujo alfabeto são os
+256 valores de byte, para reconhecer diretamente buffers UTF-8 (bytes,
+bytearray, memoryview, arquivos mapeados com mmap) sem decodificá-los.
+
+Cada símbolo do alfabeto original é codificado em UTF-8 e a transição
+(q, símbolo) vira uma cadeia de transições por byte, compartilhando
+prefixos comuns (uma trie por estado). Símbolos com vários code points
+(por exemplo "ab" ou "e\\u0301") funcionam da mesma forma, desde que
+nenhum símbolo seja prefixo de outro: assim cada buffer tem uma única
+divisão em símbolos, a mesma do casamento mais longo usado pelo simular.
+Alfabetos como {a, b, ab}, em que a divisão depende do casamento mais
+longo, são recusados. A construção de subconjuntos transforma o resultado
+por bytes (não-determinístico no caso do AFN) em uma tabela densa de 256
+colunas por estado.
+"""
+
+import mmap
+from typing import Dict, FrozenSet, List, Set, Tuple, Union
+
+from afd import AFD, ProdutoAFD
+from afn import AFN
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class AutomatoBytes:
+    """
+    Autômato determinístico sobre bytes
+
+    Os estados são inteiros; na tabela, cada estado é guardado já
+    multiplicado por 256, de modo que o passo é um único acesso
+    tabela[estado + byte]. Uma célula -1 significa rejeição.
+
+    Atributos:
+        num_estados (int): Número de estados
+        inicial (int): Estado inicial (deslocamento na tabela)
+        finais (FrozenSet[int]): Estados finais (deslocamentos na tabela)
+    """
+
+    def __init__(self, automato: Union[AFD, AFN]):
+        """
+        Args:
+            automato: AFD ou AFN cujo alfabeto será codificado em UTF-8
+
+        Raises:
+            ValueError: Se o alfabeto contiver a cadeia vazia ou um símbolo
+                        que é prefixo de outro
+        """
+        if isinstance(automato, ProdutoAFD):
+            automato = automato.materializar()
+
+        inicial, sucessores, finais = _como_afn(automato)
+        simbolos = sorted(automato.alfabeto)
+        if simbolos and not simbolos[0]:
+            raise ValueError("O alfabeto não pode conter a cadeia vazia")
+        # Em ordem lexicográfica, as extensões de um símbolo vêm logo depois dele
+        for simbolo, seguinte in zip(simbolos, simbolos[1:]):
+            if seguinte.startswith(simbolo):
+                raise ValueError(f"O símbolo '{simbolo}' é prefixo de '{seguinte}': a divisão "
+                                 f"da entrada depende do casamento mais longo")
+
+        # Nós do autômato por bytes: estados originais e nós internos das tries
+        nos: Dict[object, int] = {}
+        arestas: List[Dict[int, Set[int]]] = []
+
+        def no(chave) -> int:
+            if chave not in nos:
+                nos[chave] = len(nos)
+                arestas.append({})
+            return nos[chave]
+
+        for estado in sucessores:
+            no(estado)
+        for estado in inicial:
+            no(estado)
+        for estado, por_simbolo in sucessores.items():
+            for simbolo, destinos in por_simbolo.items():
+                codigo = simbolo.encode('utf-8')
+                atual = no(estado)
+                for i, byte in enumerate(codigo[:-1]):
+                    proximo = no((estado, codigo[:i + 1]))
+                    arestas[atual].setdefault(byte, set()).add(proximo)
+                    atual = proximo
+                finais_byte = arestas[atual].setdefault(codigo[-1], set())
+                for destino in destinos:
+                    finais_byte.add(no(destino))
+
+        aceitacao = {nos[estado] for estado in finais if estado in nos}
+
+        # Construção de subconjuntos sobre os bytes
+        partida = frozenset(nos[estado] for estado in inicial)
+        ids: Dict[FrozenSet[int], int] = {partida: 0}
+        pendentes = [partida]
+        linhas: List[Tuple[int, List[int]]] = []
+        while pendentes:
+            conjunto = pendentes.pop()
+            por_byte: Dict[int, Set[int]] = {}
+            for membro in conjunto:
+                for byte, destinos in arestas[membro].items():
+                    por_byte.setdefault(byte, set()).update(destinos)
+            linha = [-1] * 256
+            for byte, destinos in por_byte.items():
+                destino = frozenset(destinos)
+                if destino not in ids:
+                    ids[destino] = len(ids)
+                    pendentes.append(destino)
+                linha[byte] = ids[destino]
+            linhas.append((ids[conjunto], linha))
+
+        self.num_estados = len(ids)
+        tabela = [-1] * (256 * self.num_estados)
+        for estado, linha in linhas:
+            base = estado * 256
+            tabela[base:base + 256] = [d * 256 if d >= 0 else -1 for d in linha]
+        self._tabela = tabela
+        self.inicial = 0
+        self.finais = frozenset(i * 256 for conjunto, i in ids.items() if conjunto & aceitacao)
+
+    def aceita(self, dados: Buffer) -> bool:
+        """
+        Verifica a aceitação de um buffer UTF-8
+
+        Args:
+            dados: bytes, bytearray ou memoryview com o texto codificado
+
+        Returns:
+            bool: True se a sequência de bytes forma uma cadeia aceita
+        """
+        tabela = self._tabela
+        estado = self.inicial
+        for byte in dados:
+            estado = tabela[estado + byte]
+            if estado < 0:
+                return False
+        return estado in self.finais
+
+    def aceita_texto(self, cadeia: str) -> bool:
+        """Codifica a cadeia em UTF-8 e verifica a aceitação"""
+        return self.aceita(cadeia.encode('utf-8'))
+
+    def aceita_arquivo(self, caminho: str) -> bool:
+        """
+        Verifica a aceitação do conteúdo de um arquivo, mapeado com mmap
+
+        Args:
+            caminho: Arquivo com o texto em UTF-8
+
+        Returns:
+            bool: True se o conteúdo é aceito
+        """
+        with open(caminho, 'rb') as arquivo:
+            arquivo.seek(0, 2)
+            if arquivo.tell() == 0:
+                return self.aceita(b'')
+            with mmap.mmap(arquivo.fileno(), 0, access=mmap.ACCESS_READ) as mapa:
+                visao = memoryview(mapa)
+                try:
+                    return self.aceita(visao)
+                finally:
+                    visao.release()
+
+
+def _como_afn(automato: Union[AFD, AFN]) -> Tuple[Set[str], Dict[str, Dict[str, Set[str]]], Set[str]]:
+    """Estado(s) inicial(is), sucessores por símbolo e finais, sem ε-transições"""
+    if isinstance(automato, AFN):
+        return (set(automato._configuracao_inicial()),
+                {estado: dict(por_simbolo) for estado, por_simbolo in automato._sucessores.items()},
+                set(automato.estados_finais))
+    sucessores: Dict[str, Dict[str, Set[str]]] = {}
+    for (estado, simbolo), destino in automato.transicoes.items():
+        sucessores.setdefault(estado, {})[simbolo] = {destino}
+    return {automato.estado_inicial}, sucessores, set(automato.estados_finais)
@@ -0,0 +1,195 @@
+"""
+Módulo de cache de resultados de simulação
+
+Guarda o resultado de simular(cadeia) indexado pela impressão digital do
+autômato (hash SHA-256 da definição formal: estados, alfabeto, transições,
+estados inicial e finais) e pela cadeia. A impressão digital depende só do
+conteúdo, então um autômato recriado a partir do mesmo texto (por exemplo,
+pelo CriadorAutomatos) reaproveita as entradas já guardadas.
+
+O cache em memória descarta as entradas usadas há mais tempo (LRU).
+Opcionalmente os resultados também são gravados em um banco SQLite local,
+que sobrevive entre execuções do programa.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+
+def impressao_digital(automato) -> str:
+    """
+    Identificador estável da definição de um autômato
+
+    Args:
+        automato: AFD, AFN, APD ou MaquinaTuring
+
+    Returns:
+        str: Tipo do autômato e hash SHA-256 da sua definição
+    """
+    return f"{type(automato).__name__}:{automato._assinatura()}"
+
+
+class CacheResultados:
+    """
+    Cache LRU de resultados de simulação, com persistência opcional em SQLite
+
+    A impressão digital de cada autômato é calculada uma vez e lembrada
+    enquanto o objeto existir; se a definição de um autômato for alterada
+    depois de usada no cache, chame esquecer(automato).
+
+    Atributos:
+        capacidade (int): Máximo de resultados mantidos em memória
+        acertos (int): Consultas respondidas pelo cache (memória ou disco)
+        acertos_disco (int): Parte dos acertos respondida pelo SQLite
+        falhas (int): Consultas que exigiram simular
+    """
+
+    def __init__(self, capacidade: int = 1024, caminho: Optional[str] = None):
+        """
+        Args:
+            capacidade: Máximo de resultados mantidos em memória
+            caminho: Arquivo SQLite para persistir os resultados (None = só memória)
+        """
+        if capacidade < 1:
+            raise ValueError("A capacidade do cache deve ser positiva")
+        self.capacidade = capacidade
+        self.acertos = 0
+        self.acertos_disco = 0
+        self.falhas = 0
+
+        self._memoria: "OrderedDict[tuple, Tuple[bool, List[str]]]" = OrderedDict()
+        self._impressoes: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+        self._trava = threading.Lock()
+        self._banco: Optional[sqlite3.Connection] = None
+        if caminho is not None:
+            self._banco = sqlite3.connect(caminho, check_same_thread=False)
+            self._banco.execute("CREATE TABLE IF NOT EXISTS resultados "
+                                "(chave TEXT PRIMARY KEY, aceita INTEGER, historico TEXT)")
+            self._banco.commit()
+
+    def simular(self, automato, cadeia: str, **opcoes) -> Tuple[bool, List[str]]:
+        """
+        Retorna o resultado de automato.simular(cadeia, **opcoes), usando o cache
+
+        Chamadas com perfilador não são guardadas nem respondidas pelo cache,
+        já que o perfilamento exige executar a simulação. Um acerto devolve
+        apenas o veredito e o histórico: a simulação não deixa estado no
+        autômato, e a configuração final de uma MT só é obtida com
+        MaquinaTuring.executar, fora do cache.
+
+        Args:
+            automato: AFD, AFN, APD ou MaquinaTuring
+            cadeia: Cadeia de entrada
+            **opcoes: Opções de simular (ex.: max_passos); fazem parte da chave
+
+        Returns:
+            Tuple[bool, List[str]]: (cadeia_aceita, historico); o histórico é uma cópia
+        """
+        if opcoes.get("perfilador") is not None:
+            return automato.simular(cadeia, **opcoes)
+
+        chave = (self._impressao(automato), tuple(sorted(opcoes.items())), cadeia)
+        with self._trava:
+            resultado = self._memoria.get(chave)
+            if resultado is not None:
+                self._memoria.move_to_end(chave)
+                self.acertos += 1
+                return resultado[0], list(resultado[1])
+
+        resultado = self._ler_disco(chave)
+        if resultado is not None:
+            with self._trava:
+                self.acertos += 1
+                self.acertos_disco += 1
+        else:
+            aceita, historico = automato.simular(cadeia, **opcoes)
+            resultado = (aceita, list(historico))
+            self._gravar_disco(chave, resultado)
+            with self._trava:
+                self.falhas += 1
+
+        with self._trava:
+            self._memoria[chave] = resultado
+            self._memoria.move_to_end(chave)
+            while len(self._memoria) > self.capacidade:
+                self._memoria.popitem(last=False)
+        return resultado[0], list(resultado[1])
+
+    def aceita(self, automato, cadeia: str, **opcoes) -> bool:
+        """Como simular, mas retorna apenas o veredito"""
+        return self.simular(automato, cadeia, **opcoes)[0]
+
+    def esquecer(self, automato):
+        """Descarta a impressão digital memorizada do autômato (após alterá-lo)"""
+        with self._trava:
+            self._impressoes.pop(automato, None)
+
+    def limpar(self):
+        """Esvazia o cache em memória e, se houver, o banco SQLite"""
+        with self._trava:
+            self._memoria.clear()
+            if self._banco is not None:
+                self._banco.execute("DELETE FROM resultados")
+                self._banco.commit()
+
+    @property
+    def taxa_acertos(self) -> float:
+        """Fração das consultas respondidas pelo cache"""
+        total = self.acertos + self.falhas
+        return self.acertos / total if total else 0.0
+
+    def estatisticas(self) -> Dict[str, float]:
+        """Contadores de uso do cache"""
+        return {
+            "acertos": self.acertos,
+            "acertos_disco": self.acertos_disco,
+            "falhas": self.falhas,
+            "taxa_acertos": self.taxa_acertos,
+            "entradas_memoria": len(self._memoria),
+        }
+
+    def fechar(self):
+        """Fecha o banco SQLite, se houver"""
+        if self._banco is not None:
+            self._banco.close()
+            self._banco = None
+
+    def _impressao(self, automato) -> str:
+        with self._trava:
+            impressao = self._impressoes.get(automato)
+        if impressao is None:
+            impressao = impressao_digital(automato)
+            with self._trava:
+                self._impressoes[automato] = impressao
+        return impressao
+
+    @staticmethod
+    def _chave_disco(chave: tuple) -> str:
+        impressao, opcoes, cadeia = chave
+        texto = json.dumps([impressao, [list(opcao) for opcao in opcoes], cadeia],
+                           ensure_ascii=False, default=repr)
+        return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+    def _ler_disco(self, chave: tuple) -> Optional[Tuple[bool, List[str]]]:
+        if self._banco is None:
+            return None
+        with self._trava:
+            linha = self._banco.execute("SELECT aceita, historico FROM resultados WHERE chave = ?",
+                                        (self._chave_disco(chave),)).fetchone()
+        if linha is None:
+            return None
+        return bool(linha[0]), json.loads(linha[1])
+
+    def _gravar_disco(self, chave: tuple, resultado: Tuple[bool, List[str]]):
+        if self._banco is None:
+            return
+        with self._trava:
+            self._banco.execute("INSERT OR REPLACE INTO resultados VALUES (?, ?, ?)",
+                                (self._chave_disco(chave), int(resultado[0]),
+                                 json.dumps(resultado[1], ensure_ascii=False)))
+            self._banco.commit()
@@ -9,6 +9,8 @@ from typing import Set, Dict, Tuple, Optional, List
 from afd import AFD
 from afn import AFN
 from apd import APD
+from expressao_regular import regex_para_afn, regex_para_afd
+from gramatica import Gramatica
 
 
 class CriadorAutomatos:
@@ -16,7 +18,7 @@ class CriadorAutomatos:
 
     @staticmethod
     def criar_afd(estados_str: str, alfabeto_str: str, estado_inicial_str: str,
-                  estados_finais_str: str, transicoes_str: str) -> AFD:
+                  estados_finais_str: str, transicoes_str: str, podar: bool = False) -> AFD:
         """
         Cria um AFD a partir de strings de entrada
 
@@ -26,6 +28,7 @@ class CriadorAutomatos:
             estado_inicial_str: "q0"
             estados_finais_str: "q2"
             transicoes_str: "q0,0,q1\nq0,1,q0\n..."
+            podar: Se True, remove estados inalcançáveis e mortos (ver podar())
 
         Returns:
             AFD: Autômato criado
@@ -70,11 +73,12 @@ class CriadorAutomatos:
         if not transicoes:
             raise ValueError("Nenhuma transição foi definida")
 
-        return AFD(estados, alfabeto, transicoes, estado_inicial, estados_finais)
+        afd = AFD(estados, alfabeto, transicoes, estado_inicial, estados_finais)
+        return afd.podar() if podar else afd
 
     @staticmethod
     def criar_afn(estados_str: str, alfabeto_str: str, estado_inicial_str: str,
-                  estados_finais_str: str, transicoes_str: str) -> AFN:
+                  estados_finais_str: str, transicoes_str: str, podar: bool = False) -> AFN:
         """
         Cria um AFN a partir de strings de entrada
 
@@ -87,6 +91,7 @@ class CriadorAutomatos:
             estado_inicial_str: "q0"
             estados_finais_str: "q2"
             transicoes_str: "q0,a,q0,q1\nq0,,q1\n..."
+            podar: Se True, remove estados inalcançáveis e mortos (ver podar())
 
         Returns:
             AFN: Autômato criado
@@ -132,12 +137,13 @@ class CriadorAutomatos:
         if not transicoes:
             raise ValueError("Nenhuma transição foi definida")
 
-        return AFN(estados, alfabeto, transicoes, estado_inicial, estados_finais)
+        afn = AFN(estados, alfabeto, transicoes, estado_inicial, estados_finais)
+        return afn.podar() if podar else afn
 
     @staticmethod
     def criar_apd(estados_str: str, alfabeto_str: str, estado_inicial_str: str,
                   estados_finais_str: str, transicoes_str: str,
-                  alfabeto_pilha_str: str = "Z,a,b") -> APD:
+                  alfabeto_pilha_str: str = "Z,a,b", podar: bool = False) -> APD:
         """
         Cria um APD a partir de strings de entrada
 
@@ -151,6 +157,7 @@ class CriadorAutomatos:
             estados_finais_str: "q2"
             transicoes_str: "q0,a,Z,q0,aZ\nq0,b,a,q1,\n..."
             alfabeto_pilha_str: "Z,a,b"
+            podar: Se True, remove estados inalcançáveis e mortos (ver podar())
 
         Returns:
             APD: Autômato criado
@@ -198,5 +205,106 @@ class CriadorAutomatos:
         if not transicoes:
             raise ValueError("Nenhuma transição foi definida")
 
-        return APD(estados, alfabeto, alfabeto_pilha, transicoes,
-                   estado_inicial, estados_finais)
\ No newline at end of file
+        apd = APD(estados, alfabeto, alfabeto_pilha, transicoes,
+                  estado_inicial, estados_finais)
+        return apd.podar() if podar else apd
+
+    @staticmethod
+    def criar_afn_regex(regex_str: str, alfabeto_str: str = "") -> AFN:
+        """
+        Cria um AFN a partir de uma expressão regular (construção de Thompson)
+
+        Args:
+            regex_str: "(a|b)*abb"
+            alfabeto_str: "a,b" (opcional; necessário para '.' e '[^...]')
+
+        Returns:
+            AFN: Autômato criado
+        """
+        alfabeto = set(s.strip() for s in alfabeto_str.split(',') if s.strip())
+        return regex_para_afn(regex_str.strip(), alfabeto or None)
+
+    @staticmethod
+    def criar_afd_regex(regex_str: str, alfabeto_str: str = "") -> AFD:
+        """
+        Cria um AFD mínimo a partir de uma expressão regular
+
+        Args:
+            regex_str: "(a|b)*abb"
+            alfabeto_str: "a,b" (opcional; necessário para '.' e '[^...]')
+
+        Returns:
+            AFD: Autômato criado
+        """
+        alfabeto = set(s.strip() for s in alfabeto_str.split(',') if s.strip())
+        return regex_para_afd(regex_str.strip(), alfabeto or None)
+
+    @staticmethod
+    def criar_gramatica(variaveis_str: str, terminais_str: str, inicial_str: str,
+                        producoes_str: str) -> Gramatica:
+        """
+        Cria uma Gramática Livre de Contexto a partir de strings de entrada
+
+        Formato de produção: variável -> corpo1 | corpo2 | ...
+        Cada caractere do corpo é um símbolo; use ε (ou deixe vazio) para a
+        produção vazia.
+
+        Args:
+            variaveis_str: "S,A"
+            terminais_str: "a,b"
+            inicial_str: "S"
+            producoes_str: "S -> aSb | ε\n..."
+
+        Returns:
+            Gramatica: Gramática criada
+
+        Raises:
+            ValueError: Se os dados forem inválidos
+        """
+        variaveis = set(v.strip() for v in variaveis_str.split(',') if v.strip())
+        terminais = set(t.strip() for t in terminais_str.split(',') if t.strip())
+        inicial = inicial_str.strip()
+
+        producoes: Dict[str, List[Tuple[str, ...]]] = {}
+        linhas = producoes_str.strip().split('\n')
+
+        for i, linha in enumerate(linhas, 1):
+            linha = linha.strip()
+            if not linha or linha.startswith('#'):
+                continue
+
+            if '->' not in linha:
+                raise ValueError(f"Linha {i}: formato inválido. Use: variável -> corpo1 | corpo2")
+
+            cabeca, corpos = linha.split('->', 1)
+            cabeca = cabeca.strip()
+            if cabeca not in variaveis:
+                raise ValueError(f"Linha {i}: variável '{cabeca}' não existe")
+
+            for corpo in corpos.split('|'):
+                corpo = corpo.strip()
+                simbolos = tuple() if corpo in ('', 'ε') else tuple(corpo.replace(' ', ''))
+                for simbolo in simbolos:
+                    if simbolo not in variaveis and simbolo not in terminais:
+                        raise ValueError(f"Linha {i}: símbolo '{simbolo}' não é variável nem terminal")
+                producoes.setdefault(cabeca, []).append(simbolos)
+
+        if not producoes:
+            raise ValueError("Nenhuma produção foi definida")
+
+        return Gramatica(variaveis, terminais, producoes, inicial)
+
+    @staticmethod
+    def criar_apd_gramatica(variaveis_str: str, terminais_str: str, inicial_str: str,
+                            producoes_str: str) -> APD:
+        """
+        Cria um APD equivalente a uma Gramática Livre de Contexto
+
+        Args: ver criar_gramatica
+
+        Returns:
+            APD: Autômato a pilha que aceita a linguagem da gramática
+        """
+        return CriadorAutomatos.criar_gramatica(
+            variaveis_str, terminais_str, inicial_str, producoes_str
+        ).para_apd()
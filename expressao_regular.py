@@ -0,0 +1,253 @@
+"""
+Módulo de expressões regulares
+
+Compila expressões regulares em autômatos deste projeto usando a
+construção de Thompson (regex -> AFN com ε-transições). Opcionalmente o AFN
+é convertido em AFD (construção de subconjuntos) e minimizado (Hopcroft).
+O reconhecimento é feito pelos simuladores de AFN/AFD, sempre em tempo
+linear no tamanho da cadeia, sem retrocesso (backtracking).
+
+Sintaxe suportada:
+    ab        concatenação
+    a|b       união
+    a*        fecho de Kleene
+    a+        uma ou mais ocorrências
+    a?        zero ou uma ocorrência
+    (a|b)c    agrupamento; () representa a cadeia vazia
+    [abc]     classe de caracteres; aceita intervalos como [a-z0-9]
+    [^abc]    classe negada (exige alfabeto)
+    .         qualquer símbolo do alfabeto (exige alfabeto)
+    \\x        escape do caractere x
+"""
+
+from functools import lru_cache
+from typing import Dict, Tuple, Set, Optional, Iterable, FrozenSet
+
+from afd import AFD
+from afn import AFN
+
+
+class _Parser:
+    """
+    Analisador descendente recursivo de expressões regulares
+
+    Produz uma árvore de tuplas:
+        ('classe', frozenset)   ('vazio',)
+        ('uniao', (e1, e2, ...))   ('concat', (e1, e2, ...))
+        ('estrela', e)   ('mais', e)   ('opcional', e)
+    """
+
+    def __init__(self, padrao: str, alfabeto: Optional[FrozenSet[str]]):
+        self.padrao = padrao
+        self.alfabeto = alfabeto
+        self.posicao = 0
+
+    def analisar(self) -> tuple:
+        arvore = self._uniao()
+        if self.posicao < len(self.padrao):
+            raise ValueError(f"Posicao {self.posicao}: caractere inesperado "
+                             f"'{self.padrao[self.posicao]}'")
+        return arvore
+
+    def _atual(self) -> Optional[str]:
+        return self.padrao[self.posicao] if self.posicao < len(self.padrao) else None
+
+    def _uniao(self) -> tuple:
+        alternativas = [self._concatenacao()]
+        while self._atual() == '|':
+            self.posicao += 1
+            alternativas.append(self._concatenacao())
+        return alternativas[0] if len(alternativas) == 1 else ('uniao', tuple(alternativas))
+
+    def _concatenacao(self) -> tuple:
+        fatores = []
+        while self._atual() is not None and self._atual() not in '|)':
+            fatores.append(self._fator())
+        if not fatores:
+            return ('vazio',)
+        return fatores[0] if len(fatores) == 1 else ('concat', tuple(fatores))
+
+    def _fator(self) -> tuple:
+        arvore = self._atomo()
+        while self._atual() is not None and self._atual() in '*+?':
+            operador = {'*': 'estrela', '+': 'mais', '?': 'opcional'}[self._atual()]
+            self.posicao += 1
+            arvore = (operador, arvore)
+        return arvore
+
+    def _atomo(self) -> tuple:
+        caractere = self._atual()
+
+        if caractere == '(':
+            self.posicao += 1
+            arvore = self._uniao()
+            if self._atual() != ')':
+                raise ValueError(f"Posicao {self.posicao}: ')' esperado")
+            self.posicao += 1
+            return arvore
+
+        if caractere == '[':
+            return ('classe', self._classe())
+
+        if caractere == '.':
+            self.posicao += 1
+            return ('classe', self._exigir_alfabeto('.'))
+
+        if caractere in '*+?':
+            raise ValueError(f"Posicao {self.posicao}: '{caractere}' sem operando")
+
+        return ('classe', frozenset(self._literal()))
+
+    def _literal(self) -> str:
+        caractere = self._atual()
+        if caractere is None:
+            raise ValueError("Fim inesperado da expressao")
+        if caractere == '\\':
+            self.posicao += 1
+            caractere = self._atual()
+            if caractere is None:
+                raise ValueError("Escape '\\' no fim da expressao")
+        self.posicao += 1
+        return caractere
+
+    def _classe(self) -> FrozenSet[str]:
+        self.posicao += 1  # '['
+        negada = self._atual() == '^'
+        if negada:
+            self.posicao += 1
+
+        simbolos: Set[str] = set()
+        while self._atual() != ']':
+            if self._atual() is None:
+                raise ValueError("Classe de caracteres sem ']'")
+            inicio = self._literal()
+            if self._atual() == '-' and self.posicao + 1 < len(self.padrao) \
+                    and self.padrao[self.posicao + 1] != ']':
+                self.posicao += 1
+                fim = self._literal()
+                if ord(fim) < ord(inicio):
+                    raise ValueError(f"Intervalo invalido [{inicio}-{fim}]")
+                simbolos |= {chr(c) for c in range(ord(inicio), ord(fim) + 1)}
+            else:
+                simbolos.add(inicio)
+        self.posicao += 1  # ']'
+
+        if negada:
+            return self._exigir_alfabeto('[^...]') - simbolos
+        return frozenset(simbolos)
+
+    def _exigir_alfabeto(self, construcao: str) -> FrozenSet[str]:
+        if self.alfabeto is None:
+            raise ValueError(f"'{construcao}' exige que o alfabeto seja informado")
+        return self.alfabeto
+
+
+def _thompson(arvore: tuple) -> Tuple[Dict[Tuple[str, Optional[str]], Set[str]], str, str]:
+    """
+    Construção de Thompson
+
+    Returns:
+        (transicoes, estado_inicial, estado_final) do AFN gerado
+    """
+    transicoes: Dict[Tuple[str, Optional[str]], Set[str]] = {}
+    contador = [0]
+
+    def novo_estado() -> str:
+        estado = f"t{contador[0]}"
+        contador[0] += 1
+        return estado
+
+    def ligar(origem: str, simbolo: Optional[str], destino: str):
+        transicoes.setdefault((origem, simbolo), set()).add(destino)
+
+    def construir(no: tuple) -> Tuple[str, str]:
+        tipo = no[0]
+        inicio, fim = novo_estado(), novo_estado()
+
+        if tipo == 'vazio':
+            ligar(inicio, None, fim)
+        elif tipo == 'classe':
+            for simbolo in no[1]:
+                ligar(inicio, simbolo, fim)
+        elif tipo == 'concat':
+            anterior = inicio
+            for filho in no[1]:
+                i, f = construir(filho)
+                ligar(anterior, None, i)
+                anterior = f
+            ligar(anterior, None, fim)
+        elif tipo == 'uniao':
+            for filho in no[1]:
+                i, f = construir(filho)
+                ligar(inicio, None, i)
+                ligar(f, None, fim)
+        else:  # estrela, mais, opcional
+            i, f = construir(no[1])
+            ligar(inicio, None, i)
+            ligar(f, None, fim)
+            if tipo in ('estrela', 'opcional'):
+                ligar(inicio, None, fim)
+            if tipo in ('estrela', 'mais'):
+                ligar(f, None, i)
+
+        return inicio, fim
+
+    inicial, final = construir(arvore)
+    return transicoes, inicial, final
+
+
+@lru_cache(maxsize=256)
+def _compilar(padrao: str, alfabeto: Optional[FrozenSet[str]], deterministico: bool):
+    """Compilação com cache por (padrão, alfabeto, modo)"""
+    arvore = _Parser(padrao, alfabeto).analisar()
+    transicoes, inicial, final = _thompson(arvore)
+
+    estados = {inicial, final}
+    simbolos = set(alfabeto or ())
+    for (origem, simbolo), destinos in transicoes.items():
+        estados.add(origem)
+        estados |= destinos
+        if simbolo is not None:
+            simbolos.add(simbolo)
+
+    afn = AFN(estados, simbolos, transicoes, inicial, {final})
+    if deterministico:
+        return afn.para_afd().minimizar()
+    return afn
+
+
+def regex_para_afn(padrao: str, alfabeto: Optional[Iterable[str]] = None) -> AFN:
+    """
+    Compila uma expressão regular em um AFN (construção de Thompson)
+
+    O resultado é guardado em cache pelo texto da expressão: chamadas
+    repetidas retornam o mesmo objeto, que não deve ser modificado.
+
+    Args:
+        padrao: Expressão regular (ver sintaxe no início do módulo)
+        alfabeto: Alfabeto de entrada; necessário para '.' e '[^...]'.
+                  Os símbolos usados na expressão são sempre incluídos.
+
+    Returns:
+        AFN: Autômato que aceita exatamente as cadeias descritas por `padrao`
+
+    Raises:
+        ValueError: Se a expressão for inválida
+    """
+    return _compilar(padrao, frozenset(alfabeto) if alfabeto is not None else None, False)
+
+
+def regex_para_afd(padrao: str, alfabeto: Optional[Iterable[str]] = None) -> AFD:
+    """
+    Compila uma expressão regular em um AFD mínimo
+
+    Equivale a regex_para_afn(padrao).para_afd().minimizar(), com cache.
+
+    Args:
+        padrao: Expressão regular (ver sintaxe no início do módulo)
+        alfabeto: Alfabeto de entrada; necessário para '.' e '[^...]'
+
+    Returns:
+        AFD: Autômato determinístico mínimo
+    """
+    return _compilar(padrao, frozenset(alfabeto) if alfabeto is not None else None, True)
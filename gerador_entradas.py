@@ -0,0 +1,302 @@
+"""
+Módulo de geração de entradas a partir da estrutura do autômato
+
+Produz cadeias para testes de desempenho e de regressão (por exemplo,
+comparar os caminhos rápidos com o simular de referência):
+
+- aceitas: passeios aleatórios pelas transições que terminam em estado final
+- enumerar: todas as cadeias aceitas até um comprimento, em ordem
+  (comprimento, lexicográfica)
+- quase_aceitas: cadeias rejeitadas obtidas por uma pequena mutação de uma
+  cadeia aceita (troca, inserção ou remoção de um símbolo)
+- aleatorias: cadeias uniformes sobre o alfabeto, aceitas ou não
+
+Todos os métodos devolvem iteradores preguiçosos. Cada método usa um
+gerador pseudoaleatório próprio derivado da semente, então a mesma semente
+produz sempre a mesma sequência, independentemente da ordem das chamadas.
+"""
+
+import random
+from collections import deque
+from typing import Dict, Hashable, Iterator, List, Optional, Set, Tuple
+
+from afd import AFD, ProdutoAFD
+from afn import AFN
+
+
+class GeradorEntradas:
+    """
+    Gerador de cadeias para AFD (inclusive produtos) e AFN
+
+    Com símbolos de vários caracteres as cadeias são a concatenação dos
+    símbolos, que o autômato volta a dividir pelo casamento mais longo. Essa
+    divisão pode não ser a sequência gerada (com o alfabeto {a, b, ab}, a
+    sequência a, b vira a cadeia "ab", lida como o símbolo ab), então cada
+    cadeia é conferida pela divisão que o autômato de fato faz.
+
+    Atributos:
+        automato: Autômato usado (produtos são materializados)
+        semente: Semente dos geradores pseudoaleatórios
+        simbolos (List[str]): Alfabeto em ordem
+    """
+
+    def __init__(self, automato, semente: int = 0):
+        """
+        Args:
+            automato: AFD, ProdutoAFD ou AFN
+            semente: Semente para reprodutibilidade
+
+        Raises:
+            ValueError: Se o autômato não for um AFD ou AFN
+        """
+        if isinstance(automato, ProdutoAFD):
+            automato = automato.materializar()
+        if not isinstance(automato, (AFD, AFN)):
+            raise ValueError(f"Geração de entradas não suporta {type(automato).__name__}")
+        self.automato = automato
+        self.semente = semente
+        self.simbolos = sorted(automato.alfabeto)
+
+        # Grafo dos estados vivos: estado -> [(símbolo, destino)], em ordem fixa
+        self._saidas: Dict[str, List[Tuple[str, str]]] = {}
+        if isinstance(automato, AFD):
+            vivos = automato.estados_coalcancaveis()
+            self._iniciais = [automato.estado_inicial] if automato.estado_inicial in vivos else []
+            for (estado, simbolo), destino in automato.transicoes.items():
+                if estado in vivos and destino in vivos:
+                    self._saidas.setdefault(estado, []).append((simbolo, destino))
+            self._finais: Set[str] = set(automato.estados_finais)
+        else:
+            # Os sucessores do AFN já estão sem estados mortos, e o ε-fecho de
+            # um estado morto só tem estados mortos. Um estado pode usar as
+            # transições de todo o seu ε-fecho e o passeio pode parar em
+            # qualquer estado cujo ε-fecho tem um final
+            self._iniciais = sorted(automato._configuracao_inicial())
+            for estado, fecho in automato._fechos.items():
+                saidas = {(simbolo, destino) for membro in fecho
+                          for simbolo, destinos in automato._sucessores.get(membro, {}).items()
+                          for destino in destinos}
+                if saidas:
+                    self._saidas[estado] = list(saidas)
+            self._finais = {estado for estado, fecho in automato._fechos.items()
+                            if not fecho.isdisjoint(automato.estados_finais)}
+        for saidas in self._saidas.values():
+            saidas.sort()
+        self._distancia = self._calcular_distancias()
+
+    def aceitas(self, quantidade: Optional[int] = None, comprimento_max: int = 20,
+                tentativas: int = 100) -> Iterator[str]:
+        """
+        Cadeias aceitas geradas por passeios aleatórios
+
+        Cada passeio sorteia um comprimento-alvo e percorre transições
+        aleatórias que ainda permitem chegar a um estado final dentro de
+        `comprimento_max`; ao atingir o alvo, segue o caminho mais curto
+        até um estado final. Com símbolos de vários caracteres, a cadeia do
+        passeio é descartada se o autômato a rejeitar depois de dividi-la.
+        Cadeias repetidas podem aparecer.
+
+        Args:
+            quantidade: Número de cadeias (None = sequência infinita)
+            comprimento_max: Comprimento máximo desejado; é excedido apenas
+                se a menor cadeia aceita for mais longa
+            tentativas: Passeios seguidos descartados antes de desistir
+
+        Returns:
+            Iterator[str]: Cadeias aceitas (vazio se a linguagem for vazia)
+        """
+        if not self._iniciais:
+            return iter(())
+        return self._limitar(self._passeios_aceitos(self._aleatorio("aceitas"),
+                                                    comprimento_max, tentativas), quantidade)
+
+    def enumerar(self, comprimento_max: int) -> Iterator[str]:
+        """
+        Todas as cadeias aceitas com até `comprimento_max` símbolos
+
+        As cadeias saem em ordem de comprimento e, dentro de cada
+        comprimento, em ordem lexicográfica dos símbolos. Ramos que não
+        podem chegar a um estado final no comprimento restante são podados.
+        Com símbolos de vários caracteres, só sai a sequência que é a
+        própria divisão da cadeia pelo autômato, e cada cadeia sai uma vez.
+
+        Args:
+            comprimento_max: Maior comprimento enumerado
+
+        Returns:
+            Iterator[str]: Cadeias aceitas, sem repetição
+        """
+        automato = self.automato
+        for comprimento in range(comprimento_max + 1):
+            pendentes = [((), automato._configuracao_inicial())]
+            while pendentes:
+                prefixo, configuracao = pendentes.pop()
+                restante = comprimento - len(prefixo)
+                if restante == 0:
+                    if automato._configuracao_aceita(configuracao):
+                        cadeia = self._juntar(prefixo)
+                        if automato._tokenizador is None or self._dividir(cadeia) == list(prefixo):
+                            yield cadeia
+                    continue
+                # Empilhados em ordem reversa para sair em ordem lexicográfica
+                for simbolo in reversed(self.simbolos):
+                    proxima = automato._avancar(configuracao, simbolo)
+                    if proxima is not None and self._distancia_configuracao(proxima) < restante:
+                        pendentes.append((prefixo + (simbolo,), proxima))
+
+    def quase_aceitas(self, quantidade: Optional[int] = None, comprimento_max: int = 20,
+                      tentativas: int = 100) -> Iterator[str]:
+        """
+        Cadeias rejeitadas próximas de cadeias aceitas
+
+        Cada cadeia é uma cadeia aceita (de um passeio aleatório) com um
+        símbolo trocado, inserido ou removido, mantida apenas se o autômato
+        a rejeitar depois de dividi-la em símbolos. Se a linguagem for vazia, toda cadeia é rejeitada e as
+        cadeias são sorteadas uniformemente.
+
+        Args:
+            quantidade: Número de cadeias (None = sequência infinita)
+            comprimento_max: Comprimento máximo das cadeias aceitas de base
+            tentativas: Mutações seguidas sem sucesso antes de desistir (por
+                exemplo, quando o autômato aceita quase tudo)
+
+        Returns:
+            Iterator[str]: Cadeias rejeitadas
+        """
+        if not self._iniciais:
+            return self.aleatorias(quantidade, comprimento_max)
+        return self._limitar(self._mutacoes(self._aleatorio("quase_aceitas"),
+                                            comprimento_max, tentativas), quantidade)
+
+    def aleatorias(self, quantidade: Optional[int] = None,
+                   comprimento_max: int = 20) -> Iterator[str]:
+        """
+        Cadeias sorteadas uniformemente sobre o alfabeto (aceitas ou não)
+
+        Args:
+            quantidade: Número de cadeias (None = sequência infinita)
+            comprimento_max: Maior comprimento sorteado
+
+        Returns:
+            Iterator[str]: Cadeias aleatórias
+        """
+        aleatorio = self._aleatorio("aleatorias")
+        simbolos = self.simbolos
+        return self._limitar((self._juntar(aleatorio.choice(simbolos)
+                                           for _ in range(aleatorio.randint(0, comprimento_max)))
+                              for _ in self._repeticoes()) if simbolos else iter(()),
+                             quantidade)
+
+    def _passeio(self, aleatorio: random.Random, comprimento_max: int) -> List[str]:
+        """Símbolos de um passeio aleatório do estado inicial até um estado final"""
+        distancia = self._distancia
+        estado = aleatorio.choice(self._iniciais)
+        alvo = aleatorio.randint(min(distancia[estado], comprimento_max), comprimento_max)
+        simbolos: List[str] = []
+        while True:
+            if len(simbolos) >= alvo:
+                if estado in self._finais:
+                    return simbolos
+                # Caminho mais curto até um estado final
+                opcoes = [(s, d) for s, d in self._saidas[estado]
+                          if distancia[d] == distancia[estado] - 1]
+            else:
+                limite = comprimento_max - len(simbolos) - 1
+                opcoes = [(s, d) for s, d in self._saidas.get(estado, ()) if distancia[d] <= limite]
+                if not opcoes:
+                    if estado in self._finais:
+                        return simbolos
+                    opcoes = [(s, d) for s, d in self._saidas[estado]
+                              if distancia[d] == distancia[estado] - 1]
+            simbolo, estado = aleatorio.choice(opcoes)
+            simbolos.append(simbolo)
+
+    def _passeios_aceitos(self, aleatorio: random.Random, comprimento_max: int,
+                          tentativas: int) -> Iterator[str]:
+        falhas = 0
+        while falhas < tentativas:
+            cadeia = self._juntar(self._passeio(aleatorio, comprimento_max))
+            if self.automato._tokenizador is None or self._aceita(self._dividir(cadeia)):
+                falhas = 0
+                yield cadeia
+            else:
+                falhas += 1
+
+    def _mutacoes(self, aleatorio: random.Random, comprimento_max: int,
+                  tentativas: int) -> Iterator[str]:
+        falhas = 0
+        while falhas < tentativas:
+            simbolos = self._passeio(aleatorio, comprimento_max)
+            operacao = aleatorio.choice(("trocar", "inserir", "remover") if simbolos else ("inserir",))
+            posicao = aleatorio.randrange(len(simbolos) + (operacao == "inserir"))
+            if operacao == "trocar":
+                outros = [s for s in self.simbolos if s != simbolos[posicao]]
+                if not outros:
+                    falhas += 1
+                    continue
+                simbolos[posicao] = aleatorio.choice(outros)
+            elif operacao == "inserir":
+                simbolos.insert(posicao, aleatorio.choice(self.simbolos))
+            else:
+                del simbolos[posicao]
+
+            cadeia = self._juntar(simbolos)
+            if self._aceita(self._dividir(cadeia)):
+                falhas += 1
+            else:
+                falhas = 0
+                yield cadeia
+
+    def _aceita(self, simbolos: List[str]) -> bool:
+        """Veredito pelos ganchos de avaliação em lote (sem histórico)"""
+        automato = self.automato
+        configuracao: Optional[Hashable] = automato._configuracao_inicial()
+        for simbolo in simbolos:
+            configuracao = automato._avancar(configuracao, simbolo)
+            if configuracao is None:
+                return False
+        return automato._configuracao_aceita(configuracao)
+
+    def _dividir(self, cadeia: str) -> List[str]:
+        """Símbolos da cadeia como o autômato os lê"""
+        return list(self.automato._simbolos(cadeia))
+
+    def _calcular_distancias(self) -> Dict[str, int]:
+        """Menor número de transições de cada estado vivo até um estado final"""
+        anteriores: Dict[str, List[str]] = {}
+        for estado, saidas in self._saidas.items():
+            for _, destino in saidas:
+                anteriores.setdefault(destino, []).append(estado)
+        distancia = {estado: 0 for estado in self._finais}
+        fila = deque(self._finais)
+        while fila:
+            estado = fila.popleft()
+            for anterior in anteriores.get(estado, ()):
+                if anterior not in distancia:
+                    distancia[anterior] = distancia[estado] + 1
+                    fila.append(anterior)
+        return distancia
+
+    def _distancia_configuracao(self, configuracao: Hashable) -> float:
+        if isinstance(configuracao, frozenset):
+            return min((self._distancia.get(e, float("inf")) for e in configuracao),
+                       default=float("inf"))
+        return self._distancia.get(configuracao, float("inf"))
+
+    def _aleatorio(self, metodo: str) -> random.Random:
+        return random.Random(f"{self.semente}:{metodo}")
+
+    @staticmethod
+    def _repeticoes() -> Iterator[None]:
+        while True:
+            yield None
+
+    @staticmethod
+    def _limitar(cadeias: Iterator[str], quantidade: Optional[int]) -> Iterator[str]:
+        if quantidade is None:
+            return cadeias
+        return (cadeia for _, cadeia in zip(range(quantidade), cadeias))
+
+    @staticmethod
+    def _juntar(simbolos) -> str:
+        return "".join(simbolos)
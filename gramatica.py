@@ -0,0 +1,250 @@
+"""
+Módulo para Gramáticas Livres de Contexto (GLC)
+
+Uma GLC G = (V, Σ, P, S) gera uma linguagem livre de contexto. Este módulo
+oferece a conversão de G para um Autômato a Pilha equivalente e um
+reconhecedor de Earley, que decide se uma cadeia pertence a L(G) em tempo
+O(n³) no pior caso (O(n²) para gramáticas não ambíguas).
+"""
+
+from typing import Dict, Tuple, Set, List, Optional
+
+from apd import APD
+
+
+class Gramatica:
+    """
+    Gramática Livre de Contexto
+
+    Atributos:
+        variaveis (Set[str]): Símbolos não-terminais (V)
+        terminais (Set[str]): Símbolos terminais (Σ)
+        producoes (Dict): Mapeamento variável -> lista de corpos (tuplas de símbolos)
+        inicial (str): Variável inicial (S)
+    """
+
+    def __init__(self, variaveis: Set[str], terminais: Set[str],
+                 producoes: Dict[str, List[Tuple[str, ...]]], inicial: str):
+        """
+        Inicializa uma GLC
+
+        Args:
+            variaveis: Conjunto de variáveis
+            terminais: Conjunto de terminais
+            producoes: Dicionário A -> [corpo1, corpo2, ...]; () é a produção vazia
+            inicial: Variável inicial
+
+        Raises:
+            ValueError: Se a gramática for inválida
+        """
+        self.variaveis = variaveis
+        self.terminais = terminais
+        self.producoes = producoes
+        self.inicial = inicial
+        self._validar()
+        self._reconhecedor: Optional[ReconhecedorEarley] = None
+
+    def _validar(self):
+        """Valida a definição da gramática"""
+        if self.variaveis & self.terminais:
+            raise ValueError(f"Símbolos em V e em Σ ao mesmo tempo: {self.variaveis & self.terminais}")
+        if self.inicial not in self.variaveis:
+            raise ValueError(f"Variável inicial '{self.inicial}' não existe")
+
+        for cabeca, corpos in self.producoes.items():
+            if cabeca not in self.variaveis:
+                raise ValueError(f"Variável '{cabeca}' da produção não existe")
+            for corpo in corpos:
+                for simbolo in corpo:
+                    if simbolo not in self.variaveis and simbolo not in self.terminais:
+                        raise ValueError(f"Símbolo '{simbolo}' em {cabeca} -> {''.join(corpo)} "
+                                         f"não é variável nem terminal")
+
+    def anulaveis(self) -> Set[str]:
+        """
+        Calcula as variáveis anuláveis (que derivam a cadeia vazia)
+
+        Returns:
+            Set[str]: Conjunto de variáveis A tais que A ⇒* ε
+        """
+        anulaveis: Set[str] = set()
+        mudou = True
+        while mudou:
+            mudou = False
+            for cabeca, corpos in self.producoes.items():
+                if cabeca in anulaveis:
+                    continue
+                if any(all(s in anulaveis for s in corpo) for corpo in corpos):
+                    anulaveis.add(cabeca)
+                    mudou = True
+        return anulaveis
+
+    def para_apd(self) -> APD:
+        """
+        Converte a gramática em um Autômato a Pilha equivalente
+
+        Construção clássica com três estados: q0 empilha a variável inicial,
+        q1 expande variáveis no topo (ε-transições, uma por produção) e
+        consome terminais iguais ao topo, e q2 aceita quando só resta o
+        fundo da pilha.
+
+        Returns:
+            APD: Autômato a pilha que aceita L(G) por estado final
+        """
+        fundo = next(s for s in ('Z', '$', '⊥', 'Z0')
+                     if s not in self.variaveis and s not in self.terminais)
+
+        transicoes: Dict[Tuple[str, Optional[str], Optional[str]], List[Tuple[str, List[str]]]] = {
+            ('q0', None, fundo): [('q1', [fundo, self.inicial])],
+            ('q1', None, fundo): [('q2', [fundo])],
+        }
+        for cabeca, corpos in self.producoes.items():
+            for corpo in corpos:
+                # Último símbolo empilhado fica no topo
+                transicoes.setdefault(('q1', None, cabeca), []).append(('q1', list(reversed(corpo))))
+        for terminal in self.terminais:
+            transicoes[('q1', terminal, terminal)] = [('q1', [])]
+
+        return APD({'q0', 'q1', 'q2'}, set(self.terminais),
+                   self.variaveis | self.terminais | {fundo}, transicoes,
+                   'q0', {'q2'}, simbolo_pilha_inicial=fundo)
+
+    def reconhecer(self, cadeia: str) -> bool:
+        """
+        Verifica se a cadeia pertence à linguagem gerada (algoritmo de Earley)
+
+        O reconhecedor é mantido entre chamadas, de modo que cadeias que
+        compartilham prefixo com a anterior reaproveitam a tabela.
+
+        Args:
+            cadeia: Cadeia de terminais (um símbolo por caractere)
+
+        Returns:
+            bool: True se cadeia ∈ L(G)
+        """
+        if self._reconhecedor is None:
+            self._reconhecedor = ReconhecedorEarley(self)
+        return self._reconhecedor.reconhecer(cadeia)
+
+    def __str__(self) -> str:
+        """Representação em string da gramática"""
+        linhas = [f"GLC - Gramática Livre de Contexto",
+                  f"Variáveis: {self.variaveis}",
+                  f"Terminais: {self.terminais}",
+                  f"Variável inicial: {self.inicial}",
+                  "Produções:"]
+        for cabeca, corpos in self.producoes.items():
+            alternativas = " | ".join(''.join(corpo) if corpo else 'ε' for corpo in corpos)
+            linhas.append(f"  {cabeca} -> {alternativas}")
+        return "\n".join(linhas)
+
+
+class ReconhecedorEarley:
+    """
+    Reconhecedor de Earley com reaproveitamento de prefixo
+
+    A tabela (chart) guarda um conjunto de itens por posição da entrada. O
+    conjunto da posição i depende apenas dos i primeiros símbolos, então ao
+    reconhecer uma nova cadeia os conjuntos do maior prefixo comum com a
+    cadeia anterior são mantidos e apenas o restante é recalculado.
+
+    Um item é a tupla (indice_producao, ponto, origem). Variáveis anuláveis
+    são tratadas com a correção de Aycock e Horspool na predição.
+    """
+
+    def __init__(self, gramatica: Gramatica):
+        """
+        Args:
+            gramatica: Gramática a ser reconhecida
+        """
+        self.gramatica = gramatica
+        self._producoes: List[Tuple[str, Tuple[str, ...]]] = [
+            (cabeca, tuple(corpo))
+            for cabeca, corpos in gramatica.producoes.items() for corpo in corpos
+        ]
+        self._por_cabeca: Dict[str, List[int]] = {}
+        for indice, (cabeca, _) in enumerate(self._producoes):
+            self._por_cabeca.setdefault(cabeca, []).append(indice)
+        self._anulaveis = gramatica.anulaveis()
+
+        self._cadeia = ""
+        # Para cada posição: (itens, itens que esperam cada símbolo)
+        self._conjuntos: List[Tuple[Set[Tuple[int, int, int]], Dict[str, List[Tuple[int, int, int]]]]] = []
+
+    def reconhecer(self, cadeia: str) -> bool:
+        """
+        Verifica se a cadeia pertence a L(G)
+
+        Args:
+            cadeia: Cadeia de terminais
+
+        Returns:
+            bool: True se aceita
+        """
+        comum = 0
+        limite = min(len(cadeia), len(self._cadeia), len(self._conjuntos) - 1)
+        while comum < limite and cadeia[comum] == self._cadeia[comum]:
+            comum += 1
+
+        self._cadeia = cadeia
+        if not self._conjuntos:
+            iniciais = [(p, 0, 0) for p in self._por_cabeca.get(self.gramatica.inicial, [])]
+            self._conjuntos.append(self._fechar(0, iniciais))
+        del self._conjuntos[comum + 1:]
+
+        for posicao in range(comum, len(cadeia)):
+            if cadeia[posicao] not in self.gramatica.terminais:
+                return False
+            itens, esperando = self._conjuntos[posicao]
+            avancados = [(p, ponto + 1, origem)
+                         for p, ponto, origem in esperando.get(cadeia[posicao], ())]
+            if not avancados:
+                return False
+            self._conjuntos.append(self._fechar(posicao + 1, avancados))
+
+        itens, _ = self._conjuntos[len(cadeia)]
+        return any((p, len(self._producoes[p][1]), 0) in itens
+                   for p in self._por_cabeca.get(self.gramatica.inicial, []))
+
+    def _fechar(self, posicao: int, sementes: List[Tuple[int, int, int]]):
+        """Aplica predição e completamento até o conjunto estabilizar"""
+        itens: Set[Tuple[int, int, int]] = set()
+        esperando: Dict[str, List[Tuple[int, int, int]]] = {}
+        pendentes = []
+
+        def adicionar(item):
+            if item not in itens:
+                itens.add(item)
+                pendentes.append(item)
+
+        for item in sementes:
+            adicionar(item)
+
+        while pendentes:
+            item = pendentes.pop()
+            p, ponto, origem = item
+            cabeca, corpo = self._producoes[p]
+
+            if ponto < len(corpo):
+                proximo = corpo[ponto]
+                esperando.setdefault(proximo, []).append(item)
+                if proximo in self.gramatica.variaveis:
+                    # Predição
+                    for q in self._por_cabeca.get(proximo, []):
+                        adicionar((q, 0, posicao))
+                    if proximo in self._anulaveis:
+                        adicionar((p, ponto + 1, origem))
+                    # Completamentos que já ocorreram nesta posição
+                    elif any((q, len(self._producoes[q][1]), posicao) in itens
+                             for q in self._por_cabeca.get(proximo, [])):
+                        adicionar((p, ponto + 1, origem))
+            else:
+                # Completamento
+                if origem == posicao:
+                    anteriores = esperando.get(cabeca, [])
+                else:
+                    anteriores = self._conjuntos[origem][1].get(cabeca, [])
+                for q, ponto_q, origem_q in list(anteriores):
+                    adicionar((q, ponto_q + 1, origem_q))
+
+        return itens, esperando
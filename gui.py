@@ -9,6 +9,7 @@ from typing import Optional
 
 from criador_automatos import CriadorAutomatos
 from automato_base import AutomatoBase
+from rastro_execucao import Rastro
 
 
 class SimuladorAutomatos:
@@ -27,6 +28,7 @@ class SimuladorAutomatos:
 
         self.automato_sel = tk.StringVar(value="AFD")
         self.automato: Optional[AutomatoBase] = None
+        self.rastro: Optional[Rastro] = None
         self.criador = CriadorAutomatos()
 
         self.criar_interface()
@@ -135,6 +137,11 @@ class SimuladorAutomatos:
         btn_simular = ttk.Button(frame, text="Simular", command=self.simular)
         btn_simular.pack(fill=tk.X, pady=5)
 
+        # Só o APD grava rastro; o botão acompanha o tipo selecionado
+        self.btn_rastrear = ttk.Button(frame, text="Passo a passo (APD)", command=self.rastrear)
+        self.btn_rastrear.pack(fill=tk.X, pady=5)
+        self._atualizar_botao_rastro()
+
         btn_limpar = ttk.Button(frame, text="Limpar", command=self.limpar)
         btn_limpar.pack(fill=tk.X, pady=5)
 
@@ -143,12 +150,32 @@ class SimuladorAutomatos:
         frame = ttk.LabelFrame(parent, text="Resultado da Simulacao", padding="10")
         frame.grid(row=3, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
 
+        self.criar_barra_navegacao(frame)
+
         self.resultado_text = scrolledtext.ScrolledText(frame, height=12, width=100, wrap=tk.WORD)
         self.resultado_text.pack(fill=(tk.BOTH), expand=True)
 
         self.resultado_text.tag_config("aceita", foreground="green", font=("Arial", 10, "bold"))
         self.resultado_text.tag_config("rejeita", foreground="red", font=("Arial", 10, "bold"))
 
+    def criar_barra_navegacao(self, parent):
+        """Controles para percorrer o rastro da execucao passo a passo"""
+        barra = ttk.Frame(parent)
+        barra.pack(fill=tk.X, pady=(0, 5))
+
+        ttk.Button(barra, text="|<", width=4, command=lambda: self._ir_para_passo(0)).pack(side=tk.LEFT)
+        ttk.Button(barra, text="< Anterior", command=lambda: self._mover_passo(-1)).pack(side=tk.LEFT, padx=2)
+        ttk.Button(barra, text="Proximo >", command=lambda: self._mover_passo(1)).pack(side=tk.LEFT, padx=2)
+        ttk.Button(barra, text=">|", width=4,
+                   command=lambda: self._ir_para_passo(self.rastro.passos if self.rastro else 0)).pack(side=tk.LEFT)
+
+        self.escala_passo = ttk.Scale(barra, from_=0, to=0, orient=tk.HORIZONTAL,
+                                      command=lambda valor: self._ir_para_passo(int(float(valor))))
+        self.escala_passo.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=10)
+
+        self.rotulo_passo = ttk.Label(barra, text="Passo -", width=20)
+        self.rotulo_passo.pack(side=tk.LEFT)
+
     def atualizar_entrada(self):
         """Atualiza o exemplo conforme o tipo de automato selecionado e limpa a interface"""
         tipo = self.automato_sel.get()
@@ -168,6 +195,8 @@ class SimuladorAutomatos:
 
         # Resetar automato
         self.automato = None
+        self._descartar_rastro()
+        self._atualizar_botao_rastro()
 
         # Carregar exemplo conforme tipo
         if tipo == "AFD":
@@ -231,6 +260,7 @@ class SimuladorAutomatos:
 
         cadeia = self.entrada_cadeia.get()
         tipo = self.automato_sel.get()
+        self._descartar_rastro()
 
         self.resultado_text.config(state=tk.NORMAL)
         self.resultado_text.delete(1.0, tk.END)
@@ -244,7 +274,54 @@ class SimuladorAutomatos:
         else:
             self.resultado_text.insert(tk.END, f"Cadeia: '{cadeia}'\n\n")
 
-        for linha in historico:
+        self._exibir_linhas(historico)
+
+    def rastrear(self):
+        """Grava a execucao e mostra o passo 0; a barra de navegacao percorre os demais"""
+        if self.automato is None:
+            messagebox.showwarning("Aviso", "Crie um automato antes de simular!")
+            return
+
+        self.rastro = self.automato.rastrear(self.entrada_cadeia.get())
+        self.escala_passo.config(to=self.rastro.passos)
+        self._exibir_passo()
+
+    def _atualizar_botao_rastro(self):
+        """Habilita o passo a passo apenas para o APD"""
+        estado = tk.NORMAL if self.automato_sel.get() == "APD" else tk.DISABLED
+        self.btn_rastrear.config(state=estado)
+
+    def _mover_passo(self, deslocamento: int):
+        if self.rastro is not None:
+            self._ir_para_passo(self.rastro.passo_atual + deslocamento)
+
+    def _ir_para_passo(self, passo: int):
+        """Move o cursor do rastro (limitado ao intervalo gravado) e exibe o passo"""
+        if self.rastro is None:
+            return
+        passo = min(max(passo, 0), self.rastro.passos)
+        if passo != self.rastro.passo_atual:
+            self.rastro.ir_para(passo)
+            self._exibir_passo()
+
+    def _exibir_passo(self):
+        """Mostra a configuracao sob o cursor do rastro"""
+        passo = self.rastro.passo_atual
+        self.escala_passo.set(passo)
+        self.rotulo_passo.config(text=f"Passo {passo} de {self.rastro.passos}")
+        self.resultado_text.config(state=tk.NORMAL)
+        self.resultado_text.delete(1.0, tk.END)
+        self._exibir_linhas(self.rastro.descrever())
+
+    def _descartar_rastro(self):
+        self.rastro = None
+        self.escala_passo.config(to=0)
+        self.escala_passo.set(0)
+        self.rotulo_passo.config(text="Passo -")
+
+    def _exibir_linhas(self, linhas):
+        """Insere as linhas no resultado, destacando aceitacao e rejeicao"""
+        for linha in linhas:
             if "ACEITA" in linha:
                 self.resultado_text.insert(tk.END, linha + "\n", "aceita")
             elif "REJEITADA" in linha:
@@ -257,6 +334,7 @@ class SimuladorAutomatos:
     def limpar(self):
         """Limpa os campos"""
         self.entrada_cadeia.delete(0, tk.END)
+        self._descartar_rastro()
         self.resultado_text.config(state=tk.NORMAL)
         self.resultado_text.delete(1.0, tk.END)
         self.resultado_text.config(state=tk.DISABLED)
@@ -15,22 +15,66 @@ Onde:
 - F: conjunto de estados finais (aceitação)
 """
 
+import gzip
+import hashlib
+import json
 import tkinter as tk
+from abc import ABC, abstractmethod
 from tkinter import ttk, messagebox, scrolledtext
-from typing import Optional, Dict, Set, Tuple, List
+from typing import Optional, Dict, Set, Tuple, List, Union
 
+from automato_base import CONFIGURACOES_POR_FATIA, alcancaveis, concluir
+from fita_rle import FitaRLE
+from perfilador import Perfilador
+from rastro_execucao import Rastro
 
-class MaquinaTuring:
+
+class ExecucaoMT:
     """
-    Implementação de uma Máquina de Turing
+    Configuração de uma execução da Máquina de Turing
+
+    Cada simulação trabalha sobre a sua própria ExecucaoMT, de modo que a
+    mesma máquina pode ser simulada por várias threads ao mesmo tempo.
+
+    Atributos:
+        fita: células escritas (posição -> símbolo), em um dicionário ou
+              em uma FitaRLE
+        posicao: posição da cabeça
+        estado_atual: estado interno atual
+        passo: número de passos já executados
+    """
+
+    __slots__ = ("fita", "posicao", "estado_atual", "passo")
+
+    def __init__(self, estado: str, fita: Optional[Union[Dict[int, str], FitaRLE]] = None,
+                 posicao: int = 0, passo: int = 0):
+        self.fita = fita if fita is not None else {}
+        self.posicao = posicao
+        self.estado_atual = estado
+        self.passo = passo
+
+class MaquinaTuringBase(ABC):
+    """
+    Definição comum às Máquinas de Turing
     M = (Q, Σ, Γ, δ, q₀, ▢, F)
+
+    Reúne o que não depende da forma de δ nem da estratégia de simulação:
+    cabeçalho e visualização da fita do histórico, assinatura da definição
+    e análise de estados. A definição da máquina não é alterada pela
+    simulação, então a mesma instância pode ser simulada por várias threads
+    ao mesmo tempo.
     """
 
+    # A execução pode ser interrompida e retomada (continuar, checkpoint)
+    continuavel = False
+
     def __init__(self, Q: Set[str], Sigma: Set[str], Gamma: Set[str],
                  delta: Dict, q0: str, blank: str, F: Set[str]):
         """
         Inicializa a Máquina de Turing
 
+        A forma de delta depende da subclasse.
+
         Args:
             Q: conjunto de estados internos
             Sigma: alfabeto de entrada
@@ -48,28 +92,63 @@ class MaquinaTuring:
         self.blank = blank
         self.F = F
 
-        self.posicao = 0
-        self.fita = {}
-        self.estado_atual = q0
-
+    @abstractmethod
     def simular(self, cadeia: str, max_passos: int = 10000) -> Tuple[bool, List[str]]:
         """
-        Simula a execução da Máquina de Turing
-
-        Args:
-            cadeia: cadeia de entrada
-            max_passos: máximo de passos para evitar loops infinitos
+        Simula a execução da máquina
 
         Returns:
             Tupla (aceita, histórico)
         """
-        self.fita = {}
-        self.posicao = 0
-        self.estado_atual = self.q0
+        pass
+
+    def _assinatura(self) -> str:
+        """Hash SHA-256 da definição formal da máquina (a mesma 7-upla do cabeçalho do histórico)"""
+        definicao = [sorted(self.Q), sorted(self.Sigma), sorted(self.Gamma), self.q0, self.blank,
+                     sorted(self.F),
+                     sorted([list(chave), valor] for chave, valor in self.delta.items())]
+        texto = json.dumps(definicao, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+    @abstractmethod
+    def _arestas(self):
+        """Pares (origem, destino) das transições"""
+        pass
+
+    def estados_alcancaveis(self) -> Set[str]:
+        """Estados alcançáveis a partir de q0 (ignorando o conteúdo da fita)"""
+        return alcancaveis([self.q0], self._arestas())
+
+    def estados_coalcancaveis(self) -> Set[str]:
+        """Estados a partir dos quais algum estado de F é alcançável"""
+        return alcancaveis(self.F, ((destino, origem) for origem, destino in self._arestas()))
+
+    def estados_uteis(self) -> Set[str]:
+        """Estados alcançáveis e coalcançáveis"""
+        return self.estados_alcancaveis() & self.estados_coalcancaveis()
+
+    def podar(self) -> 'MaquinaTuringBase':
+        """
+        Retorna uma máquina equivalente sem estados inalcançáveis ou mortos
 
-        for i, simbolo in enumerate(cadeia):
-            self.fita[i] = simbolo
+        A linguagem aceita é a mesma. Uma computação que entraria em um
+        estado morto passa a parar por falta de transição, em vez de
+        continuar (possivelmente para sempre) sem nunca aceitar.
 
+        Returns:
+            MaquinaTuringBase: Máquina do mesmo tipo com apenas os estados úteis
+        """
+        uteis = self.estados_uteis() | {self.q0}
+        return type(self)(uteis, set(self.Sigma), set(self.Gamma), self._podar_delta(uteis),
+                          self.q0, self.blank, self.F & uteis)
+
+    @abstractmethod
+    def _podar_delta(self, uteis: Set[str]) -> Dict:
+        """Transições entre estados de `uteis`"""
+        pass
+
+    def _cabecalho_historico(self, cadeia: str) -> List[str]:
+        """Gera as linhas iniciais do histórico (definição formal e entrada)"""
         historico = []
         historico.append("SIMULACAO DE MAQUINA DE TURING")
         historico.append("M = (Q, Sigma, Gamma, delta, q0, blank, F)")
@@ -96,76 +175,596 @@ class MaquinaTuring:
         historico.append("")
         historico.append("-" * 70)
 
-        passo = 0
-        while passo < max_passos:
-            simbolo_lido = self.fita.get(self.posicao, self.blank)
+        return historico
+
+    @staticmethod
+    def _limites_fita(fita: Union[Dict[int, str], FitaRLE]) -> Tuple[int, int]:
+        """Menor célula escrita e a posição seguinte à maior ((0, 0) se vazia)"""
+        if isinstance(fita, FitaRLE):
+            return (fita.inicio, fita.fim) if fita else (0, 0)
+        return (min(fita), max(fita) + 1) if fita else (0, 0)
 
-            fita_visual = self._gerar_visualizacao_fita()
+    def _gerar_visualizacao_fita(self, execucao: ExecucaoMT, intervalo: int = 10) -> str:
+        """Gera visualização da fita ao redor da posição atual da execução"""
+        fita, posicao = execucao.fita, execucao.posicao
+        inicio = max(posicao - intervalo, self._limites_fita(fita)[0])
+        fim = posicao + intervalo + 1
+
+        fita_visual = "["
+        for i in range(inicio, fim):
+            simbolo = fita.get(i, self.blank)
+            if i == posicao:
+                fita_visual += f"[{simbolo}]"
+            else:
+                fita_visual += f" {simbolo} "
+        fita_visual += "]"
+
+        return fita_visual
+
+    def __str__(self) -> str:
+        """Representação em string da máquina"""
+        return (f"{self.__class__.__name__}\n"
+                f"Estados: {self.Q}\n"
+                f"Alfabeto de entrada: {self.Sigma}\n"
+                f"Alfabeto da fita: {self.Gamma}\n"
+                f"Estado inicial: {self.q0}\n"
+                f"Estados finais: {self.F}\n"
+                f"Número de transições: {len(self.delta)}")
+
+
+class MaquinaTuring(MaquinaTuringBase):
+    """
+    Implementação de uma Máquina de Turing
+    δ: Q × Γ → Q × Γ × {L, R}
+
+    A configuração de cada execução fica em uma ExecucaoMT, devolvida por
+    executar() e passada explicitamente a continuar() e salvar_checkpoint();
+    a máquina não guarda estado de execução.
+    """
+
+    continuavel = True
+
+    def simular(self, cadeia: str, max_passos: int = 10000,
+                perfilador: Optional[Perfilador] = None,
+                rle: bool = False) -> Tuple[bool, List[str]]:
+        """
+        Simula a execução da Máquina de Turing
+
+        Para retomar a execução depois (continuar, salvar_checkpoint), use
+        executar(), que devolve também a configuração final.
+
+        Args:
+            cadeia: cadeia de entrada
+            max_passos: máximo de passos para evitar loops infinitos
+            perfilador: coletor opcional de contadores de execução
+            rle: usa a fita codificada por trechos (FitaRLE) com avanço
+                 rápido: uma transição δ(q, a) = (q, b, D) aplicada sobre um
+                 trecho de a's é executada de uma vez e registrada como um
+                 único bloco no histórico
+
+        Returns:
+            Tupla (aceita, histórico)
+        """
+        aceita, historico, _ = self.executar(cadeia, max_passos, perfilador, rle)
+        return aceita, historico
+
+    def executar(self, cadeia: str, max_passos: int = 10000,
+                 perfilador: Optional[Perfilador] = None,
+                 rle: bool = False) -> Tuple[bool, List[str], ExecucaoMT]:
+        """
+        Como simular, devolvendo também a configuração em que a execução parou
+
+        Args:
+            cadeia: cadeia de entrada
+            max_passos: máximo de passos para evitar loops infinitos
+            perfilador: coletor opcional de contadores de execução
+            rle: usa a fita codificada por trechos (FitaRLE), como no simular
+
+        Returns:
+            Tupla (aceita, histórico, execução)
+        """
+        execucao, historico = self._iniciar(cadeia, rle)
+        if perfilador is not None:
+            perfilador.iniciar_execucao()
+        aceita, historico = self._executar(execucao, historico, max_passos, perfilador)
+        return aceita, historico, execucao
+
+    def _iniciar(self, cadeia: str, rle: bool = False) -> Tuple[ExecucaoMT, List[str]]:
+        """Cria a configuração inicial para `cadeia` e gera o cabeçalho do histórico"""
+        fita = FitaRLE(self.blank, cadeia) if rle else dict(enumerate(cadeia))
+        execucao = ExecucaoMT(self.q0, fita)
+        return execucao, self._cabecalho_historico(cadeia)
+
+    def continuar(self, execucao: ExecucaoMT, max_passos: int = 10000,
+                  perfilador: Optional[Perfilador] = None) -> Tuple[bool, List[str]]:
+        """
+        Continua uma execução a partir da configuração em que ela parou
+
+        Permite estender uma execução que atingiu o limite de passos (ou que
+        foi restaurada com carregar_checkpoint) sem refazer os passos já dados.
+
+        Args:
+            execucao: execução a continuar (de executar ou carregar_checkpoint);
+                      é atualizada no lugar
+            max_passos: número máximo de passos adicionais
+            perfilador: coletor opcional de contadores de execução
+
+        Returns:
+            Tupla (aceita, histórico dos novos passos)
+        """
+        historico = [f"CONTINUANDO A PARTIR DO PASSO {execucao.passo}", "-" * 70]
+        return self._executar(execucao, historico, max_passos, perfilador)
+
+    def rastrear(self, cadeia: str, intervalo: int = 500,
+                 max_passos: int = 10000) -> 'RastroMT':
+        """
+        Executa a máquina gravando um rastro navegável passo a passo
+
+        Não gera histórico: guarda apenas o delta de cada passo e um
+        instantâneo da fita a cada `intervalo` passos (ver rastro_execucao).
+
+        Args:
+            cadeia: cadeia de entrada
+            intervalo: passos entre dois instantâneos da fita
+            max_passos: máximo de passos para evitar loops infinitos
+
+        Returns:
+            RastroMT: Rastro com o cursor no passo 0
+        """
+        return RastroMT(self, cadeia, max_passos, intervalo)
+
+    def _executar(self, execucao: ExecucaoMT, historico: List[str], max_passos: int,
+                  perfilador: Optional[Perfilador] = None) -> Tuple[bool, List[str]]:
+        """Executa até max_passos passos a partir da configuração atual"""
+        aceita = self._executar_passos(execucao, historico, max_passos, perfilador)
+        if aceita is not None:
+            return aceita, historico
+
+        historico.append("")
+        historico.append("CADEIA REJEITADA")
+        historico.append("LOOPING INFINITO DETECTADO")
+        historico.append(f"Excedeu o maximo de {max_passos} passos")
+        return False, historico
+
+    def _executar_passos(self, execucao: ExecucaoMT, historico: List[str], max_passos: int,
+                         perfilador: Optional[Perfilador] = None) -> Optional[bool]:
+        """
+        Laço principal da execução
+
+        Returns:
+            Optional[bool]: True/False se a máquina parou (aceitando ou não),
+            None se o limite de passos foi atingido antes da parada
+        """
+        fita = execucao.fita
+        avanco_rapido = isinstance(fita, FitaRLE)
+        limite = execucao.passo + max_passos
+        while execucao.passo < limite:
+            passo = execucao.passo
+            estado_atual, posicao = execucao.estado_atual, execucao.posicao
+            simbolo_lido = fita.get(posicao, self.blank)
+
+            fita_visual = self._gerar_visualizacao_fita(execucao)
             historico.append(f"\nPASSO {passo}:")
             historico.append(f"  Fita: {fita_visual}")
-            historico.append(f"  Estado: {self.estado_atual} | Posicao: {self.posicao} | Lido: '{simbolo_lido}'")
+            historico.append(f"  Estado: {estado_atual} | Posicao: {posicao} | Lido: '{simbolo_lido}'")
+            if perfilador is not None:
+                perfilador.registrar_estado(estado_atual)
+                perfilador.registrar_posicao(posicao)
 
-            if self.estado_atual in self.F:
+            if estado_atual in self.F:
                 historico.append("")
                 historico.append("CADEIA ACEITA")
-                historico.append(f"Estado de aceitacao atingido: {self.estado_atual}")
-                return True, historico
+                historico.append(f"Estado de aceitacao atingido: {estado_atual}")
+                return True
 
-            chave_transicao = (self.estado_atual, simbolo_lido)
+            chave_transicao = (estado_atual, simbolo_lido)
             if chave_transicao not in self.delta:
                 historico.append("")
                 historico.append("CADEIA REJEITADA")
-                historico.append(f"Nenhuma transicao definida para delta({self.estado_atual}, '{simbolo_lido}')")
-                return False, historico
+                historico.append(f"Nenhuma transicao definida para delta({estado_atual}, '{simbolo_lido}')")
+                return False
 
             novo_estado, novo_simbolo, direcao = self.delta[chave_transicao]
 
             if direcao not in ["L", "R"]:
                 raise ValueError(f"Direcao invalida: {direcao}. Use 'L' ou 'R'")
-
-            self.fita[self.posicao] = novo_simbolo
+            if perfilador is not None:
+                perfilador.registrar_transicao(chave_transicao)
+
+            if avanco_rapido and novo_estado == estado_atual:
+                vezes = self._avancar_trecho(execucao, simbolo_lido, novo_simbolo, direcao,
+                                             limite - passo)
+                if vezes > 1:
+                    if perfilador is not None:
+                        perfilador.registrar_estado(estado_atual, vezes - 1)
+                        perfilador.registrar_transicao(chave_transicao, vezes - 1)
+                        perfilador.registrar_posicao(posicao + vezes - 1 if direcao == "R"
+                                                     else posicao - vezes + 1)
+                    historico.append(f"  Acao: delta({estado_atual}, '{simbolo_lido}') = ({novo_estado}, '{novo_simbolo}', {direcao}) x {vezes}")
+                    historico.append(f"        Avanco rapido: {vezes} passos sobre o trecho de '{simbolo_lido}', Nova posicao: {execucao.posicao}")
+                    continue
+
+            fita[posicao] = novo_simbolo
             dir_nome = "Esquerda" if direcao == "L" else "Direita"
-            historico.append(f"  Acao: delta({self.estado_atual}, '{simbolo_lido}') = ({novo_estado}, '{novo_simbolo}', {direcao})")
+            historico.append(f"  Acao: delta({estado_atual}, '{simbolo_lido}') = ({novo_estado}, '{novo_simbolo}', {direcao})")
             historico.append(f"        Escrever '{novo_simbolo}', Mover {dir_nome}, Novo estado: {novo_estado}")
 
-            if direcao == "R":
-                self.posicao += 1
-            elif direcao == "L":
-                self.posicao -= 1
+            execucao.posicao = posicao + 1 if direcao == "R" else posicao - 1
+            execucao.estado_atual = novo_estado
+            execucao.passo += 1
+
+        return None
+
+    @staticmethod
+    def _avancar_trecho(execucao: ExecucaoMT, simbolo_lido: str, novo_simbolo: str,
+                        direcao: str, maximo: int) -> int:
+        """
+        Aplica de uma vez uma transição que mantém o estado sobre o trecho de
+        símbolos iguais à frente da cabeça (fita RLE)
 
-            self.estado_atual = novo_estado
+        Cada passo lê `simbolo_lido`, escreve `novo_simbolo` e move a cabeça
+        para a próxima célula do mesmo trecho, onde a mesma transição se
+        aplica de novo, até a cabeça sair do trecho.
+
+        Returns:
+            int: Número de passos aplicados (no máximo `maximo`); se for
+            menor que 2, a fita não é alterada
+        """
+        fita, posicao = execucao.fita, execucao.posicao
+        inicio, fim, _ = fita.trecho(posicao)
+        if direcao == "R":
+            vezes = maximo if fim is None else min(fim - posicao, maximo)
+            if vezes > 1:
+                fita.preencher(posicao, posicao + vezes, novo_simbolo)
+                execucao.posicao = posicao + vezes
+        else:
+            vezes = maximo if inicio is None else min(posicao - inicio + 1, maximo)
+            if vezes > 1:
+                fita.preencher(posicao - vezes + 1, posicao + 1, novo_simbolo)
+                execucao.posicao = posicao - vezes
+        if vezes > 1:
+            execucao.passo += vezes
+        return vezes
+
+    def _arestas(self):
+        """Pares (origem, destino) das transições"""
+        return ((estado, movimento[0]) for (estado, _), movimento in self.delta.items())
+
+    def _podar_delta(self, uteis: Set[str]) -> Dict:
+        """Transições entre estados de `uteis`"""
+        return {chave: movimento for chave, movimento in self.delta.items()
+                if chave[0] in uteis and movimento[0] in uteis}
+
+    def salvar_checkpoint(self, caminho: str, execucao: ExecucaoMT):
+        """
+        Salva a configuração de uma execução (estado, posição, fita e passo)
+        em um arquivo JSON compactado com gzip
+
+        A fita em dicionário é gravada como pares (posicao, simbolo) das
+        células não brancas, de modo que o tamanho do arquivo não depende da
+        distância entre as células; uma FitaRLE é gravada como lista de
+        trechos (inicio, comprimento, simbolo). O arquivo guarda também uma
+        assinatura da definição da máquina, conferida em carregar_checkpoint.
+
+        Args:
+            caminho: caminho do arquivo de checkpoint
+            execucao: execução a salvar
+        """
+        fita = execucao.fita
+        dados = {
+            "versao": 2,
+            "assinatura": self._assinatura(),
+            "estado": execucao.estado_atual,
+            "posicao": execucao.posicao,
+            "passo": execucao.passo,
+        }
+        if isinstance(fita, FitaRLE):
+            dados["trechos"] = [list(trecho) for trecho in fita.trechos()]
+        else:
+            dados["celulas"] = sorted([posicao, simbolo] for posicao, simbolo in fita.items()
+                                      if simbolo != self.blank)
+        with gzip.open(caminho, "wt", encoding="utf-8") as arquivo:
+            json.dump(dados, arquivo, ensure_ascii=False, separators=(",", ":"))
+
+    def carregar_checkpoint(self, caminho: str) -> ExecucaoMT:
+        """
+        Restaura a configuração salva por salvar_checkpoint
+
+        Use continuar() com a execução restaurada para retomá-la.
+
+        Args:
+            caminho: caminho do arquivo de checkpoint
+
+        Returns:
+            ExecucaoMT: execução restaurada
+
+        Raises:
+            ValueError: Se o checkpoint pertencer a outra máquina
+        """
+        with gzip.open(caminho, "rt", encoding="utf-8") as arquivo:
+            dados = json.load(arquivo)
+
+        if dados.get("versao") != 2:
+            raise ValueError(f"Versao de checkpoint nao suportada: {dados.get('versao')}")
+        if dados["assinatura"] != self._assinatura():
+            raise ValueError("Checkpoint foi gerado por outra Maquina de Turing")
+
+        if "trechos" in dados:
+            fita = FitaRLE.de_trechos(self.blank, dados["trechos"])
+        else:
+            fita = {posicao: simbolo for posicao, simbolo in dados["celulas"]}
+        return ExecucaoMT(dados["estado"], fita, dados["posicao"], dados["passo"])
+
+
+class MaquinaTuringNaoDeterministica(MaquinaTuringBase):
+    """
+    Implementação de uma Máquina de Turing Não-Determinística
+    δ: Q × Γ → P(Q × Γ × {L, R})
+
+    Cada chave (estado, símbolo) de delta mapeia para uma lista de movimentos.
+    A simulação explora as configurações em largura (BFS), descartando
+    configurações idênticas (estado, posição e fita) já visitadas. Como a
+    busca não tem uma configuração única, não há continuar, checkpoints
+    nem rastro (só na MaquinaTuring determinística).
+    """
+
+    def simular(self, cadeia: str, max_passos: int = 10000,
+                max_configuracoes: int = 100000,
+                perfilador: Optional[Perfilador] = None) -> Tuple[bool, List[str]]:
+        """
+        Simula a execução da Máquina de Turing Não-Determinística
+
+        Args:
+            cadeia: cadeia de entrada
+            max_passos: profundidade máxima da busca (passos de cada ramificação)
+            max_configuracoes: máximo de configurações distintas mantidas em memória
+            perfilador: coletor opcional de contadores de execução
+
+        Returns:
+            Tupla (aceita, histórico). Em caso de aceitação, o histórico mostra
+            o caminho de configurações que leva ao estado de aceitação.
+        """
+        return concluir(self._simular_fatias(cadeia, CONFIGURACOES_POR_FATIA, max_passos,
+                                             max_configuracoes, perfilador))
+
+    def _simular_fatias(self, cadeia: str, fatia: int, max_passos: int = 10000,
+                        max_configuracoes: int = 100000,
+                        perfilador: Optional[Perfilador] = None):
+        """simular em fatias de `fatia` configurações expandidas (ver concluir)"""
+        historico = self._cabecalho_historico(cadeia)
+
+        inicial = (self.q0, 0, self._congelar_fita(dict(enumerate(cadeia))))
+        # Configuração -> (configuração anterior, movimento aplicado)
+        anteriores = {inicial: None}
+        nivel = [inicial]
+        if perfilador is not None:
+            perfilador.iniciar_execucao()
+
+        passo = 0
+        expandidas = 0
+        while nivel:
+            for configuracao in nivel:
+                if configuracao[0] in self.F:
+                    historico.extend(self._caminho_historico(configuracao, anteriores))
+                    historico.append("")
+                    historico.append("CADEIA ACEITA")
+                    historico.append(f"Estado de aceitacao atingido: {configuracao[0]}")
+                    historico.append(f"Configuracoes exploradas: {len(anteriores)}")
+                    return True, historico
+
+            if passo >= max_passos:
+                historico.append("")
+                historico.append("CADEIA REJEITADA")
+                historico.append("LOOPING INFINITO DETECTADO")
+                historico.append(f"Excedeu o maximo de {max_passos} passos")
+                return False, historico
+
+            proximo_nivel = []
+            for configuracao in nivel:
+                expandidas += 1
+                if expandidas % fatia == 0:
+                    yield
+                estado, posicao, fita_congelada = configuracao
+                fita = dict(fita_congelada)
+                simbolo_lido = fita.get(posicao, self.blank)
+                if perfilador is not None:
+                    perfilador.registrar_estado(estado)
+                    perfilador.registrar_posicao(posicao)
+
+                for movimento in self.delta.get((estado, simbolo_lido), ()):
+                    novo_estado, novo_simbolo, direcao = movimento
+                    if direcao not in ["L", "R"]:
+                        raise ValueError(f"Direcao invalida: {direcao}. Use 'L' ou 'R'")
+                    if perfilador is not None:
+                        perfilador.registrar_transicao((estado, simbolo_lido))
+
+                    nova_fita = dict(fita)
+                    nova_fita[posicao] = novo_simbolo
+                    nova_posicao = posicao + 1 if direcao == "R" else posicao - 1
+                    nova = (novo_estado, nova_posicao, self._congelar_fita(nova_fita))
+
+                    if nova in anteriores:
+                        continue
+                    if len(anteriores) >= max_configuracoes:
+                        historico.append("")
+                        historico.append("CADEIA REJEITADA")
+                        historico.append(f"Excedeu o maximo de {max_configuracoes} configuracoes")
+                        return False, historico
+
+                    anteriores[nova] = (configuracao, movimento)
+                    proximo_nivel.append(nova)
+
+            historico.append(f"NIVEL {passo + 1}: {len(proximo_nivel)} novas configuracoes")
+            nivel = proximo_nivel
             passo += 1
 
         historico.append("")
         historico.append("CADEIA REJEITADA")
-        historico.append("LOOPING INFINITO DETECTADO")
-        historico.append(f"Excedeu o maximo de {max_passos} passos")
+        historico.append("Todas as ramificacoes pararam sem atingir estado de aceitacao")
         return False, historico
 
-    def _gerar_visualizacao_fita(self, intervalo: int = 10) -> str:
-        """Gera visualização da fita ao redor da posição atual"""
-        inicio = max(self.posicao - intervalo, min(self.fita.keys()) if self.fita else 0)
-        fim = self.posicao + intervalo + 1
+    def _arestas(self):
+        return ((estado, movimento[0]) for (estado, _), movimentos in self.delta.items()
+                for movimento in movimentos)
 
-        fita_visual = "["
-        for i in range(inicio, fim):
-            simbolo = self.fita.get(i, self.blank)
-            if i == self.posicao:
-                fita_visual += f"[{simbolo}]"
-            else:
-                fita_visual += f" {simbolo} "
-        fita_visual += "]"
+    def _podar_delta(self, uteis: Set[str]) -> Dict:
+        delta = {}
+        for chave, movimentos in self.delta.items():
+            restantes = [movimento for movimento in movimentos if movimento[0] in uteis]
+            if chave[0] in uteis and restantes:
+                delta[chave] = restantes
+        return delta
+
+    def _congelar_fita(self, fita: Dict[int, str]) -> frozenset:
+        """Representação imutável e canônica da fita (células brancas são omitidas)"""
+        return frozenset((i, s) for i, s in fita.items() if s != self.blank)
+
+    def _caminho_historico(self, configuracao: Tuple, anteriores: Dict) -> List[str]:
+        """Reconstrói o caminho de configurações até `configuracao`"""
+        caminho = []
+        while configuracao is not None:
+            origem = anteriores[configuracao]
+            caminho.append((configuracao, origem[1] if origem else None))
+            configuracao = origem[0] if origem else None
+        caminho.reverse()
+
+        linhas = ["", "CAMINHO DE ACEITACAO:"]
+        for passo, ((estado, posicao, fita_congelada), _) in enumerate(caminho):
+            execucao = ExecucaoMT(estado, dict(fita_congelada), posicao, passo)
+            simbolo_lido = execucao.fita.get(posicao, self.blank)
+            linhas.append(f"\nPASSO {passo}:")
+            linhas.append(f"  Fita: {self._gerar_visualizacao_fita(execucao)}")
+            linhas.append(f"  Estado: {estado} | Posicao: {posicao} | Lido: '{simbolo_lido}'")
+            if passo + 1 < len(caminho):
+                novo_estado, novo_simbolo, direcao = caminho[passo + 1][1]
+                linhas.append(f"  Acao: ({estado}, '{simbolo_lido}') -> "
+                              f"({novo_estado}, '{novo_simbolo}', {direcao})")
+        return linhas
+
+
+class RastroMT(Rastro):
+    """
+    Rastro de uma Máquina de Turing determinística
 
-        return fita_visual
+    Por passo são guardados o estado e a posição da cabeça seguintes, o
+    símbolo escrito e o símbolo que estava na célula (None se ela ainda não
+    tinha sido escrita). As configurações são ExecucaoMT com fita em
+    dicionário, como no simular.
+    """
+
+    def __init__(self, maquina, cadeia: str, max_passos: int = 10000, intervalo: int = 500):
+        """
+        Executa a máquina gravando o rastro
+
+        Args:
+            maquina: MaquinaTuring determinística
+            cadeia: Cadeia de entrada
+            max_passos: Máximo de passos, como no simular
+            intervalo: Passos entre dois instantâneos da fita
+        """
+        super().__init__(intervalo)
+        self.maquina = maquina
+        self._lidos: List[Optional[str]] = []
+        self._escritos: List[str] = []
+        self._gravar(cadeia, max_passos)
+        self._cursor = self._de_instantaneo(0)
+
+    def _gravar(self, cadeia: str, max_passos: int):
+        maquina = self.maquina
+        delta, finais, branco = maquina.delta, maquina.F, maquina.blank
+        estados, posicoes = self._estados, self._posicoes
+        lidos, escritos = self._lidos, self._escritos
+        fita: Dict[int, str] = dict(enumerate(cadeia))
+        estado, posicao = maquina.q0, 0
+        estados.append(estado)
+        posicoes.append(posicao)
+
+        while True:
+            if self._em_instantaneo():
+                self._instantaneos.append(self._congelar(fita))
+            simbolo_lido = fita.get(posicao, branco)
+            if estado in finais:
+                self.aceita = True
+                self.motivo = f"Estado de aceitacao atingido: {estado}"
+                return
+            if self.passos == max_passos:
+                self.motivo = f"LOOPING INFINITO DETECTADO - Excedeu o maximo de {max_passos} passos"
+                return
+            movimento = delta.get((estado, simbolo_lido))
+            if movimento is None:
+                self.motivo = f"Nenhuma transicao definida para delta({estado}, '{simbolo_lido}')"
+                return
+
+            estado, novo_simbolo, direcao = movimento
+            if direcao not in ["L", "R"]:
+                raise ValueError(f"Direcao invalida: {direcao}. Use 'L' ou 'R'")
+            lidos.append(fita.get(posicao))
+            escritos.append(novo_simbolo)
+            fita[posicao] = novo_simbolo
+            posicao = posicao + 1 if direcao == "R" else posicao - 1
+            estados.append(estado)
+            posicoes.append(posicao)
+
+    @staticmethod
+    def _congelar(fita: Dict[int, str]) -> Tuple[int, Tuple[str, ...]]:
+        """Instantâneo da fita: (primeira célula, símbolos); as células escritas são contíguas"""
+        if not fita:
+            return 0, ()
+        inicio = min(fita)
+        return inicio, tuple(fita[i] for i in range(inicio, inicio + len(fita)))
+
+    def _de_instantaneo(self, passo: int) -> ExecucaoMT:
+        inicio, simbolos = self._instantaneos[passo // self.intervalo]
+        fita = dict(zip(range(inicio, inicio + len(simbolos)), simbolos))
+        return ExecucaoMT(self._estados[passo], fita, self._posicoes[passo], passo)
+
+    def _aplicar(self, execucao: ExecucaoMT, passo: int):
+        execucao.fita[self._posicoes[passo]] = self._escritos[passo]
+        execucao.estado_atual = self._estados[passo + 1]
+        execucao.posicao = self._posicoes[passo + 1]
+        execucao.passo = passo + 1
+
+    def _desfazer(self, execucao: ExecucaoMT, passo: int):
+        posicao, lido = self._posicoes[passo], self._lidos[passo]
+        if lido is None:
+            del execucao.fita[posicao]
+        else:
+            execucao.fita[posicao] = lido
+        execucao.estado_atual = self._estados[passo]
+        execucao.posicao = posicao
+        execucao.passo = passo
+
+    def descrever(self) -> List[str]:
+        """Linhas que descrevem o passo sob o cursor, no formato do histórico"""
+        maquina, execucao = self.maquina, self._cursor
+        passo, estado, posicao = execucao.passo, execucao.estado_atual, execucao.posicao
+        simbolo_lido = execucao.fita.get(posicao, maquina.blank)
+        linhas = [f"PASSO {passo} de {self.passos}:",
+                  f"  Fita: {maquina._gerar_visualizacao_fita(execucao)}",
+                  f"  Estado: {estado} | Posicao: {posicao} | Lido: '{simbolo_lido}'"]
+        if passo < self.passos:
+            novo_estado, novo_simbolo = self._estados[passo + 1], self._escritos[passo]
+            direcao = "R" if self._posicoes[passo + 1] > posicao else "L"
+            linhas.append(f"  Acao: delta({estado}, '{simbolo_lido}') = ({novo_estado}, '{novo_simbolo}', {direcao})")
+        else:
+            linhas.append("")
+            linhas.append("CADEIA ACEITA" if self.aceita else "CADEIA REJEITADA")
+            linhas.append(self.motivo)
+        return linhas
 
 
 class CriadorMaquinaTuring:
     """Cria instâncias de Máquinas de Turing a partir de entradas do usuário"""
 
     def criar_mt(self, Q_str: str, Sigma_str: str, Gamma_str: str,
-                 q0_str: str, F_str: str, delta_str: str, blank: str = "_") -> MaquinaTuring:
+                 q0_str: str, F_str: str, delta_str: str, blank: str = "_",
+                 nao_deterministica: bool = False) -> MaquinaTuringBase:
         """
         Cria uma Máquina de Turing a partir de strings de entrada
+
+        Com nao_deterministica=True, transições repetidas para o mesmo
+        (estado, símbolo) são acumuladas em uma lista de movimentos e a
+        máquina criada é uma MaquinaTuringNaoDeterministica.
         """
         Q = set(e.strip() for e in Q_str.split(",") if e.strip())
         Sigma = set(s.strip() for s in Sigma_str.split(",") if s.strip() and s.strip() != "epsilon")
@@ -193,8 +792,17 @@ class CriadorMaquinaTuring:
                     if direcao not in ["L", "R"]:
                         raise ValueError(f"Direcao invalida: {direcao}. Use 'L' ou 'R'")
 
-                    delta[(estado, simbolo)] = (novo_estado, novo_simbolo, direcao)
-
+                    movimento = (novo_estado, novo_simbolo, direcao)
+                    if nao_deterministica:
+                        delta.setdefault((estado, simbolo), []).append(movimento)
+                    elif (estado, simbolo) in delta:
+                        raise ValueError(f"Transicao duplicada delta({estado}, '{simbolo}'). "
+                                         f"Use o modo nao deterministico")
+                    else:
+                        delta[(estado, simbolo)] = movimento
+
+        if nao_deterministica:
+            return MaquinaTuringNaoDeterministica(Q, Sigma, Gamma, delta, q0, blank, F)
         return MaquinaTuring(Q, Sigma, Gamma, delta, q0, blank, F)
 
 
@@ -207,8 +815,11 @@ class SimuladorMaquinaTuring:
         self.root.title("Simulador de Maquina de Turing")
         self.root.geometry("1200x850")
 
-        self.maquina: Optional[MaquinaTuring] = None
+        self.maquina: Optional[MaquinaTuringBase] = None
+        self.execucao: Optional[ExecucaoMT] = None
+        self.rastro: Optional[RastroMT] = None
         self.criador = CriadorMaquinaTuring()
+        self.nao_deterministica = tk.BooleanVar(value=False)
 
         self.criar_interface()
 
@@ -277,6 +888,8 @@ class SimuladorMaquinaTuring:
         ttk.Button(btn_frame, text="Criar MT", command=self.criar_mt).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Exemplo 1 (a*b*)", command=self.carregar_exemplo1).pack(side=tk.LEFT, padx=5)
         ttk.Button(btn_frame, text="Exemplo 2 (0*)", command=self.carregar_exemplo2).pack(side=tk.LEFT, padx=5)
+        ttk.Checkbutton(btn_frame, text="Nao deterministica",
+                        variable=self.nao_deterministica).pack(side=tk.LEFT, padx=5)
 
         frame.columnconfigure(1, weight=1)
 
@@ -294,6 +907,12 @@ class SimuladorMaquinaTuring:
         btn_simular = ttk.Button(frame, text="Simular", command=self.simular)
         btn_simular.pack(fill=tk.X, pady=5)
 
+        btn_continuar = ttk.Button(frame, text="Continuar (+10000 passos)", command=self.continuar)
+        btn_continuar.pack(fill=tk.X, pady=5)
+
+        btn_rastrear = ttk.Button(frame, text="Passo a passo", command=self.rastrear)
+        btn_rastrear.pack(fill=tk.X, pady=5)
+
         btn_limpar = ttk.Button(frame, text="Limpar", command=self.limpar)
         btn_limpar.pack(fill=tk.X, pady=5)
 
@@ -302,12 +921,32 @@ class SimuladorMaquinaTuring:
         frame = ttk.LabelFrame(parent, text="Resultado da Simulacao", padding="10")
         frame.grid(row=2, column=0, columnspan=3, sticky=(tk.W, tk.E, tk.N, tk.S), pady=5)
 
+        self.criar_barra_navegacao(frame)
+
         self.resultado_text = scrolledtext.ScrolledText(frame, height=15, width=140, wrap=tk.WORD)
         self.resultado_text.pack(fill=(tk.BOTH), expand=True)
 
         self.resultado_text.tag_config("aceita", foreground="green", font=("Arial", 10, "bold"))
         self.resultado_text.tag_config("rejeita", foreground="red", font=("Arial", 10, "bold"))
 
+    def criar_barra_navegacao(self, parent):
+        """Controles para percorrer o rastro da execução passo a passo"""
+        barra = ttk.Frame(parent)
+        barra.pack(fill=tk.X, pady=(0, 5))
+
+        ttk.Button(barra, text="|<", width=4, command=lambda: self._ir_para_passo(0)).pack(side=tk.LEFT)
+        ttk.Button(barra, text="< Anterior", command=lambda: self._mover_passo(-1)).pack(side=tk.LEFT, padx=2)
+        ttk.Button(barra, text="Proximo >", command=lambda: self._mover_passo(1)).pack(side=tk.LEFT, padx=2)
+        ttk.Button(barra, text=">|", width=4,
+                   command=lambda: self._ir_para_passo(self.rastro.passos if self.rastro else 0)).pack(side=tk.LEFT)
+
+        self.escala_passo = ttk.Scale(barra, from_=0, to=0, orient=tk.HORIZONTAL,
+                                      command=lambda valor: self._ir_para_passo(int(float(valor))))
+        self.escala_passo.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=10)
+
+        self.rotulo_passo = ttk.Label(barra, text="Passo -", width=20)
+        self.rotulo_passo.pack(side=tk.LEFT)
+
     def criar_mt(self):
         """Cria a Máquina de Turing"""
         try:
@@ -319,8 +958,10 @@ class SimuladorMaquinaTuring:
             delta_str = self.entrada_delta.get(1.0, tk.END)
 
             self.maquina = self.criador.criar_mt(
-                Q_str, Sigma_str, Gamma_str, q0_str, F_str, delta_str
+                Q_str, Sigma_str, Gamma_str, q0_str, F_str, delta_str,
+                nao_deterministica=self.nao_deterministica.get()
             )
+            self.execucao = None
 
             messagebox.showinfo("Sucesso", "Maquina de Turing criada com sucesso!")
 
@@ -334,12 +975,85 @@ class SimuladorMaquinaTuring:
             return
 
         cadeia = self.entrada_cadeia.get()
+        self._descartar_rastro()
 
         self.resultado_text.config(state=tk.NORMAL)
         self.resultado_text.delete(1.0, tk.END)
 
-        aceita, historico = self.maquina.simular(cadeia)
+        if self.maquina.continuavel:
+            aceita, historico, self.execucao = self.maquina.executar(cadeia)
+        else:
+            aceita, historico = self.maquina.simular(cadeia)
+        self._exibir_historico(historico)
+
+    def rastrear(self):
+        """Grava a execução e mostra o passo 0; a barra de navegação percorre os demais"""
+        if self.maquina is None:
+            messagebox.showwarning("Aviso", "Crie uma Maquina de Turing antes de simular!")
+            return
+
+        if not isinstance(self.maquina, MaquinaTuring):
+            messagebox.showwarning("Aviso", "Rastro de execucao so e suportado na MT deterministica")
+            return
+
+        self.rastro = self.maquina.rastrear(self.entrada_cadeia.get())
+
+        self.escala_passo.config(to=self.rastro.passos)
+        self._exibir_passo()
+
+    def _mover_passo(self, deslocamento: int):
+        if self.rastro is not None:
+            self._ir_para_passo(self.rastro.passo_atual + deslocamento)
+
+    def _ir_para_passo(self, passo: int):
+        """Move o cursor do rastro (limitado ao intervalo gravado) e exibe o passo"""
+        if self.rastro is None:
+            return
+        passo = min(max(passo, 0), self.rastro.passos)
+        if passo != self.rastro.passo_atual:
+            self.rastro.ir_para(passo)
+            self._exibir_passo()
+
+    def _exibir_passo(self):
+        """Mostra a configuração sob o cursor do rastro"""
+        passo = self.rastro.passo_atual
+        self.escala_passo.set(passo)
+        self.rotulo_passo.config(text=f"Passo {passo} de {self.rastro.passos}")
+        self.resultado_text.config(state=tk.NORMAL)
+        self.resultado_text.delete(1.0, tk.END)
+        self._exibir_historico(self.rastro.descrever())
+
+    def _descartar_rastro(self):
+        self.rastro = None
+        self.escala_passo.config(to=0)
+        self.escala_passo.set(0)
+        self.rotulo_passo.config(text="Passo -")
+
+    def continuar(self):
+        """Continua a última simulação a partir de onde ela parou"""
+        if self.maquina is None:
+            messagebox.showwarning("Aviso", "Crie uma Maquina de Turing antes de simular!")
+            return
+
+        if not self.maquina.continuavel:
+            messagebox.showwarning("Aviso", "Continuacao so e suportada na MT deterministica")
+            return
+        if self.execucao is None:
+            messagebox.showwarning("Aviso", "Simule uma cadeia antes de continuar!")
+            return
+
+        aceita, historico = self.maquina.continuar(self.execucao)
 
+        self.resultado_text.config(state=tk.NORMAL)
+        if self.rastro is not None:
+            # O texto mostra um passo do rastro, não o histórico que está sendo continuado
+            self._descartar_rastro()
+            self.resultado_text.delete(1.0, tk.END)
+        self.resultado_text.insert(tk.END, "\n")
+        self._exibir_historico(historico)
+
+    def _exibir_historico(self, historico: List[str]):
+        """Insere as linhas do histórico no resultado, destacando aceitação e rejeição"""
         for linha in historico:
             if "ACEITA" in linha:
                 self.resultado_text.insert(tk.END, linha + "\n", "aceita")
@@ -353,6 +1067,7 @@ class SimuladorMaquinaTuring:
     def limpar(self):
         """Limpa os campos"""
         self.entrada_cadeia.delete(0, tk.END)
+        self._descartar_rastro()
         self.resultado_text.config(state=tk.NORMAL)
         self.resultado_text.delete(1.0, tk.END)
         self.resultado_text.config(state=tk.DISABLED)
@@ -0,0 +1,246 @@
+"""
+Módulo de representação compacta de autômatos finitos
+
+Para autômatos muito grandes (10^5 estados ou mais), os conjuntos de
+strings e os dicionários com chaves em tupla de AFD e AFN gastam a maior
+parte da memória com objetos Python. As classes deste módulo guardam o
+mesmo autômato com estados e símbolos numerados, transições em vetores
+(array) e os nomes apenas em tuplas auxiliares, usadas para exibição.
+
+As instâncias usam __slots__ e são imutáveis depois de criadas.
+"""
+
+import sys
+from array import array
+from typing import List, Sequence
+
+from afd import AFD, ProdutoAFD
+from afn import AFN
+from tokenizador import Tokenizador, precisa_tokenizar
+
+
+class _Imutavel:
+    """Base que impede atribuições depois do __init__"""
+
+    __slots__ = ()
+
+    def __setattr__(self, nome, valor):
+        raise AttributeError(f"{self.__class__.__name__} é imutável")
+
+    def _definir(self, **atributos):
+        for nome, valor in atributos.items():
+            object.__setattr__(self, nome, valor)
+
+
+class NucleoAFD(_Imutavel):
+    """
+    AFD compacto: tabela densa estados × símbolos em um único array
+
+    Atributos:
+        estados (Tuple[str, ...]): Nome de cada estado (índice = identificador)
+        simbolos (Tuple[str, ...]): Símbolos do alfabeto (índice = identificador)
+        inicial (int): Estado inicial
+        finais (bytes): finais[q] == 1 se q é final
+        transicoes (array): transicoes[q * len(simbolos) + a] = destino, ou -1
+    """
+
+    __slots__ = ("estados", "simbolos", "inicial", "finais", "transicoes",
+                 "_indice_simbolo", "_tokenizador")
+
+    def __init__(self, estados: Sequence[str], simbolos: Sequence[str], transicoes: array,
+                 inicial: int, finais: Sequence[int]):
+        """
+        Args:
+            estados: Nomes dos estados
+            simbolos: Símbolos do alfabeto
+            transicoes: Vetor 'i' de tamanho len(estados) * len(simbolos)
+            inicial: Índice do estado inicial
+            finais: Índices dos estados finais
+
+        Raises:
+            ValueError: Se as dimensões ou índices forem inválidos
+        """
+        if len(transicoes) != len(estados) * len(simbolos):
+            raise ValueError("Tabela de transições com dimensões incompatíveis")
+        if not 0 <= inicial < len(estados):
+            raise ValueError(f"Estado inicial {inicial} fora do intervalo")
+        marcas = bytearray(len(estados))
+        for estado in finais:
+            marcas[estado] = 1
+        simbolos = tuple(simbolos)
+        self._definir(
+            estados=tuple(estados), simbolos=simbolos, inicial=inicial,
+            finais=bytes(marcas), transicoes=transicoes,
+            _indice_simbolo={simbolo: i for i, simbolo in enumerate(simbolos)},
+            _tokenizador=Tokenizador(simbolos) if precisa_tokenizar(simbolos) else None,
+        )
+
+    @classmethod
+    def de_afd(cls, afd: AFD) -> 'NucleoAFD':
+        """Converte um AFD para a forma compacta"""
+        if isinstance(afd, ProdutoAFD):
+            afd = afd.materializar()
+        estados = sorted(afd.estados)
+        simbolos = sorted(afd.alfabeto)
+        id_estado = {estado: i for i, estado in enumerate(estados)}
+        id_simbolo = {simbolo: i for i, simbolo in enumerate(simbolos)}
+        largura = len(simbolos)
+        transicoes = array('i', [-1]) * (len(estados) * largura)
+        for (estado, simbolo), destino in afd.transicoes.items():
+            transicoes[id_estado[estado] * largura + id_simbolo[simbolo]] = id_estado[destino]
+        return cls(estados, simbolos, transicoes, id_estado[afd.estado_inicial],
+                   [id_estado[estado] for estado in afd.estados_finais])
+
+    def para_afd(self) -> AFD:
+        """Reconstrói o AFD com nomes (para exibição ou simulação com histórico)"""
+        largura = len(self.simbolos)
+        transicoes = {}
+        for indice, destino in enumerate(self.transicoes):
+            if destino >= 0:
+                estado, simbolo = divmod(indice, largura)
+                transicoes[(self.estados[estado], self.simbolos[simbolo])] = self.estados[destino]
+        return AFD(set(self.estados), set(self.simbolos), transicoes, self.estados[self.inicial],
+                   {self.estados[q] for q, final in enumerate(self.finais) if final})
+
+    def codificar(self, cadeia: str) -> List[int]:
+        """Identificadores dos símbolos da cadeia (-1 para símbolo desconhecido)"""
+        if self._tokenizador is not None:
+            return [-1 if v is None else v for v in self._tokenizador.valores(cadeia)]
+        indice = self._indice_simbolo
+        return [indice.get(simbolo, -1) for simbolo in cadeia]
+
+    def aceita(self, cadeia: str) -> bool:
+        """
+        Verifica a aceitação da cadeia
+
+        Args:
+            cadeia: Cadeia de entrada
+
+        Returns:
+            bool: True se a cadeia é aceita
+        """
+        return self.aceita_codificada(self.codificar(cadeia))
+
+    def aceita_codificada(self, simbolos: Sequence[int]) -> bool:
+        """Verifica a aceitação de uma sequência de identificadores de símbolo"""
+        transicoes, largura = self.transicoes, len(self.simbolos)
+        estado = self.inicial
+        for simbolo in simbolos:
+            if simbolo < 0:
+                return False
+            estado = transicoes[estado * largura + simbolo]
+            if estado < 0:
+                return False
+        return self.finais[estado] == 1
+
+    def bytes_ocupados(self) -> int:
+        """Memória aproximada das estruturas do núcleo, sem contar os nomes"""
+        return (sys.getsizeof(self.transicoes) + sys.getsizeof(self.finais)
+                + sys.getsizeof(self._indice_simbolo))
+
+
+class NucleoAFN(_Imutavel):
+    """
+    AFN compacto, sem ε-transições explícitas
+
+    As transições já incluem o ε-fecho dos destinos e são guardadas no
+    formato CSR: os destinos de (q, a) são
+    destinos[inicio[q * len(simbolos) + a] : inicio[q * len(simbolos) + a + 1]].
+
+    Atributos:
+        estados (Tuple[str, ...]): Nome de cada estado
+        simbolos (Tuple[str, ...]): Símbolos do alfabeto
+        iniciais (array): ε-fecho do estado inicial
+        finais (bytes): finais[q] == 1 se q é final
+        inicio (array): Deslocamentos de cada célula em `destinos`
+        destinos (array): Destinos de todas as células, concatenados
+    """
+
+    __slots__ = ("estados", "simbolos", "iniciais", "finais", "inicio", "destinos",
+                 "_indice_simbolo", "_tokenizador")
+
+    def __init__(self, estados: Sequence[str], simbolos: Sequence[str], iniciais: array,
+                 finais: Sequence[int], inicio: array, destinos: array):
+        """
+        Args:
+            estados: Nomes dos estados
+            simbolos: Símbolos do alfabeto
+            iniciais: Estados ativos antes de ler a entrada (já ε-fechados)
+            finais: Índices dos estados finais
+            inicio: Vetor 'i' com len(estados) * len(simbolos) + 1 deslocamentos
+            destinos: Vetor 'i' com os destinos concatenados
+
+        Raises:
+            ValueError: Se as dimensões forem inválidas
+        """
+        if len(inicio) != len(estados) * len(simbolos) + 1 or inicio[-1] != len(destinos):
+            raise ValueError("Vetores de transição com dimensões incompatíveis")
+        marcas = bytearray(len(estados))
+        for estado in finais:
+            marcas[estado] = 1
+        simbolos = tuple(simbolos)
+        self._definir(
+            estados=tuple(estados), simbolos=simbolos, iniciais=iniciais,
+            finais=bytes(marcas), inicio=inicio, destinos=destinos,
+            _indice_simbolo={simbolo: i for i, simbolo in enumerate(simbolos)},
+            _tokenizador=Tokenizador(simbolos) if precisa_tokenizar(simbolos) else None,
+        )
+
+    @classmethod
+    def de_afn(cls, afn: AFN) -> 'NucleoAFN':
+        """Converte um AFN para a forma compacta (usa os índices de afn.compilar)"""
+        estados = sorted(afn._fechos)
+        simbolos = sorted(afn.alfabeto)
+        id_estado = {estado: i for i, estado in enumerate(estados)}
+        inicio = array('i', [0])
+        destinos = array('i')
+        for estado in estados:
+            por_simbolo = afn._sucessores.get(estado, {})
+            for simbolo in simbolos:
+                destinos.extend(sorted(id_estado[d] for d in por_simbolo.get(simbolo, ())))
+                inicio.append(len(destinos))
+        iniciais = array('i', sorted(id_estado[e] for e in afn._configuracao_inicial()))
+        return cls(estados, simbolos, iniciais,
+                   [id_estado[e] for e in afn.estados_finais if e in id_estado], inicio, destinos)
+
+    def codificar(self, cadeia: str) -> List[int]:
+        """Identificadores dos símbolos da cadeia (-1 para símbolo desconhecido)"""
+        if self._tokenizador is not None:
+            return [-1 if v is None else v for v in self._tokenizador.valores(cadeia)]
+        indice = self._indice_simbolo
+        return [indice.get(simbolo, -1) for simbolo in cadeia]
+
+    def aceita(self, cadeia: str) -> bool:
+        """
+        Verifica a aceitação da cadeia
+
+        Args:
+            cadeia: Cadeia de entrada
+
+        Returns:
+            bool: True se a cadeia é aceita
+        """
+        return self.aceita_codificada(self.codificar(cadeia))
+
+    def aceita_codificada(self, simbolos: Sequence[int]) -> bool:
+        """Verifica a aceitação de uma sequência de identificadores de símbolo"""
+        inicio, destinos, largura = self.inicio, self.destinos, len(self.simbolos)
+        atuais = set(self.iniciais)
+        for simbolo in simbolos:
+            if simbolo < 0:
+                return False
+            proximos = set()
+            for estado in atuais:
+                celula = estado * largura + simbolo
+                proximos.update(destinos[inicio[celula]:inicio[celula + 1]])
+            if not proximos:
+                return False
+            atuais = proximos
+        finais = self.finais
+        return any(finais[estado] for estado in atuais)
+
+    def bytes_ocupados(self) -> int:
+        """Memória aproximada das estruturas do núcleo, sem contar os nomes"""
+        return (sys.getsizeof(self.inicio) + sys.getsizeof(self.destinos)
+                + sys.getsizeof(self.iniciais) + sys.getsizeof(self.finais)
+                + sys.getsizeof(self._indice_simbolo))
@@ -0,0 +1,179 @@
+"""
+Módulo de instrumentação (perfilamento) das simulações
+
+Um Perfilador pode ser passado para o método simular de qualquer autômato
+(AFD, AFN, APD) ou da Máquina de Turing. Durante a execução ele conta
+visitas por estado, disparos por transição, tamanhos de ε-fecho,
+profundidade da pilha e extensão da fita. Sem perfilador (padrão), o custo
+na simulação se resume a um teste `is not None` por passo.
+"""
+
+import json
+from collections import Counter
+from typing import Dict, List, Optional
+
+
+class Perfilador:
+    """
+    Coletor de contadores de execução
+
+    Atributos:
+        execucoes (int): Número de simulações registradas
+        passos (int): Total de transições disparadas (sem as ε-transições
+            percorridas nos ε-fechos do AFN, que não são passos da simulação)
+        visitas_estado (Counter): estado -> número de visitas
+        disparos_transicao (Counter): chave da transição -> número de disparos
+        tamanhos_fecho (Counter): tamanho do ε-fecho -> ocorrências (AFN)
+        profundidade_pilha_max (int): Maior profundidade de pilha observada (APD)
+        posicao_min (Optional[int]): Célula mais à esquerda visitada (MT)
+        posicao_max (Optional[int]): Célula mais à direita visitada (MT)
+    """
+
+    def __init__(self):
+        """Inicializa um perfilador com todos os contadores zerados"""
+        self.execucoes = 0
+        self.passos = 0
+        self.visitas_estado = Counter()
+        self.disparos_transicao = Counter()
+        self.tamanhos_fecho = Counter()
+        self.profundidade_pilha_max = 0
+        self.posicao_min: Optional[int] = None
+        self.posicao_max: Optional[int] = None
+
+    def iniciar_execucao(self):
+        """Marca o início de uma nova simulação"""
+        self.execucoes += 1
+
+    def registrar_estado(self, estado: str, vezes: int = 1):
+        """Conta `vezes` visitas ao estado"""
+        self.visitas_estado[estado] += vezes
+
+    def registrar_transicao(self, chave: tuple, vezes: int = 1):
+        """Conta `vezes` disparos da transição identificada por `chave`"""
+        self.disparos_transicao[chave] += vezes
+        self.passos += vezes
+
+    def registrar_epsilon(self, chave: tuple):
+        """
+        Conta o uso de uma ε-transição em um ε-fecho (AFN)
+
+        Entra em disparos_transicao, mas não em passos: os ε-fechos são
+        pré-calculados e não são passos da simulação.
+        """
+        self.disparos_transicao[chave] += 1
+
+    def registrar_fecho(self, tamanho: int):
+        """Registra o tamanho de um ε-fecho calculado"""
+        self.tamanhos_fecho[tamanho] += 1
+
+    def registrar_pilha(self, profundidade: int):
+        """Registra a profundidade atual da pilha"""
+        if profundidade > self.profundidade_pilha_max:
+            self.profundidade_pilha_max = profundidade
+
+    def registrar_posicao(self, posicao: int):
+        """Registra a posição atual da cabeça na fita"""
+        if self.posicao_min is None or posicao < self.posicao_min:
+            self.posicao_min = posicao
+        if self.posicao_max is None or posicao > self.posicao_max:
+            self.posicao_max = posicao
+
+    def transicoes_mortas(self, automato) -> List[tuple]:
+        """
+        Lista as transições do autômato que nunca foram disparadas
+
+        Args:
+            automato: AFD, AFN, APD ou MaquinaTuring perfilado
+
+        Returns:
+            List[tuple]: Chaves de transição sem nenhum disparo
+        """
+        transicoes = automato.delta if hasattr(automato, "delta") else automato.transicoes
+        return sorted((chave for chave in transicoes if chave not in self.disparos_transicao),
+                      key=_formatar_chave)
+
+    def estados_nao_visitados(self, automato) -> List[str]:
+        """Lista os estados do autômato que nunca foram visitados"""
+        estados = automato.Q if hasattr(automato, "Q") else automato.estados
+        return sorted(e for e in estados if e not in self.visitas_estado)
+
+    def para_dict(self, automato=None) -> Dict:
+        """
+        Exporta os contadores como dicionário serializável em JSON
+
+        Args:
+            automato: Se informado, inclui transições mortas e estados não visitados
+        """
+        dados = {
+            "execucoes": self.execucoes,
+            "passos": self.passos,
+            "visitas_estado": dict(self.visitas_estado.most_common()),
+            "disparos_transicao": {_formatar_chave(chave): total
+                                   for chave, total in self.disparos_transicao.most_common()},
+            "tamanhos_fecho": {str(t): n for t, n in sorted(self.tamanhos_fecho.items())},
+            "profundidade_pilha_max": self.profundidade_pilha_max,
+            "posicao_min": self.posicao_min,
+            "posicao_max": self.posicao_max,
+        }
+        if automato is not None:
+            dados["transicoes_mortas"] = [_formatar_chave(c) for c in self.transicoes_mortas(automato)]
+            dados["estados_nao_visitados"] = self.estados_nao_visitados(automato)
+        return dados
+
+    def para_json(self, automato=None, indent: Optional[int] = 2) -> str:
+        """Exporta os contadores como texto JSON"""
+        return json.dumps(self.para_dict(automato), ensure_ascii=False, indent=indent)
+
+    def relatorio(self, automato=None, limite: int = 10) -> str:
+        """
+        Gera um relatório legível com os estados e transições mais usados
+
+        Args:
+            automato: Se informado, inclui transições mortas e estados não visitados
+            limite: Quantidade de itens em cada ranking
+        """
+        linhas = ["RELATORIO DE PERFILAMENTO",
+                  f"Execucoes: {self.execucoes}",
+                  f"Passos (transicoes disparadas): {self.passos}",
+                  "",
+                  f"Estados mais visitados (top {limite}):"]
+        for estado, total in self.visitas_estado.most_common(limite):
+            linhas.append(f"  {estado}: {total}")
+
+        linhas.append("")
+        linhas.append(f"Transicoes mais disparadas (top {limite}):")
+        for chave, total in self.disparos_transicao.most_common(limite):
+            linhas.append(f"  {_formatar_chave(chave)}: {total}")
+
+        if self.tamanhos_fecho:
+            total_fechos = sum(self.tamanhos_fecho.values())
+            soma = sum(t * n for t, n in self.tamanhos_fecho.items())
+            linhas.append("")
+            linhas.append(f"ε-fechos calculados: {total_fechos} "
+                          f"(medio {soma / total_fechos:.1f}, maximo {max(self.tamanhos_fecho)})")
+        if self.profundidade_pilha_max:
+            linhas.append("")
+            linhas.append(f"Profundidade maxima da pilha: {self.profundidade_pilha_max}")
+        if self.posicao_min is not None:
+            linhas.append("")
+            linhas.append(f"Extensao da fita visitada: [{self.posicao_min}, {self.posicao_max}] "
+                          f"({self.posicao_max - self.posicao_min + 1} celulas)")
+
+        if automato is not None:
+            mortas = self.transicoes_mortas(automato)
+            linhas.append("")
+            linhas.append(f"Transicoes nunca disparadas: {len(mortas)}")
+            for chave in mortas[:limite]:
+                linhas.append(f"  {_formatar_chave(chave)}")
+            nao_visitados = self.estados_nao_visitados(automato)
+            linhas.append(f"Estados nunca visitados: {len(nao_visitados)}")
+            if nao_visitados:
+                linhas.append(f"  {', '.join(nao_visitados[:limite])}")
+
+        return "\n".join(linhas)
+
+
+def _formatar_chave(chave: tuple) -> str:
+    """Formata a chave de uma transição como δ(q, 'a', ...), com ε para None"""
+    partes = [chave[0]] + ["ε" if p is None else f"'{p}'" for p in chave[1:]]
+    return f"δ({', '.join(partes)})"
@@ -0,0 +1,147 @@
+"""
+Módulo de rastro de execução com navegação entre passos
+
+O histórico das simulações é uma lista de linhas já formatadas: em uma
+Máquina de Turing cada passo guarda o desenho da fita, e uma execução
+longa ocupa megabytes. O rastro grava a execução de forma compacta:
+
+- por passo, apenas o delta: na MT, a célula escrita (símbolo anterior e
+  novo), a posição da cabeça e o estado; no APD, a transição usada, que
+  identifica o símbolo desempilhado e os empilhados
+- a cada `intervalo` passos, um instantâneo completo da configuração
+
+A configuração de qualquer passo é reconstruída a partir do instantâneo
+anterior aplicando no máximo `intervalo` deltas. Um cursor percorre a
+execução nos dois sentidos: avançar aplica o delta do passo e voltar o
+desfaz, sem reconstruir a configuração.
+"""
+
+from abc import ABC, abstractmethod
+from array import array
+from typing import List
+
+
+class Rastro(ABC):
+    """
+    Execução gravada com instantâneos esparsos e cursor
+
+    As subclasses gravam os deltas e definem como um instantâneo vira uma
+    configuração e como um delta é aplicado e desfeito.
+
+    Atributos:
+        intervalo (int): Passos entre dois instantâneos
+        aceita (bool): Veredito da execução
+        motivo (str): Por que a execução parou
+    """
+
+    def __init__(self, intervalo: int):
+        """
+        Raises:
+            ValueError: Se o intervalo não for positivo
+        """
+        if intervalo < 1:
+            raise ValueError("intervalo deve ser positivo")
+        self.intervalo = intervalo
+        self.aceita = False
+        self.motivo = ""
+        self._estados: List[str] = []
+        self._posicoes = array("q")
+        self._instantaneos: List = []
+        self._cursor = None
+
+    @property
+    def passos(self) -> int:
+        """Número de passos gravados (configurações de 0 a passos)"""
+        return len(self._estados) - 1
+
+    def __len__(self) -> int:
+        """Número de configurações gravadas"""
+        return len(self._estados)
+
+    @property
+    def passo_atual(self) -> int:
+        """Passo sob o cursor"""
+        return self._cursor.passo
+
+    def atual(self):
+        """Configuração sob o cursor (não deve ser alterada)"""
+        return self._cursor
+
+    def configuracao(self, passo: int):
+        """
+        Reconstrói a configuração de um passo, independente do cursor
+
+        Parte do último instantâneo anterior ao passo e aplica no máximo
+        `intervalo` deltas.
+
+        Args:
+            passo: Passo desejado (0 a passos)
+
+        Raises:
+            ValueError: Se o passo estiver fora do rastro
+        """
+        self._validar(passo)
+        inicio = passo // self.intervalo * self.intervalo
+        configuracao = self._de_instantaneo(inicio)
+        for indice in range(inicio, passo):
+            self._aplicar(configuracao, indice)
+        return configuracao
+
+    def ir_para(self, passo: int):
+        """
+        Move o cursor para o passo e retorna a configuração
+
+        Até `intervalo` passos de distância, aplica ou desfaz deltas a partir
+        do cursor; mais longe, reconstrói a partir do instantâneo anterior.
+
+        Raises:
+            ValueError: Se o passo estiver fora do rastro
+        """
+        self._validar(passo)
+        cursor = self._cursor
+        distancia = passo - cursor.passo
+        if abs(distancia) > self.intervalo:
+            self._cursor = cursor = self.configuracao(passo)
+        elif distancia > 0:
+            for indice in range(cursor.passo, passo):
+                self._aplicar(cursor, indice)
+        else:
+            for indice in range(cursor.passo - 1, passo - 1, -1):
+                self._desfazer(cursor, indice)
+        return cursor
+
+    def avancar(self):
+        """Avança o cursor um passo (fica no último se já estiver nele)"""
+        return self.ir_para(min(self.passo_atual + 1, self.passos))
+
+    def voltar(self):
+        """Volta o cursor um passo (fica no primeiro se já estiver nele)"""
+        return self.ir_para(max(self.passo_atual - 1, 0))
+
+    @abstractmethod
+    def descrever(self) -> List[str]:
+        """Linhas que descrevem o passo sob o cursor, no formato do histórico"""
+        pass
+
+    def _validar(self, passo: int):
+        if not 0 <= passo <= self.passos:
+            raise ValueError(f"Passo fora do rastro: {passo} (0 a {self.passos})")
+
+    def _em_instantaneo(self) -> bool:
+        """Se o último passo gravado é múltiplo do intervalo (leva instantâneo)"""
+        return self.passos % self.intervalo == 0
+
+    @abstractmethod
+    def _de_instantaneo(self, passo: int):
+        """Nova configuração a partir do instantâneo do passo (múltiplo do intervalo)"""
+        pass
+
+    @abstractmethod
+    def _aplicar(self, configuracao, passo: int):
+        """Aplica o delta do passo (configuração do passo -> passo + 1)"""
+        pass
+
+    @abstractmethod
+    def _desfazer(self, configuracao, passo: int):
+        """Desfaz o delta do passo (configuração do passo + 1 -> passo)"""
+        pass
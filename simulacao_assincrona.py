@@ -0,0 +1,158 @@
+"""
+Módulo de simulação assíncrona (asyncio)
+
+Para serviços que usam asyncio, as simulações (que ocupam a CPU) são
+executadas em um executor, sem bloquear o laço de eventos. Máquinas de
+Turing determinísticas rodam em fatias de passos, e as buscas do APD
+não-determinístico e da MT não-determinística em fatias de configurações:
+entre uma fatia e outra o controle volta ao laço de eventos, onde a
+chamada pode ser cancelada ou expirar pelo tempo limite, e nenhuma fatia
+nova é executada depois disso. AFD, AFN e APD determinístico, lineares na
+cadeia, rodam em uma única chamada ao executor, que termina mesmo se a
+espera for cancelada.
+
+Como a simulação não altera o autômato, chamadas simultâneas sobre a mesma
+instância rodam em paralelo no executor.
+"""
+
+import asyncio
+import functools
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from perfilador import Perfilador
+
+
+def _proxima_fatia(fatias) -> Tuple[bool, object]:
+    """Executa uma fatia: (terminou, resultado)"""
+    try:
+        next(fatias)
+    except StopIteration as fim:
+        return True, fim.value
+    return False, None
+
+
+class SimuladorAssincrono:
+    """
+    Fachada assíncrona para os simuladores
+
+    Aceita AFD, AFN, APD e Máquinas de Turing. Use como gerenciador de
+    contexto assíncrono ou chame fechar() ao final.
+
+    Atributos:
+        passos_por_fatia (int): Passos de MT (ou configurações das buscas do
+            APD e da MT não-determinística) executados antes de devolver o
+            controle ao laço de eventos
+    """
+
+    def __init__(self, executor: Optional[Executor] = None,
+                 max_trabalhadores: Optional[int] = None, passos_por_fatia: int = 1000):
+        """
+        Args:
+            executor: Executor a usar; se omitido, cria um ThreadPoolExecutor
+                      próprio (encerrado em fechar())
+            max_trabalhadores: Número de threads do executor próprio
+            passos_por_fatia: Tamanho das fatias de execução
+        """
+        if passos_por_fatia < 1:
+            raise ValueError("passos_por_fatia deve ser positivo")
+        self._proprio = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_trabalhadores,
+                                                        thread_name_prefix="simulacao")
+        self.passos_por_fatia = passos_por_fatia
+
+    async def simular(self, automato, cadeia: str, tempo_limite: Optional[float] = None,
+                      **opcoes) -> Tuple[bool, List[str]]:
+        """
+        Simula a cadeia sem bloquear o laço de eventos
+
+        Com tempo limite ou cancelamento, MTs e buscas param na fatia
+        seguinte; uma simulação de AFD, AFN ou APD determinístico já
+        iniciada no executor vai até o fim (o resultado é descartado).
+
+        Args:
+            automato: AFD, AFN, APD ou MaquinaTuring
+            cadeia: Cadeia de entrada
+            tempo_limite: Segundos até desistir (None = sem limite)
+            **opcoes: Repassadas ao simular do autômato (ex.: max_passos, perfilador)
+
+        Returns:
+            Tuple[bool, List[str]]: (cadeia_aceita, historico)
+
+        Raises:
+            asyncio.TimeoutError: Se o tempo limite expirar
+        """
+        return await asyncio.wait_for(self._simular(automato, cadeia, opcoes), tempo_limite)
+
+    async def aceita(self, automato, cadeia: str, tempo_limite: Optional[float] = None,
+                     **opcoes) -> bool:
+        """Como simular, mas retorna apenas o veredito"""
+        aceita, _ = await self.simular(automato, cadeia, tempo_limite, **opcoes)
+        return aceita
+
+    async def simular_lote(self, automato, cadeias: Iterable[str],
+                           tempo_limite: Optional[float] = None) -> Dict[str, bool]:
+        """
+        Avaliação em lote (AFD/AFN) no executor
+
+        Args:
+            automato: AFD ou AFN
+            cadeias: Cadeias a testar
+            tempo_limite: Segundos até desistir
+
+        Returns:
+            Dict[str, bool]: cadeia -> aceita
+        """
+        chamada = functools.partial(automato.simular_lote, list(cadeias))
+        return await asyncio.wait_for(self._no_executor(chamada), tempo_limite)
+
+    async def _simular(self, automato, cadeia: str, opcoes: Dict) -> Tuple[bool, List[str]]:
+        if getattr(automato, "continuavel", False):
+            return await self._simular_mt(automato, cadeia, **opcoes)
+        if hasattr(automato, "_simular_fatias"):
+            fatias = automato._simular_fatias(cadeia, self.passos_por_fatia, **opcoes)
+            while True:
+                terminou, resultado = await self._no_executor(functools.partial(_proxima_fatia, fatias))
+                if terminou:
+                    return resultado
+        chamada = functools.partial(automato.simular, cadeia, **opcoes)
+        return await self._no_executor(chamada)
+
+    async def _simular_mt(self, maquina, cadeia: str, max_passos: int = 10000,
+                          perfilador: Optional[Perfilador] = None,
+                          rle: bool = False) -> Tuple[bool, List[str]]:
+        """Executa a MT em fatias, devolvendo o controle entre elas"""
+        laco = asyncio.get_running_loop()
+        execucao, historico = maquina._iniciar(cadeia, rle)
+        if perfilador is not None:
+            perfilador.iniciar_execucao()
+
+        restantes = max_passos
+        while restantes > 0:
+            fatia = min(self.passos_por_fatia, restantes)
+            aceita = await laco.run_in_executor(
+                self._executor, maquina._executar_passos, execucao, historico, fatia, perfilador)
+            if aceita is not None:
+                return aceita, historico
+            restantes -= fatia
+
+        historico.append("")
+        historico.append("CADEIA REJEITADA")
+        historico.append("LOOPING INFINITO DETECTADO")
+        historico.append(f"Excedeu o maximo de {max_passos} passos")
+        return False, historico
+
+    async def _no_executor(self, chamada):
+        """Executa `chamada` no executor"""
+        return await asyncio.get_running_loop().run_in_executor(self._executor, chamada)
+
+    def fechar(self):
+        """Encerra o executor, se ele foi criado por este simulador"""
+        if self._proprio:
+            self._executor.shutdown(wait=False)
+
+    async def __aenter__(self) -> 'SimuladorAssincrono':
+        return self
+
+    async def __aexit__(self, *_):
+        self.fechar()
@@ -0,0 +1,131 @@
+"""
+Módulo de simulação incremental
+
+Em uso interativo (editores, validação enquanto o usuário digita) a cadeia
+muda por pequenas edições. A SimulacaoIncremental guarda a configuração do
+autômato (estado no AFD, conjunto de estados no AFN) a cada `intervalo`
+símbolos e, após uma edição, retoma a simulação a partir do último ponto de
+controle anterior à primeira posição alterada. O custo de reavaliar é
+proporcional à distância entre a edição e o fim da cadeia, e não ao
+tamanho da cadeia inteira.
+"""
+
+from typing import List, Optional, Hashable
+
+from automato_base import AutomatoBase, AvaliacaoLote
+
+
+class SimulacaoIncremental:
+    """
+    Reavaliação incremental de uma cadeia editada
+
+    Funciona com qualquer autômato que implemente os ganchos de
+    configuração usados por simular_lote (AFD e AFN).
+
+    Atributos:
+        automato (AutomatoBase): Autômato simulado
+        intervalo (int): Distância, em símbolos, entre pontos de controle
+        cadeia (str): Última cadeia avaliada
+    """
+
+    def __init__(self, automato: AutomatoBase, intervalo: int = 64):
+        """
+        Args:
+            automato: AFD ou AFN
+            intervalo: Distância entre pontos de controle (menor = mais memória,
+                       menos símbolos reprocessados por edição)
+
+        Raises:
+            ValueError: Se o autômato não for AFD ou AFN, se o intervalo não
+                        for positivo ou se o alfabeto tiver símbolos de vários
+                        caracteres
+        """
+        if not isinstance(automato, AvaliacaoLote):
+            raise ValueError(f"Simulação incremental não suporta {type(automato).__name__}")
+        if intervalo < 1:
+            raise ValueError("O intervalo entre pontos de controle deve ser positivo")
+        if automato._tokenizador is not None:
+            raise ValueError("A simulação incremental exige símbolos de um único caractere")
+        self.automato = automato
+        self.intervalo = intervalo
+        self.cadeia = ""
+        # _pontos[j] é a configuração após ler cadeia[:j * intervalo]
+        self._pontos: List[Hashable] = [automato._configuracao_inicial()]
+        # Posição i tal que a configuração após ler cadeia[:i] é a rejeição (None)
+        self._posicao_morte: Optional[int] = None
+        self._final: Optional[Hashable] = self._pontos[0]
+
+    def avaliar(self, cadeia: str) -> bool:
+        """
+        Verifica a aceitação de `cadeia`, reaproveitando a avaliação anterior
+
+        Args:
+            cadeia: Nova versão da cadeia
+
+        Returns:
+            bool: True se o autômato aceita a cadeia
+        """
+        return self._reavaliar(cadeia, _prefixo_comum(self.cadeia, cadeia))
+
+    def editar(self, inicio: int, fim: int, texto: str = "") -> bool:
+        """
+        Substitui cadeia[inicio:fim] por `texto` e reavalia
+
+        Args:
+            inicio: Início do trecho substituído
+            fim: Fim (exclusivo) do trecho substituído
+            texto: Texto inserido no lugar do trecho
+
+        Returns:
+            bool: Aceitação da cadeia editada
+        """
+        if not 0 <= inicio <= fim <= len(self.cadeia):
+            raise ValueError(f"Trecho [{inicio}, {fim}) fora da cadeia de tamanho {len(self.cadeia)}")
+        nova = self.cadeia[:inicio] + texto + self.cadeia[fim:]
+        return self._reavaliar(nova, inicio)
+
+    def _reavaliar(self, cadeia: str, alterada: int) -> bool:
+        """Reavalia sabendo que cadeia[:alterada] não mudou"""
+        self.cadeia = cadeia
+
+        # O prefixo que levou à rejeição continua igual: resultado não muda
+        if self._posicao_morte is not None and self._posicao_morte <= alterada:
+            return False
+        self._posicao_morte = None
+
+        # Pontos de controle em posições <= alterada continuam válidos
+        del self._pontos[alterada // self.intervalo + 1:]
+        posicao = (len(self._pontos) - 1) * self.intervalo
+        configuracao = self._pontos[-1]
+
+        avancar = self.automato._avancar
+        intervalo = self.intervalo
+        for posicao in range(posicao, len(cadeia)):
+            configuracao = avancar(configuracao, cadeia[posicao])
+            if configuracao is None:
+                self._posicao_morte = posicao + 1
+                self._final = None
+                return False
+            if (posicao + 1) % intervalo == 0:
+                self._pontos.append(configuracao)
+
+        self._final = configuracao
+        return self.automato._configuracao_aceita(configuracao)
+
+    @property
+    def aceita(self) -> bool:
+        """Resultado da última avaliação"""
+        return self._final is not None and self.automato._configuracao_aceita(self._final)
+
+
+def _prefixo_comum(a: str, b: str) -> int:
+    """Tamanho do maior prefixo comum, comparando blocos inteiros quando possível"""
+    limite = min(len(a), len(b))
+    bloco = 4096
+    inicio = 0
+    while inicio < limite and a[inicio:inicio + bloco] == b[inicio:inicio + bloco]:
+        inicio += bloco
+    inicio = min(inicio, limite)
+    while inicio < limite and a[inicio] == b[inicio]:
+        inicio += 1
+    return inicio
@@ -0,0 +1,179 @@
+"""
+Módulo de tabelas de transição compactas
+
+Converte a função de transição de um AFD ou AFN em uma tabela indexada
+por inteiros. Símbolos que se comportam igualmente em todos os estados são
+agrupados em uma mesma classe de equivalência, de modo que a tabela tem uma
+coluna por classe e não por símbolo (com alfabetos grandes, como Unicode,
+o número de classes costuma ser muito menor que o de símbolos).
+
+Conforme a densidade (fração de células definidas) a tabela é guardada:
+    - densa: um único vetor estados × classes, acesso direto;
+    - esparsa: por linha, apenas as colunas definidas (formato CSR),
+      com busca binária na linha.
+"""
+
+from array import array
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Set, FrozenSet
+
+from tokenizador import Tokenizador, precisa_tokenizar
+
+
+class TabelaTransicoes:
+    """
+    Tabela de transições com compressão do alfabeto
+
+    Os estados são identificados por inteiros 0..n-1 (nomes em `nomes`). O
+    valor de uma célula é um inteiro não negativo, ou -1 se indefinida: no
+    AFD é o estado destino; no AFN é o índice em `conjuntos` do conjunto
+    (já ε-fechado) de destinos.
+
+    Atributos:
+        nomes (List[str]): Nome de cada estado
+        classes (Dict[str, int]): símbolo -> classe de equivalência
+        num_classes (int): Número de classes (colunas)
+        densidade (float): Fração das células definidas
+        densa (bool): True se a tabela usa o vetor denso
+        inicial (int): Estado inicial (AFD) ou índice do ε-fecho inicial (AFN)
+        finais (FrozenSet[int]): Estados finais
+        conjuntos (Optional[List[FrozenSet[int]]]): Conjuntos de destinos (apenas AFN)
+    """
+
+    def __init__(self, linhas: List[Dict[str, int]], alfabeto: Set[str], nomes: List[str],
+                 inicial: int, finais: Set[int],
+                 conjuntos: Optional[List[FrozenSet[int]]] = None,
+                 limiar_densidade: float = 0.25):
+        """
+        Args:
+            linhas: Para cada estado, dicionário símbolo -> valor da célula
+            alfabeto: Alfabeto de entrada
+            nomes: Nome de cada estado
+            inicial: Estado inicial (AFD) ou índice do conjunto inicial (AFN)
+            finais: Estados finais
+            conjuntos: Conjuntos de destinos referenciados pelas células (AFN)
+            limiar_densidade: Densidade mínima para usar a tabela densa
+        """
+        self.nomes = nomes
+        self.inicial = inicial
+        self.finais = frozenset(finais)
+        self.conjuntos = conjuntos
+
+        # Símbolos com a mesma coluna em todos os estados formam uma classe
+        assinaturas: Dict[tuple, int] = {}
+        self.classes: Dict[str, int] = {}
+        for simbolo in sorted(alfabeto):
+            assinatura = tuple(linha.get(simbolo, -1) for linha in linhas)
+            self.classes[simbolo] = assinaturas.setdefault(assinatura, len(assinaturas))
+        self.num_classes = len(assinaturas)
+        # Símbolos de vários caracteres: a entrada é dividida direto em classes
+        self._tokenizador = Tokenizador(self.classes) if precisa_tokenizar(alfabeto) else None
+
+        # Cada assinatura é a coluna da classe: valor em cada estado
+        colunas = list(assinaturas)
+        celulas = len(linhas) * self.num_classes
+        ocupadas = sum(1 for assinatura in colunas for valor in assinatura if valor >= 0)
+        self.densidade = ocupadas / celulas if celulas else 1.0
+        self.densa = self.densidade >= limiar_densidade
+
+        largura = self.num_classes
+        if self.densa:
+            self._tabela = array('i', [-1]) * celulas
+            for classe, assinatura in enumerate(colunas):
+                for estado, valor in enumerate(assinatura):
+                    self._tabela[estado * largura + classe] = valor
+        else:
+            self._inicio = array('i', [0])
+            self._colunas = array('i')
+            self._valores = array('i')
+            for estado in range(len(linhas)):
+                for classe, assinatura in enumerate(colunas):
+                    if assinatura[estado] >= 0:
+                        self._colunas.append(classe)
+                        self._valores.append(assinatura[estado])
+                self._inicio.append(len(self._colunas))
+
+    def destino(self, estado: int, classe: int) -> int:
+        """
+        Valor da célula (estado, classe)
+
+        Returns:
+            int: Destino, ou -1 se a transição não estiver definida
+        """
+        if self.densa:
+            return self._tabela[estado * self.num_classes + classe]
+        inicio, fim = self._inicio[estado], self._inicio[estado + 1]
+        posicao = bisect_left(self._colunas, classe, inicio, fim)
+        if posicao < fim and self._colunas[posicao] == classe:
+            return self._valores[posicao]
+        return -1
+
+    def aceita(self, cadeia: str) -> bool:
+        """
+        Verifica a aceitação da cadeia usando apenas a tabela
+
+        Args:
+            cadeia: Cadeia de entrada
+
+        Returns:
+            bool: True se a cadeia é aceita
+        """
+        if self._tokenizador is None:
+            entrada = map(self.classes.get, cadeia)
+        else:
+            entrada = self._tokenizador.valores(cadeia)
+        if self.conjuntos is None:
+            return self._aceita_deterministico(entrada)
+
+        # AFN: simulação por conjuntos, com cache dos passos já calculados
+        atuais = self.conjuntos[self.inicial]
+        passos: Dict[tuple, FrozenSet[int]] = {}
+        for classe in entrada:
+            if classe is None:
+                return False
+            chave = (atuais, classe)
+            proximos = passos.get(chave)
+            if proximos is None:
+                acumulado: Set[int] = set()
+                for estado in atuais:
+                    valor = self.destino(estado, classe)
+                    if valor >= 0:
+                        acumulado |= self.conjuntos[valor]
+                proximos = passos[chave] = frozenset(acumulado)
+            if not proximos:
+                return False
+            atuais = proximos
+        return not atuais.isdisjoint(self.finais)
+
+    def _aceita_deterministico(self, entrada: Iterable[Optional[int]]) -> bool:
+        estado = self.inicial
+        if self.densa:
+            tabela, largura = self._tabela, self.num_classes
+            for classe in entrada:
+                if classe is None:
+                    return False
+                estado = tabela[estado * largura + classe]
+                if estado < 0:
+                    return False
+        else:
+            destino = self.destino
+            for classe in entrada:
+                if classe is None:
+                    return False
+                estado = destino(estado, classe)
+                if estado < 0:
+                    return False
+        return estado in self.finais
+
+    def bytes_ocupados(self) -> int:
+        """Estimativa do espaço ocupado pelos vetores da tabela, em bytes"""
+        if self.densa:
+            return self._tabela.itemsize * len(self._tabela)
+        return sum(v.itemsize * len(v) for v in (self._inicio, self._colunas, self._valores))
+
+    def __str__(self) -> str:
+        """Resumo da tabela"""
+        formato = "densa" if self.densa else "esparsa"
+        return (f"Tabela {formato}: {len(self.nomes)} estados x {self.num_classes} classes "
+                f"({len(self.classes)} símbolos), densidade {self.densidade:.2f}, "
+                f"{self.bytes_ocupados()} bytes")
@@ -0,0 +1,19 @@
+"""
+Teste diferencial dos motores rápidos contra os simuladores de referência
+
+Executa o TesteDiferencial de cada tipo com semente fixa; uma divergência
+é mostrada já reduzida a um contraexemplo mínimo.
+"""
+
+import pytest
+
+import teste_diferencial
+
+SEMENTE = 1
+
+
+@pytest.mark.parametrize("tipo", sorted(teste_diferencial.REFERENCIAS))
+def test_motores_concordam_com_referencia(tipo):
+    teste = teste_diferencial.TesteDiferencial(tipo, semente=SEMENTE)
+    divergencias = teste.executar(num_automatos=30)
+    assert not divergencias, "\n\n".join(str(divergencia) for divergencia in divergencias)
@@ -0,0 +1,780 @@
+"""
+Módulo de teste diferencial entre os simuladores de referência e os rápidos
+
+Gera autômatos e entradas aleatórios (reprodutíveis pela semente), executa
+o simular de referência e cada motor otimizado sobre as mesmas entradas e
+compara os vereditos e, quando o motor expõe, a configuração final. Cada
+divergência encontrada é reduzida a um contraexemplo mínimo: a cadeia é
+encurtada e simplificada e o autômato perde transições, estados finais e
+estados enquanto a divergência persistir.
+
+Os autômatos gerados usam também alfabetos de vários caracteres (inclusive
+ambíguos, como {a, b, ab}) e nomes de estado com vírgulas e "∅". Além de
+AFD, AFN, APD e MT, são testadas a MT não-determinística ("MTN"), as
+expressões regulares ("REGEX", com o módulo re como referência) e as
+gramáticas ("GLC", com uma derivação recursiva como referência); produtos,
+o cache de resultados, o gerador de entradas, a avaliação paralela de AFD e
+o simulador assíncrono (em fatias pequenas) entram como motores.
+
+Um motor é uma função que recebe o autômato e devolve a função de
+avaliação `cadeia -> (aceita, configuracao_final)`; configuracao_final é
+None quando o motor não a expõe. A preparação (compilar tabelas, gerar
+código) acontece uma vez por autômato.
+
+Exemplo:
+    >>> teste = TesteDiferencial("AFD", semente=1)
+    >>> for divergencia in teste.executar(num_automatos=200):
+    ...     print(divergencia)
+"""
+
+import asyncio
+import random
+import re
+import weakref
+from functools import lru_cache
+from typing import Callable, Dict, Hashable, Iterable, Iterator, List, Optional, Tuple
+
+from afd import AFD
+from afd_compilado import compilar_afd
+from afd_paralelo import AvaliadorParaleloAFD
+from afn import AFN
+from apd import APD
+from automato_base import concluir
+from automato_bytes import AutomatoBytes
+from cache_resultados import CacheResultados
+from expressao_regular import regex_para_afd, regex_para_afn
+from gerador_entradas import GeradorEntradas
+from gramatica import Gramatica, ReconhecedorEarley
+from maquina_de_turing import (ExecucaoMT, MaquinaTuring, MaquinaTuringBase,
+                               MaquinaTuringNaoDeterministica)
+from nucleo_compacto import NucleoAFD, NucleoAFN
+from simulacao_assincrona import SimuladorAssincrono
+from simulacao_incremental import SimulacaoIncremental
+from tokenizador import precisa_tokenizar
+
+Resultado = Tuple[bool, Optional[Hashable]]
+Motor = Callable[[object], Callable[[str], Resultado]]
+
+# Limites que mantêm cada execução curta; os motores comparados recebem os mesmos
+PASSOS_MT = 500
+PASSOS_MTN = 25
+CONFIGURACOES_APD = 2000
+CONFIGURACOES_MT = 20000
+# Maior número de símbolos das cadeias que o motor "gerador" enumera
+SIMBOLOS_ENUMERADOS = 4
+# Fatias do motor "assincrono": pequenas para que as buscas sejam retomadas várias vezes
+PASSOS_POR_FATIA = 3
+
+# Alfabetos dos autômatos finitos gerados: de um caractere, com divisão
+# ambígua pelo casamento mais longo e com símbolos de vários caracteres
+ALFABETOS = (("a",), ("a", "b"), ("a", "b", "c"), ("a", "b", "ab"), ("ab", "ba", "c"), ("x1", "x2", "y"))
+# Nomes de estado que exigem escape nos nomes dos estados do produto
+NOMES_ESPECIAIS = ("q", "q,q", "∅", "q\\", "(q)", "q\\,")
+
+
+def _veredito(simular) -> Callable[[str], Resultado]:
+    """Motor que expõe apenas o veredito de uma função no formato de simular"""
+    return lambda cadeia: (simular(cadeia)[0], None)
+
+
+def _booleano(aceita) -> Callable[[str], Resultado]:
+    return lambda cadeia: (aceita(cadeia), None)
+
+
+def _referencia_mt(maquina: MaquinaTuring) -> Callable[[str], Resultado]:
+    def avaliar(cadeia: str) -> Resultado:
+        execucao, historico = maquina._iniciar(cadeia)
+        aceita, _ = maquina._executar(execucao, historico, PASSOS_MT)
+        return aceita, _configuracao_mt(maquina, execucao)
+    return avaliar
+
+
+def _rle_mt(maquina: MaquinaTuring) -> Callable[[str], Resultado]:
+    def avaliar(cadeia: str) -> Resultado:
+        execucao, historico = maquina._iniciar(cadeia, rle=True)
+        aceita, _ = maquina._executar(execucao, historico, PASSOS_MT)
+        return aceita, _configuracao_mt(maquina, execucao)
+    return avaliar
+
+
+def _configuracao_mt(maquina: MaquinaTuring, execucao: ExecucaoMT) -> Hashable:
+    """Estado, posição, passo e células não brancas, independente do tipo de fita"""
+    fita = execucao.fita if isinstance(execucao.fita, dict) else execucao.fita.para_dict()
+    celulas = tuple(sorted((i, s) for i, s in fita.items() if s != maquina.blank))
+    return execucao.estado_atual, execucao.posicao, execucao.passo, celulas
+
+
+def _nao_deterministica(maquina: MaquinaTuring) -> Callable[[str], Resultado]:
+    """A MT determinística simulada como MTN de um movimento por transição"""
+    mtn = MaquinaTuringNaoDeterministica(
+        set(maquina.Q), set(maquina.Sigma), set(maquina.Gamma),
+        {chave: [movimento] for chave, movimento in maquina.delta.items()},
+        maquina.q0, maquina.blank, set(maquina.F))
+    return _veredito(lambda cadeia: mtn.simular(cadeia, PASSOS_MT, CONFIGURACOES_MT))
+
+
+def _referencia_glc(gramatica: Gramatica) -> Callable[[str], Resultado]:
+    """
+    Derivação recursiva mais à esquerda, com memória
+
+    Termina para as gramáticas geradas, em que todo corpo não vazio começa
+    por um terminal.
+    """
+    terminais, producoes = gramatica.terminais, gramatica.producoes
+
+    def avaliar(cadeia: str) -> Resultado:
+        @lru_cache(maxsize=None)
+        def deriva(simbolos: Tuple[str, ...], inicio: int) -> bool:
+            """Se `simbolos` derivam cadeia[inicio:]"""
+            if not simbolos:
+                return inicio == len(cadeia)
+            if sum(s in terminais for s in simbolos) > len(cadeia) - inicio:
+                return False
+            primeiro, resto = simbolos[0], simbolos[1:]
+            if primeiro in terminais:
+                return cadeia.startswith(primeiro, inicio) and deriva(resto, inicio + len(primeiro))
+            return any(deriva(tuple(corpo) + resto, inicio) for corpo in producoes.get(primeiro, ()))
+        return deriva((gramatica.inicial,), 0), None
+    return avaliar
+
+
+def _um_caractere(motor: Motor) -> Motor:
+    """
+    Motor que pode recusar, com ValueError, alfabetos de vários caracteres
+
+    Nesse caso o motor não se aplica ao autômato (a preparação devolve None).
+    """
+    def preparar(automato) -> Optional[Callable[[str], Resultado]]:
+        try:
+            return motor(automato)
+        except ValueError:
+            if precisa_tokenizar(automato.alfabeto):
+                return None
+            raise
+    return preparar
+
+
+def _gerador(automato) -> Callable[[str], Resultado]:
+    """
+    Veredito segundo o GeradorEntradas
+
+    As cadeias de aceitas() e quase_aceitas() são conferidas com simular e
+    as de enumerar() não podem se repetir. Uma cadeia com até
+    SIMBOLOS_ENUMERADOS símbolos é aceita se foi enumerada.
+    """
+    gerador = GeradorEntradas(automato)
+    for cadeia in gerador.aceitas(10, 6):
+        if not automato.simular(cadeia)[0]:
+            raise ValueError(f"aceitas() gerou {cadeia!r}, rejeitada pelo autômato")
+    for cadeia in gerador.quase_aceitas(10, 6):
+        if automato.simular(cadeia)[0]:
+            raise ValueError(f"quase_aceitas() gerou {cadeia!r}, aceita pelo autômato")
+    enumeradas = list(gerador.enumerar(SIMBOLOS_ENUMERADOS))
+    if len(set(enumeradas)) != len(enumeradas):
+        raise ValueError(f"enumerar() repetiu cadeias: {enumeradas}")
+    enumeradas = set(enumeradas)
+
+    def avaliar(cadeia: str) -> Resultado:
+        simbolos = list(automato._simbolos(cadeia))
+        if len(simbolos) <= SIMBOLOS_ENUMERADOS:
+            return cadeia in enumeradas, None
+        return gerador._aceita(simbolos), None
+    return avaliar
+
+
+def _cache(**opcoes) -> Motor:
+    """
+    CacheResultados compartilhado com uma variante do autômato
+
+    A variante difere em um detalhe da definição; se a impressão digital o
+    ignorasse, o cache devolveria o resultado da variante. O histórico do
+    cache também é comparado com o de simular.
+    """
+    def motor(automato) -> Callable[[str], Resultado]:
+        cache = CacheResultados()
+        variante = _variante(automato)
+
+        def avaliar(cadeia: str) -> Resultado:
+            cache.simular(variante, cadeia, **opcoes)
+            aceita, historico = cache.simular(automato, cadeia, **opcoes)
+            if historico != automato.simular(cadeia, **opcoes)[1]:
+                raise ValueError("Histórico do cache difere do de simular")
+            return aceita, None
+        return avaliar
+    return motor
+
+
+def _paralelo(afd: AFD) -> Callable[[str], Resultado]:
+    """
+    AvaliadorParaleloAFD com tamanho_minimo=1: toda cadeia passa pelo pool
+
+    O pool é encerrado quando a função de avaliação é descartada.
+    """
+    avaliador = AvaliadorParaleloAFD(afd, processos=2, tamanho_minimo=1)
+    avaliar = _booleano(avaliador.aceita)
+    weakref.finalize(avaliar, avaliador.fechar)
+    return avaliar
+
+
+async def _simular_assincrono(automato, cadeia: str, opcoes: Dict):
+    async with SimuladorAssincrono(passos_por_fatia=PASSOS_POR_FATIA) as simulador:
+        return await simulador.simular(automato, cadeia, **opcoes)
+
+
+def _assincrono(**opcoes) -> Motor:
+    """SimuladorAssincrono.simular com um laço de eventos por cadeia"""
+    return lambda automato: _veredito(
+        lambda cadeia: asyncio.run(_simular_assincrono(automato, cadeia, opcoes)))
+
+
+def _variante(automato):
+    """Cópia com outro alfabeto de entrada (MT) ou sem estados finais"""
+    if isinstance(automato, MaquinaTuringBase):
+        sigma = set(automato.Sigma) - {max(automato.Sigma)} if automato.Sigma else set(automato.Gamma)
+        return type(automato)(set(automato.Q), sigma, set(automato.Gamma), automato.delta,
+                              automato.q0, automato.blank, set(automato.F))
+    if isinstance(automato, APD):
+        return APD(set(automato.estados), set(automato.alfabeto), set(automato.alfabeto_pilha),
+                   automato.transicoes, automato.estado_inicial, set(),
+                   automato.simbolo_pilha_inicial)
+    return type(automato)(set(automato.estados), set(automato.alfabeto), automato.transicoes,
+                          automato.estado_inicial, set())
+
+
+class _Expressao:
+    """
+    Expressão regular gerada, na sintaxe comum a este projeto e ao módulo re
+
+    Atributos:
+        padrao (str): Texto da expressão
+        alfabeto (Tuple[str, ...]): Alfabeto usado na compilação
+    """
+
+    def __init__(self, padrao: str, alfabeto: Tuple[str, ...]):
+        """
+        Raises:
+            ValueError: Se a expressão for inválida para um dos dois
+        """
+        try:
+            re.compile(padrao)
+        except re.error as erro:
+            raise ValueError(f"Expressão inválida para o módulo re: {erro}")
+        regex_para_afn(padrao, alfabeto)
+        self.padrao = padrao
+        self.alfabeto = alfabeto
+
+    def afn(self) -> AFN:
+        """AFN da expressão (Thompson, com cache)"""
+        return regex_para_afn(self.padrao, self.alfabeto)
+
+    def __str__(self) -> str:
+        return f"Expressão regular: {self.padrao} sobre {{{', '.join(self.alfabeto)}}}"
+
+
+REFERENCIAS: Dict[str, Motor] = {
+    "AFD": lambda afd: _veredito(afd.simular),
+    "AFN": lambda afn: _veredito(afn.simular),
+    "APD": lambda apd: lambda cadeia: (
+        concluir(apd._simular_busca(apd._simbolos(cadeia), None, CONFIGURACOES_APD))[0], None),
+    "MT": _referencia_mt,
+    "MTN": lambda mtn: _veredito(lambda cadeia: mtn.simular(cadeia, PASSOS_MTN, CONFIGURACOES_MT)),
+    "REGEX": lambda expressao: lambda cadeia: (
+        re.fullmatch(expressao.padrao, cadeia) is not None, None),
+    "GLC": _referencia_glc,
+}
+
+MOTORES: Dict[str, Dict[str, Motor]] = {
+    "AFD": {
+        "lote": lambda afd: lambda cadeia: (afd.simular_lote([cadeia])[cadeia], None),
+        "tabela": lambda afd: _booleano(afd.compilar_tabela().aceita),
+        "compilado": lambda afd: _booleano(compilar_afd(afd)),
+        "nucleo": lambda afd: _booleano(NucleoAFD.de_afd(afd).aceita),
+        "bytes": _um_caractere(lambda afd: _booleano(AutomatoBytes(afd).aceita_texto)),
+        "incremental": _um_caractere(lambda afd: _booleano(SimulacaoIncremental(afd).avaliar)),
+        "minimizado": lambda afd: _veredito(afd.minimizar().simular),
+        "podado": lambda afd: _veredito(afd.podar().simular),
+        "produto": lambda afd: _veredito(afd.intersecao(afd).simular),
+        "produto_materializado": lambda afd: _veredito(afd.intersecao(afd).materializar().simular),
+        "complemento_duplo": lambda afd: _veredito(afd.complemento().complemento().simular),
+        "gerador": _gerador,
+        "cache": _cache(),
+        "paralelo": _um_caractere(_paralelo),
+        "assincrono": _assincrono(),
+    },
+    "AFN": {
+        "lote": lambda afn: lambda cadeia: (afn.simular_lote([cadeia])[cadeia], None),
+        "tabela": lambda afn: _booleano(afn.compilar_tabela().aceita),
+        "nucleo": lambda afn: _booleano(NucleoAFN.de_afn(afn).aceita),
+        "bytes": _um_caractere(lambda afn: _booleano(AutomatoBytes(afn).aceita_texto)),
+        "incremental": _um_caractere(lambda afn: _booleano(SimulacaoIncremental(afn).avaliar)),
+        "subconjuntos": lambda afn: _veredito(afn.para_afd().simular),
+        "podado": lambda afn: _veredito(afn.podar().simular),
+        "gerador": _gerador,
+        "cache": _cache(),
+        "assincrono": _assincrono(),
+    },
+    "APD": {
+        "simular": lambda apd: lambda cadeia: (
+            apd.simular(cadeia, max_configuracoes=CONFIGURACOES_APD)[0], None),
+        "podado": lambda apd: lambda cadeia: (
+            apd.podar().simular(cadeia, max_configuracoes=CONFIGURACOES_APD)[0], None),
+        "cache": _cache(max_configuracoes=CONFIGURACOES_APD),
+        "assincrono": _assincrono(max_configuracoes=CONFIGURACOES_APD),
+    },
+    "MT": {
+        "rle": _rle_mt,
+        "podada": lambda mt: lambda cadeia: (mt.podar().simular(cadeia, PASSOS_MT)[0], None),
+        "nao_deterministica": _nao_deterministica,
+        "cache": _cache(max_passos=PASSOS_MT),
+        "assincrono": _assincrono(max_passos=PASSOS_MT),
+    },
+    "MTN": {
+        "podada": lambda mtn: _veredito(
+            lambda cadeia: mtn.podar().simular(cadeia, PASSOS_MTN, CONFIGURACOES_MT)),
+        "cache": _cache(max_passos=PASSOS_MTN, max_configuracoes=CONFIGURACOES_MT),
+        "assincrono": _assincrono(max_passos=PASSOS_MTN, max_configuracoes=CONFIGURACOES_MT),
+    },
+    "REGEX": {
+        "afn": lambda expressao: _veredito(expressao.afn().simular),
+        "afd": lambda expressao: _veredito(
+            regex_para_afd(expressao.padrao, expressao.alfabeto).simular),
+        "lote": lambda expressao: lambda cadeia: (
+            expressao.afn().simular_lote([cadeia])[cadeia], None),
+        "podado": lambda expressao: _veredito(expressao.afn().podar().simular),
+    },
+    "GLC": {
+        "earley": lambda gramatica: lambda cadeia: (
+            ReconhecedorEarley(gramatica).reconhecer(cadeia), None),
+        # Um único reconhecedor para todas as cadeias: reaproveita prefixos
+        "earley_prefixo": lambda gramatica: _booleano(ReconhecedorEarley(gramatica).reconhecer),
+        "apd": lambda gramatica: lambda cadeia: (
+            gramatica.para_apd().simular(cadeia, max_configuracoes=CONFIGURACOES_APD)[0], None),
+    },
+}
+
+
+class Divergencia:
+    """
+    Resultado diferente entre a referência e um motor
+
+    Atributos:
+        motor (str): Nome do motor divergente
+        automato: Autômato em que a divergência ocorre
+        cadeia (str): Entrada
+        esperado (Resultado): Resultado da referência
+        obtido (Resultado): Resultado do motor (ou ("erro", exceção))
+    """
+
+    def __init__(self, motor: str, automato, cadeia: str, esperado: Resultado, obtido):
+        self.motor = motor
+        self.automato = automato
+        self.cadeia = cadeia
+        self.esperado = esperado
+        self.obtido = obtido
+
+    def __str__(self) -> str:
+        automato = self.automato
+        transicoes = automato.delta if isinstance(automato, MaquinaTuringBase) else \
+            getattr(automato, "transicoes", {})
+        linhas = [f"Divergência no motor '{self.motor}' para a cadeia {self.cadeia!r}",
+                  f"  Referência: {self.esperado}",
+                  f"  Motor:      {self.obtido}",
+                  str(automato)]
+        linhas += [f"  {chave} -> {valor}" for chave, valor in sorted(transicoes.items(), key=repr)]
+        return "\n".join(linhas)
+
+
+class TesteDiferencial:
+    """
+    Compara os motores otimizados de um tipo de autômato com a referência
+
+    Atributos:
+        tipo (str): "AFD", "AFN", "APD", "MT", "MTN", "REGEX" ou "GLC"
+        semente (int): Semente da geração de autômatos e entradas
+        motores (Dict[str, Motor]): Motores comparados (padrão: MOTORES[tipo])
+    """
+
+    def __init__(self, tipo: str, semente: int = 0,
+                 motores: Optional[Dict[str, Motor]] = None,
+                 referencia: Optional[Motor] = None):
+        """
+        Args:
+            tipo: Tipo de autômato testado
+            semente: Semente para reprodutibilidade
+            motores: Motores a comparar (padrão: todos os registrados para o tipo)
+            referencia: Motor de referência (padrão: REFERENCIAS[tipo])
+
+        Raises:
+            ValueError: Se o tipo não for suportado
+        """
+        if tipo not in REFERENCIAS:
+            raise ValueError(f"Tipo de autômato não suportado: {tipo}")
+        self.tipo = tipo
+        self.semente = semente
+        self.motores = dict(MOTORES[tipo] if motores is None else motores)
+        self._referencia = referencia or REFERENCIAS[tipo]
+
+    def executar(self, num_automatos: int = 100, cadeias_por_automato: int = 30,
+                 max_estados: int = 5, comprimento_max: int = 8,
+                 reduzir: bool = True) -> List[Divergencia]:
+        """
+        Gera autômatos e entradas e compara todos os motores com a referência
+
+        Args:
+            num_automatos: Número de autômatos gerados
+            cadeias_por_automato: Entradas testadas em cada autômato
+            max_estados: Maior número de estados dos autômatos gerados
+            comprimento_max: Maior comprimento das entradas
+            reduzir: Se True, cada divergência é reduzida a um contraexemplo mínimo
+
+        Returns:
+            List[Divergencia]: No máximo uma divergência por motor (a primeira encontrada)
+        """
+        aleatorio = random.Random(f"{self.semente}:{self.tipo}")
+        gerar = _GERADORES[self.tipo]
+        divergencias: Dict[str, Divergencia] = {}
+
+        for _ in range(num_automatos):
+            pendentes = {nome: motor for nome, motor in self.motores.items()
+                         if nome not in divergencias}
+            if not pendentes:
+                break
+            automato = gerar(aleatorio, max_estados)
+            cadeias = self._entradas(automato, aleatorio, cadeias_por_automato, comprimento_max)
+            for divergencia in self._comparar(automato, cadeias, pendentes):
+                if reduzir:
+                    divergencia = self.reduzir(divergencia)
+                divergencias[divergencia.motor] = divergencia
+        return list(divergencias.values())
+
+    def comparar(self, automato, cadeia: str) -> List[Divergencia]:
+        """Compara todos os motores com a referência para uma única entrada"""
+        return list(self._comparar(automato, [cadeia], self.motores))
+
+    def reduzir(self, divergencia: Divergencia) -> Divergencia:
+        """
+        Reduz uma divergência a um contraexemplo mínimo
+
+        Alterna entre encurtar a cadeia (remoção de trechos e de símbolos,
+        troca por símbolos menores) e simplificar o autômato (remoção de
+        transições, estados finais e estados), aceitando cada passo que
+        mantém a divergência no mesmo motor, até nenhum passo se aplicar.
+
+        Args:
+            divergencia: Divergência encontrada
+
+        Returns:
+            Divergencia: Divergência equivalente com cadeia e autômato mínimos
+        """
+        motor = {divergencia.motor: self.motores[divergencia.motor]}
+        atual = divergencia
+        reduziu = True
+        while reduziu:
+            reduziu = False
+            candidatos = [(atual.automato, cadeia) for cadeia in _reducoes_cadeia(atual)]
+            candidatos += [(automato, atual.cadeia) for automato in _reducoes_automato(atual.automato)]
+            for automato, cadeia in candidatos:
+                encontradas = list(self._comparar(automato, [cadeia], motor))
+                if encontradas:
+                    atual = encontradas[0]
+                    reduziu = True
+                    break
+        return atual
+
+    def _comparar(self, automato, cadeias: List[str],
+                  motores: Dict[str, Motor]) -> Iterator[Divergencia]:
+        referencia = self._referencia(automato)
+        esperados = [referencia(cadeia) for cadeia in cadeias]
+        for nome, motor in motores.items():
+            try:
+                avaliar = motor(automato)
+            except Exception as erro:  # a preparação do motor também é testada
+                yield Divergencia(nome, automato, cadeias[0], esperados[0], ("erro", repr(erro)))
+                continue
+            if avaliar is None:  # o motor não se aplica a este autômato
+                continue
+            for cadeia, esperado in zip(cadeias, esperados):
+                try:
+                    obtido = avaliar(cadeia)
+                except Exception as erro:
+                    obtido = ("erro", repr(erro))
+                if not _concordam(esperado, obtido):
+                    yield Divergencia(nome, automato, cadeia, esperado, obtido)
+                    break
+
+    def _entradas(self, automato, aleatorio: random.Random, quantidade: int,
+                  comprimento_max: int) -> List[str]:
+        """
+        Entradas aceitas, quase aceitas e aleatórias (AFD/AFN/REGEX),
+        derivadas e aleatórias (GLC) ou aleatórias
+        """
+        if self.tipo in ("AFD", "AFN", "REGEX"):
+            base = automato.afn() if self.tipo == "REGEX" else automato
+            gerador = GeradorEntradas(base, aleatorio.randrange(1 << 30))
+            terco = max(quantidade // 3, 1)
+            cadeias = list(gerador.aceitas(terco, comprimento_max))
+            cadeias += gerador.quase_aceitas(terco, comprimento_max)
+            cadeias += gerador.aleatorias(quantidade - len(cadeias), comprimento_max)
+            return cadeias
+        cadeias = []
+        if self.tipo == "GLC":
+            for _ in range(quantidade // 2):
+                cadeia = _derivar(automato, aleatorio, 3 * comprimento_max)
+                if cadeia is not None:
+                    cadeias.append(cadeia)
+        simbolos = sorted(_alfabeto(automato))
+        cadeias += ["".join(aleatorio.choice(simbolos) for _ in range(aleatorio.randint(0, comprimento_max)))
+                    for _ in range(quantidade - len(cadeias))]
+        return cadeias
+
+
+def _alfabeto(automato) -> Iterable[str]:
+    """Símbolos de entrada de qualquer dos tipos testados"""
+    if isinstance(automato, MaquinaTuringBase):
+        return automato.Sigma
+    if isinstance(automato, Gramatica):
+        return automato.terminais
+    return automato.alfabeto
+
+
+def _derivar(gramatica: Gramatica, aleatorio: random.Random, limite: int) -> Optional[str]:
+    """Cadeia de uma derivação mais à esquerda aleatória, ou None após `limite` expansões"""
+    forma = [gramatica.inicial]
+    cadeia = []
+    for _ in range(limite):
+        while forma and forma[0] in gramatica.terminais:
+            cadeia.append(forma.pop(0))
+        if not forma:
+            return "".join(cadeia)
+        corpos = gramatica.producoes.get(forma[0])
+        if not corpos:
+            return None
+        forma[0:1] = aleatorio.choice(corpos)
+    return None
+
+
+def _concordam(esperado: Resultado, obtido) -> bool:
+    """Vereditos iguais e configurações iguais quando as duas são conhecidas"""
+    if obtido[0] != esperado[0]:
+        return False
+    return esperado[1] is None or obtido[1] is None or esperado[1] == obtido[1]
+
+
+def _reducoes_cadeia(divergencia: Divergencia) -> Iterator[str]:
+    """Cadeias menores ou mais simples que a da divergência"""
+    cadeia = divergencia.cadeia
+    tamanho = len(cadeia) // 2
+    while tamanho >= 1:
+        for inicio in range(0, len(cadeia) - tamanho + 1):
+            yield cadeia[:inicio] + cadeia[inicio + tamanho:]
+        tamanho //= 2
+    # Só símbolos de um caractere: a troca não pode aumentar a cadeia
+    menor = min((s for s in _alfabeto(divergencia.automato) if len(s) == 1), default=None)
+    for i, simbolo in enumerate(cadeia):
+        if menor is not None and simbolo > menor:
+            yield cadeia[:i] + menor + cadeia[i + 1:]
+
+
+def _reducoes_automato(automato) -> Iterator[object]:
+    """Autômatos com uma transição, um estado final ou um estado a menos"""
+    for candidato in _candidatos(automato):
+        try:
+            yield candidato()
+        except ValueError:
+            continue
+
+
+def _candidatos(automato) -> Iterator[Callable[[], object]]:
+    if isinstance(automato, _Expressao):
+        padrao = automato.padrao
+        for i in range(len(padrao)):
+            yield lambda i=i: _Expressao(padrao[:i] + padrao[i + 1:], automato.alfabeto)
+        return
+
+    if isinstance(automato, Gramatica):
+        producoes = automato.producoes
+
+        def glc(producoes=producoes, variaveis=automato.variaveis):
+            return Gramatica(set(variaveis), set(automato.terminais), producoes, automato.inicial)
+        for cabeca, corpos in producoes.items():
+            for i in range(len(corpos)):
+                yield lambda cabeca=cabeca, i=i: glc(
+                    producoes={**producoes, cabeca: corpos[:i] + corpos[i + 1:]})
+        usadas = {automato.inicial} | {s for corpos in producoes.values() for corpo in corpos for s in corpo}
+        for variavel in sorted(automato.variaveis - usadas):
+            yield lambda variavel=variavel: glc(
+                producoes={k: v for k, v in producoes.items() if k != variavel},
+                variaveis=automato.variaveis - {variavel})
+        return
+
+    if isinstance(automato, MaquinaTuringBase):
+        q0, finais, delta = automato.q0, automato.F, automato.delta
+        nao_deterministica = isinstance(automato, MaquinaTuringNaoDeterministica)
+
+        def mt(delta=delta, finais=finais, estados=automato.Q):
+            return type(automato)(set(estados), set(automato.Sigma), set(automato.Gamma),
+                                  delta, q0, automato.blank, set(finais))
+        for chave in delta:
+            yield lambda chave=chave: mt(delta={k: v for k, v in delta.items() if k != chave})
+        if nao_deterministica:
+            for chave, movimentos in delta.items():
+                for i in range(len(movimentos) if len(movimentos) > 1 else 0):
+                    yield lambda chave=chave, i=i: mt(
+                        delta={**delta, chave: delta[chave][:i] + delta[chave][i + 1:]})
+        for final in sorted(finais):
+            yield lambda final=final: mt(finais=finais - {final})
+        usados = {q0} | {k[0] for k in delta} | finais
+        for valor in delta.values():
+            usados |= {m[0] for m in valor} if nao_deterministica else {valor[0]}
+        for estado in sorted(automato.Q - usados):
+            yield lambda estado=estado: mt(estados=automato.Q - {estado})
+        return
+
+    inicial, finais, transicoes = automato.estado_inicial, automato.estados_finais, automato.transicoes
+    if isinstance(automato, AFD):
+        def construir(transicoes=transicoes, finais=finais, estados=automato.estados):
+            return AFD(set(estados), set(automato.alfabeto), transicoes, inicial, set(finais))
+        destinos = lambda valor: {valor}
+    elif isinstance(automato, AFN):
+        def construir(transicoes=transicoes, finais=finais, estados=automato.estados):
+            return AFN(set(estados), set(automato.alfabeto), transicoes, inicial, set(finais))
+        destinos = lambda valor: set(valor)
+    else:
+        def construir(transicoes=transicoes, finais=finais, estados=automato.estados):
+            return APD(set(estados), set(automato.alfabeto), set(automato.alfabeto_pilha),
+                       transicoes, inicial, set(finais), automato.simbolo_pilha_inicial)
+        destinos = lambda valor: {destino for destino, _ in valor}
+
+    for chave in transicoes:
+        yield lambda chave=chave: construir(
+            transicoes={k: v for k, v in transicoes.items() if k != chave})
+    # Remove um único destino de uma transição não-determinística
+    if not isinstance(automato, AFD):
+        for chave, valor in transicoes.items():
+            if len(valor) > 1:
+                for item in sorted(valor, key=repr):
+                    if isinstance(automato, AFN):
+                        reduzido = set(valor) - {item}
+                    else:
+                        reduzido = [movimento for movimento in valor if movimento is not item]
+                    yield lambda chave=chave, reduzido=reduzido: construir(
+                        transicoes={**transicoes, chave: reduzido})
+    for final in sorted(finais):
+        yield lambda final=final: construir(finais=finais - {final})
+    usados = {inicial} | set(finais)
+    for chave, valor in transicoes.items():
+        usados.add(chave[0])
+        usados |= destinos(valor)
+    for estado in sorted(automato.estados - usados):
+        yield lambda estado=estado: construir(estados=automato.estados - {estado})
+
+
+def _gerar_estados(aleatorio: random.Random, max_estados: int) -> List[str]:
+    """Nomes de estado; o primeiro é o inicial e alguns vêm de NOMES_ESPECIAIS"""
+    quantidade = aleatorio.randint(1, max_estados)
+    especiais = aleatorio.sample(NOMES_ESPECIAIS, min(quantidade - 1, len(NOMES_ESPECIAIS))) \
+        if aleatorio.random() < 0.3 else []
+    return ["q0"] + especiais + [f"q{i}" for i in range(len(especiais) + 1, quantidade)]
+
+
+def _gerar_afd(aleatorio: random.Random, max_estados: int) -> AFD:
+    estados = _gerar_estados(aleatorio, max_estados)
+    alfabeto = aleatorio.choice(ALFABETOS)
+    transicoes = {(q, a): aleatorio.choice(estados) for q in estados for a in alfabeto
+                  if aleatorio.random() < 0.8}
+    finais = {q for q in estados if aleatorio.random() < 0.35}
+    return AFD(set(estados), set(alfabeto), transicoes, "q0", finais)
+
+
+def _gerar_afn(aleatorio: random.Random, max_estados: int) -> AFN:
+    estados = _gerar_estados(aleatorio, max_estados)
+    alfabeto = list(aleatorio.choice(ALFABETOS))
+    transicoes = {}
+    for q in estados:
+        for a in alfabeto + [None]:
+            if aleatorio.random() < (0.3 if a is None else 0.6):
+                transicoes[(q, a)] = set(aleatorio.sample(estados, aleatorio.randint(1, min(2, len(estados)))))
+    finais = {q for q in estados if aleatorio.random() < 0.3}
+    return AFN(set(estados), set(alfabeto), transicoes, "q0", finais)
+
+
+def _gerar_apd(aleatorio: random.Random, max_estados: int) -> APD:
+    """APD aleatório; metade das vezes determinístico, para exercitar o caminho rápido"""
+    estados = [f"q{i}" for i in range(aleatorio.randint(1, max_estados))]
+    alfabeto = ["a", "b"] if aleatorio.random() < 0.7 else ["a", "b", "ab"]
+    pilha = ["Z", "A"]
+    empilhamentos = [[], ["A"], ["Z"], ["Z", "A"], ["A", "A"]]
+    deterministico = aleatorio.random() < 0.5
+    transicoes = {}
+    for q in estados:
+        for topo in pilha:
+            if deterministico:
+                leituras = [None] if aleatorio.random() < 0.2 else alfabeto
+                for a in leituras:
+                    if aleatorio.random() < 0.7:
+                        transicoes[(q, a, topo)] = [(aleatorio.choice(estados),
+                                                     aleatorio.choice(empilhamentos))]
+            else:
+                for a in alfabeto + [None]:
+                    if aleatorio.random() < (0.2 if a is None else 0.5):
+                        transicoes[(q, a, topo)] = [(aleatorio.choice(estados),
+                                                     aleatorio.choice(empilhamentos))
+                                                    for _ in range(aleatorio.randint(1, 2))]
+    finais = {q for q in estados if aleatorio.random() < 0.3}
+    return APD(set(estados), set(alfabeto), set(pilha), transicoes, "q0", finais)
+
+
+def _gerar_mt(aleatorio: random.Random, max_estados: int) -> MaquinaTuring:
+    estados = [f"q{i}" for i in range(aleatorio.randint(1, max_estados))] + ["qf"]
+    fita = ["a", "b", "_"]
+    delta = {(q, s): (aleatorio.choice(estados), aleatorio.choice(fita), aleatorio.choice("LR"))
+             for q in estados[:-1] for s in fita if aleatorio.random() < 0.8}
+    return MaquinaTuring(set(estados), {"a", "b"}, set(fita), delta, "q0", "_", {"qf"})
+
+
+def _gerar_mtn(aleatorio: random.Random, max_estados: int) -> MaquinaTuringNaoDeterministica:
+    estados = [f"q{i}" for i in range(aleatorio.randint(1, max_estados))] + ["qf"]
+    fita = ["a", "b", "_"]
+    delta = {(q, s): [(aleatorio.choice(estados), aleatorio.choice(fita), aleatorio.choice("LR"))
+                      for _ in range(aleatorio.randint(1, 2))]
+             for q in estados[:-1] for s in fita if aleatorio.random() < 0.7}
+    return MaquinaTuringNaoDeterministica(set(estados), {"a", "b"}, set(fita), delta, "q0", "_", {"qf"})
+
+
+def _gerar_regex(aleatorio: random.Random, max_estados: int) -> _Expressao:
+    """Expressão sobre {a, b, c}; operandos de operadores unários vão entre parênteses"""
+    def gerar(profundidade: int) -> str:
+        if profundidade == 0 or aleatorio.random() < 0.3:
+            return aleatorio.choice(("a", "b", "c", ".", "[ab]", "[^a]", "[a-b]", "()"))
+        forma = aleatorio.choice(("concatenacao", "uniao", "*", "+", "?"))
+        if forma == "concatenacao":
+            return gerar(profundidade - 1) + gerar(profundidade - 1)
+        if forma == "uniao":
+            return f"({gerar(profundidade - 1)}|{gerar(profundidade - 1)})"
+        return f"({gerar(profundidade - 1)}){forma}"
+    return _Expressao(gerar(max(1, max_estados // 2 + 1)), ("a", "b", "c"))
+
+
+def _gerar_glc(aleatorio: random.Random, max_estados: int) -> Gramatica:
+    """Gramática sobre {a, b}; todo corpo não vazio começa por um terminal"""
+    variaveis = ["S", "A", "B"][:aleatorio.randint(1, min(3, max_estados))]
+    terminais = ["a", "b"]
+    producoes = {}
+    for variavel in variaveis:
+        producoes[variavel] = [
+            () if aleatorio.random() < 0.25 else
+            (aleatorio.choice(terminais),) + tuple(aleatorio.choice(variaveis + terminais)
+                                                  for _ in range(aleatorio.randint(0, 2)))
+            for _ in range(aleatorio.randint(1, 3))]
+    return Gramatica(set(variaveis), set(terminais), producoes, "S")
+
+
+_GERADORES: Dict[str, Callable[[random.Random, int], object]] = {
+    "AFD": _gerar_afd,
+    "AFN": _gerar_afn,
+    "APD": _gerar_apd,
+    "MT": _gerar_mt,
+    "MTN": _gerar_mtn,
+    "REGEX": _gerar_regex,
+    "GLC": _gerar_glc,
+}
@@ -0,0 +1,103 @@
+"""
+Módulo de tokenização da entrada
+
+Quando o alfabeto tem símbolos com mais de um caractere (por exemplo
+"ab", "if" ou "10"), a cadeia de entrada precisa ser dividida em símbolos
+antes da simulação. O Tokenizador faz essa divisão em uma única passada,
+escolhendo em cada posição o símbolo mais longo que casa (maximal munch),
+com os símbolos organizados em uma trie.
+"""
+
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+
+_FIM = None  # Chave que marca, na trie, o fim de um símbolo
+
+
+class Tokenizador:
+    """
+    Divisor de cadeias em símbolos pelo casamento mais longo
+
+    Atributos:
+        simbolos (Dict[str, int]): símbolo -> valor associado (por padrão, o índice)
+    """
+
+    def __init__(self, simbolos: Union[Iterable[str], Dict[str, int]]):
+        """
+        Args:
+            simbolos: Símbolos do alfabeto, ou dicionário símbolo -> valor
+                      (por exemplo, a classe de equivalência do símbolo)
+        """
+        if not isinstance(simbolos, dict):
+            simbolos = {simbolo: i for i, simbolo in enumerate(sorted(simbolos))}
+        self.simbolos = simbolos
+
+        self._raiz: dict = {}
+        for simbolo, valor in simbolos.items():
+            if not simbolo:
+                continue
+            no = self._raiz
+            for caractere in simbolo:
+                no = no.setdefault(caractere, {})
+            no[_FIM] = (simbolo, valor)
+
+    def _casar(self, cadeia: str, inicio: int) -> Optional[Tuple[str, int]]:
+        """Símbolo mais longo que começa em `inicio`, com seu valor"""
+        no = self._raiz
+        melhor = None
+        for posicao in range(inicio, len(cadeia)):
+            no = no.get(cadeia[posicao])
+            if no is None:
+                break
+            if _FIM in no:
+                melhor = no[_FIM]
+        return melhor
+
+    def tokenizar(self, cadeia: str) -> List[str]:
+        """
+        Divide a cadeia em símbolos do alfabeto
+
+        Um caractere que não inicia nenhum símbolo vira um símbolo isolado,
+        para que o simulador o rejeite com a mensagem de símbolo inválido.
+
+        Args:
+            cadeia: Cadeia de entrada
+
+        Returns:
+            List[str]: Símbolos, na ordem da cadeia
+        """
+        simbolos: List[str] = []
+        posicao = 0
+        while posicao < len(cadeia):
+            casado = self._casar(cadeia, posicao)
+            simbolo = casado[0] if casado is not None else cadeia[posicao]
+            simbolos.append(simbolo)
+            posicao += len(simbolo)
+        return simbolos
+
+    def valores(self, cadeia: str) -> List[Optional[int]]:
+        """
+        Divide a cadeia e retorna o valor associado a cada símbolo
+
+        Args:
+            cadeia: Cadeia de entrada
+
+        Returns:
+            List[Optional[int]]: Valores dos símbolos; None para um caractere
+            que não inicia nenhum símbolo
+        """
+        valores: List[Optional[int]] = []
+        posicao = 0
+        while posicao < len(cadeia):
+            casado = self._casar(cadeia, posicao)
+            if casado is None:
+                valores.append(None)
+                posicao += 1
+            else:
+                valores.append(casado[1])
+                posicao += len(casado[0])
+        return valores
+
+
+def precisa_tokenizar(alfabeto: Iterable[str]) -> bool:
+    """Indica se o alfabeto tem algum símbolo que não é um único caractere"""
+    return any(len(simbolo) != 1 for simbolo in alfabeto)